@@ -4,6 +4,7 @@ Django settings for newtonx_project project.
 
 from pathlib import Path
 import os
+from corsheaders.defaults import default_headers
 from dotenv import load_dotenv
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -37,6 +38,8 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # First, so latency and DB metrics cover the rest of the stack.
+    'professionals.metrics.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
@@ -71,13 +74,35 @@ WSGI_APPLICATION = 'newtonx_project.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.0/ref/settings/#databases
 
+# Connections are kept for DB_CONN_MAX_AGE seconds (0 closes them after every
+# request) and checked before reuse. Pragmas come from PROFESSIONALS
+# ['SQLITE_PROFILE'], see professionals/db_profile.py.
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'CONN_MAX_AGE': int(os.environ.get('DB_CONN_MAX_AGE', 600)),
+        'CONN_HEALTH_CHECKS': True,
     }
 }
 
+# Caches (the professionals list cache uses 'default'). Locmem is per process;
+# set LIST_CACHE_DIR to share pages between workers through the file backend.
+if os.environ.get('LIST_CACHE_DIR'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.environ['LIST_CACHE_DIR'],
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'professionals',
+        }
+    }
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.0/ref/settings/#auth-password-validators
@@ -123,19 +148,52 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # CORS settings
 CORS_ALLOW_ALL_ORIGINS = True  # For development only
 CORS_ALLOW_CREDENTIALS = True
+# Conditional GETs: the frontend reads the list's validators and sends them back.
+CORS_EXPOSE_HEADERS = ['ETag', 'Last-Modified']
+CORS_ALLOW_HEADERS = (*default_headers, 'if-none-match', 'if-modified-since')
 
 # Media files (uploads)
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
 # REST Framework settings
+# Renderers are chosen by Accept or ?format=; the first one is the default.
+# orjson and msgpack are optional (see professionals/renderers.py).
 REST_FRAMEWORK = {
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'professionals.renderers.ORJSONRenderer',
+        'professionals.renderers.MessagePackRenderer',
+        'professionals.renderers.ColumnarJSONRenderer',
     ],
+    'DEFAULT_CONTENT_NEGOTIATION_CLASS': 'professionals.renderers.AvailableRendererNegotiation',
     'DEFAULT_PARSER_CLASSES': [
         'rest_framework.parsers.JSONParser',
         'rest_framework.parsers.MultiPartParser',
         'rest_framework.parsers.FormParser',
     ],
 }
+
+# Professionals app settings (defaults live in professionals/conf.py)
+PROFESSIONALS = {
+    'PARSE_JOB_WORKERS': int(os.environ.get('PARSE_JOB_WORKERS', 4)),
+    'PARSE_JOB_MAX_QUEUE': int(os.environ.get('PARSE_JOB_MAX_QUEUE', 100)),
+    'PARSE_JOB_TIMEOUT': int(os.environ.get('PARSE_JOB_TIMEOUT', 15 * 60)),
+    'PARSE_LOCAL_MIN_CONFIDENCE': int(os.environ.get('PARSE_LOCAL_MIN_CONFIDENCE', 80)),
+    'PARSE_BATCH_CONCURRENCY': int(os.environ.get('PARSE_BATCH_CONCURRENCY', 8)),
+    'PARSE_BATCH_MAX_FILES': int(os.environ.get('PARSE_BATCH_MAX_FILES', 200)),
+    'INGEST_MAX_FAILURES': int(os.environ.get('INGEST_MAX_FAILURES', 1000)),
+    'INGEST_FAILED_RECORD_MAX_CHARS': int(os.environ.get('INGEST_FAILED_RECORD_MAX_CHARS', 2000)),
+    'PHONE_DEFAULT_COUNTRY_CODE': os.environ.get('PHONE_DEFAULT_COUNTRY_CODE', '1'),
+    'RESUME_CACHE_MAX_ENTRIES': int(os.environ.get('RESUME_CACHE_MAX_ENTRIES', 10000)),
+    'RESUME_CACHE_TTL': int(os.environ.get('RESUME_CACHE_TTL', 30 * 24 * 60 * 60)),
+    'RESUME_STORAGE_GC_GRACE': int(os.environ.get('RESUME_STORAGE_GC_GRACE', 60 * 60)),
+    'OPENAI_BASE_URL': os.environ.get('OPENAI_BASE_URL') or None,
+    'LLM_CONNECT_TIMEOUT': float(os.environ.get('LLM_CONNECT_TIMEOUT', 5)),
+    'LLM_READ_TIMEOUT': float(os.environ.get('LLM_READ_TIMEOUT', 60)),
+    'LLM_MAX_CONCURRENCY': int(os.environ.get('LLM_MAX_CONCURRENCY', 8)),
+    'LLM_ASYNC_MAX_CONCURRENCY': int(os.environ.get('LLM_ASYNC_MAX_CONCURRENCY', 256)),
+    'LLM_MAX_RETRIES': int(os.environ.get('LLM_MAX_RETRIES', 3)),
+    'SQLITE_PROFILE': os.environ.get('SQLITE_PROFILE', 'production'),
+    'LIST_CACHE_ENABLED': os.environ.get('LIST_CACHE_ENABLED', 'true').lower() != 'false',
+    'LIST_CACHE_TTL': int(os.environ.get('LIST_CACHE_TTL', 300)),
+}
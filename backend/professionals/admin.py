@@ -1,5 +1,6 @@
 from django.contrib import admin
-from .models import Professional
+from .models import Professional, ParseJob, DuplicateCandidate
+from .search import fts_enabled, search_filter
 
 
 @admin.register(Professional)
@@ -8,3 +9,28 @@ class ProfessionalAdmin(admin.ModelAdmin):
     list_filter = ['source', 'created_at']
     search_fields = ['full_name', 'email', 'phone', 'company_name', 'job_title']
     readonly_fields = ['created_at', 'updated_at']
+
+    def get_search_results(self, request, queryset, search_term):
+        # Words go through the full-text index; phone numbers (no letters)
+        # are not indexed and keep the default LIKE search.
+        if fts_enabled() and any(char.isalpha() for char in search_term):
+            return queryset.filter(search_filter(search_term)), False
+        return super().get_search_results(request, queryset, search_term)
+
+
+@admin.register(ParseJob)
+class ParseJobAdmin(admin.ModelAdmin):
+    list_display = ['id', 'file_name', 'status', 'created_at', 'finished_at']
+    list_filter = ['status']
+    exclude = ['pdf_data']
+    readonly_fields = ['status', 'file_name', 'result', 'error', 'created_at', 'started_at', 'finished_at']
+
+
+@admin.register(DuplicateCandidate)
+class DuplicateCandidateAdmin(admin.ModelAdmin):
+    list_display = ['professional_a', 'professional_b', 'score', 'reasons', 'status', 'updated_at']
+    list_filter = ['status']
+    list_editable = ['status']
+    list_select_related = ['professional_a', 'professional_b']
+    raw_id_fields = ['professional_a', 'professional_b']
+    readonly_fields = ['score', 'reasons', 'created_at', 'updated_at']
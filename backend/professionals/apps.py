@@ -1,6 +1,13 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
 
 
 class ProfessionalsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'professionals'
+
+    def ready(self):
+        from .db_profile import apply_profile
+        from .metrics import install_query_timer
+        connection_created.connect(apply_profile, dispatch_uid='professionals.db_profile')
+        connection_created.connect(install_query_timer, dispatch_uid='professionals.metrics')
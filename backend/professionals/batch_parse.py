@@ -0,0 +1,235 @@
+"""
+Batch resume parsing.
+
+Every file in a batch is validated before any parse starts, so a bad upload
+is rejected without spending LLM calls on the rest. Bytes are counted as
+uploads are read and zip members decompressed, and the batch is rejected as
+soon as they pass ``PARSE_BATCH_MAX_BYTES`` (or the file count passes
+``PARSE_BATCH_MAX_FILES``), so one request never holds more than that in
+memory. Valid files are then
+fanned out to a thread pool of up to ``PARSE_BATCH_CONCURRENCY`` workers.
+Parses are I/O bound, so the batch takes about as long as its slowest file
+instead of the sum of all of them; the shared LLM client still caps
+in-flight calls per process at ``LLM_MAX_CONCURRENCY``.
+"""
+
+import io
+import logging
+import posixpath
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from django.db import connections
+
+from .conf import get_setting
+from .resume_cache import parse_resume_cached
+
+logger = logging.getLogger(__name__)
+
+MAX_FILE_SIZE = 10 * 1024 * 1024
+# Zip members are decompressed this many bytes at a time.
+READ_CHUNK_SIZE = 64 * 1024
+
+
+class BatchError(ValueError):
+    """
+    Raised when a batch fails validation; ``errors`` lists the bad files.
+    """
+
+    def __init__(self, message, errors=None):
+        super().__init__(message)
+        self.errors = errors or []
+
+
+def collect_batch_files(uploads):
+    """
+    Expand uploaded PDFs and zip archives into validated ``(name, data)`` pairs.
+
+    Args:
+        uploads: Uploaded file objects; ``.zip`` files are expanded in place
+
+    Returns:
+        list: ``(file_name, pdf_bytes)`` tuples in upload order
+
+    Raises:
+        BatchError: If the batch is empty, too large, or any file is invalid
+    """
+    files = _BatchFiles()
+    errors = []
+
+    for upload in uploads:
+        if upload.name.lower().endswith('.zip'):
+            _expand_archive(upload, files, errors)
+        elif upload.size > MAX_FILE_SIZE:
+            files.add(upload.name, None)
+        else:
+            files.reserve(upload.size)
+            upload.seek(0)
+            files.add(upload.name, upload.read())
+
+    if not files and not errors:
+        raise BatchError("No resume files provided.")
+
+    for name, data in files:
+        error = _validate(name, data)
+        if error:
+            errors.append({"file_name": name, "error": error})
+
+    if errors:
+        raise BatchError("Some files in the batch are invalid.", errors)
+
+    return list(files)
+
+
+def parse_batch(files, concurrency=None, parse=None):
+    """
+    Parse a batch of PDFs concurrently, yielding each result as it finishes.
+
+    Args:
+        files: ``(file_name, pdf_bytes)`` pairs from ``collect_batch_files``
+        concurrency: Worker threads (defaults to ``PARSE_BATCH_CONCURRENCY``)
+        parse: Called with a file object, returns ``(result, cache)``
+            (defaults to parse_resume_cached)
+
+    Yields:
+        dict: Per-file outcome with ``index``, ``file_name`` and ``success``
+    """
+    if parse is None:
+        parse = parse_resume_cached
+    if concurrency is None:
+        concurrency = get_setting('PARSE_BATCH_CONCURRENCY')
+    concurrency = max(1, min(concurrency, len(files)))
+
+    if concurrency == 1:
+        for index, (name, data) in enumerate(files):
+            yield _parse_one(parse, index, name, data)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='parse-batch')
+    try:
+        futures = [
+            executor.submit(_parse_in_worker, parse, index, name, data)
+            for index, (name, data) in enumerate(files)
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        # A streaming client may disconnect mid-batch; don't start the rest.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def summarize(results, started):
+    """
+    Count outcomes for a finished batch started at ``time.perf_counter()`` ``started``.
+    """
+    succeeded = sum(1 for result in results if result['success'])
+    return {
+        "files": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+
+
+def _parse_one(parse, index, name, data):
+    try:
+        result, cache = parse(io.BytesIO(data))
+    except Exception as e:
+        logger.warning("Batch parse failed for %s: %s", name, e)
+        return {"index": index, "file_name": name, "success": False, "error": str(e)}
+    return {"index": index, "file_name": name, "success": True, "data": result, "cache": cache}
+
+
+def _parse_in_worker(parse, index, name, data):
+    try:
+        return _parse_one(parse, index, name, data)
+    finally:
+        # Pool threads open their own connections for the cache lookups.
+        connections.close_all()
+
+
+class _BatchFiles(list):
+    """
+    ``(name, data)`` pairs of a batch being collected, with running limits.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.max_files = get_setting('PARSE_BATCH_MAX_FILES')
+        self.max_bytes = get_setting('PARSE_BATCH_MAX_BYTES')
+        self.bytes = 0
+
+    def add(self, name, data):
+        if len(self) >= self.max_files:
+            raise BatchError(f"A batch may contain at most {self.max_files} files.")
+        self.append((name, data))
+
+    def reserve(self, size):
+        """
+        Count ``size`` more bytes held in memory, failing once the batch is too large.
+        """
+        self.bytes += size
+        if self.bytes > self.max_bytes:
+            raise BatchError(f"Batch is too large (more than {self.max_bytes} bytes).")
+
+
+def _validate(name, data):
+    if not name.lower().endswith('.pdf'):
+        return "Only PDF files are supported"
+    if data is None:
+        return "Resume file must be under 10MB"
+    if not data.startswith(b'%PDF'):
+        return "File is not a PDF"
+    return None
+
+
+def _expand_archive(upload, files, errors):
+    """
+    Add the PDFs in an uploaded zip to ``files``, skipping folders and macOS metadata.
+    """
+    try:
+        archive = zipfile.ZipFile(upload)
+    except zipfile.BadZipFile:
+        errors.append({"file_name": upload.name, "error": "Invalid zip archive"})
+        return
+
+    with archive:
+        members = archive.infolist()
+        if len(members) > files.max_files:
+            raise BatchError(f"Archive {upload.name} has too many files ({len(members)}).")
+
+        for member in members:
+            base = posixpath.basename(member.filename)
+            if member.is_dir() or member.filename.startswith('__MACOSX/') or base.startswith('.'):
+                continue
+            name = f"{upload.name}/{member.filename}"
+            # Skip members declared too large without decompressing them.
+            if member.file_size > MAX_FILE_SIZE:
+                files.add(name, None)
+                continue
+            try:
+                files.add(name, _read_member(archive, member, files))
+            except (zipfile.BadZipFile, RuntimeError) as e:
+                # Corrupt or password-protected members.
+                errors.append({"file_name": name, "error": str(e)})
+
+
+def _read_member(archive, member, files):
+    """
+    Decompress a zip member in chunks, counting them against the batch.
+
+    The declared ``file_size`` is not trusted: reading stops (returning
+    None, i.e. too large) as soon as the output passes ``MAX_FILE_SIZE``.
+    """
+    chunks = []
+    size = 0
+    with archive.open(member) as f:
+        while chunk := f.read(READ_CHUNK_SIZE):
+            size += len(chunk)
+            if size > MAX_FILE_SIZE:
+                files.reserve(-(size - len(chunk)))
+                return None
+            files.reserve(len(chunk))
+            chunks.append(chunk)
+    return b''.join(chunks)
@@ -0,0 +1,80 @@
+"""
+Conditional GET support for list endpoints.
+
+A list's validator is the newest ``updated_at`` plus the row count of the
+filtered queryset. Both come from indexes (``MAX`` is a single seek on an
+``updated_at`` index, ``COUNT`` reads the smallest index), so a poll
+that finds nothing changed costs two small queries and no serialization.
+The count catches deletes, which leave ``MAX(updated_at)`` unchanged.
+
+Writes that bypass ``updated_at`` (``QuerySet.update()`` without setting it,
+raw SQL) are not seen. Clients that only send ``If-Modified-Since`` also miss
+deletes; ``If-None-Match`` takes precedence when both are sent.
+"""
+
+import hashlib
+
+from django.db.models import Max
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+
+
+def list_validators(queryset, request):
+    """
+    Compute the ETag and Last-Modified timestamp for a filtered list.
+
+    The query string and the negotiated renderer are part of the ETag, so
+    each filter, page, limit and format has its own validator.
+
+    Args:
+        queryset: The filtered queryset the response is built from
+        request: The current request
+
+    Returns:
+        tuple: (weak ETag string, last modified Unix timestamp or None)
+    """
+    queryset = queryset.order_by()
+    last_modified = queryset.aggregate(last=Max('updated_at'))['last']
+    return _validators(request, queryset.count(), last_modified)
+
+
+async def alist_validators(queryset, request):
+    """
+    Async ``list_validators``, for async views.
+    """
+    queryset = queryset.order_by()
+    last_modified = (await queryset.aaggregate(last=Max('updated_at')))['last']
+    return _validators(request, await queryset.acount(), last_modified)
+
+
+def _validators(request, count, last_modified):
+    query = request.GET.urlencode()
+    renderer = getattr(request, 'accepted_renderer', None)
+    digest = hashlib.blake2b(
+        f'{query}|{renderer.format if renderer else ""}|{count}|{last_modified.isoformat() if last_modified else ""}'.encode(), digest_size=12
+    ).hexdigest()
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    return f'W/"{digest}"', timestamp
+
+
+def not_modified(request, etag, last_modified):
+    """
+    Return a 304 response if the request's validators still match, else None.
+    """
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        return None
+    return set_validators(response, etag, last_modified)
+
+
+def set_validators(response, etag, last_modified):
+    """
+    Add ``ETag``, ``Last-Modified``, a revalidate-always ``Cache-Control`` and
+    ``Vary: Accept``, since each renderer is a different representation.
+    """
+    response['ETag'] = etag
+    if last_modified is not None:
+        response['Last-Modified'] = http_date(last_modified)
+    response['Cache-Control'] = 'private, no-cache'
+    patch_vary_headers(response, ['Accept'])
+    return response
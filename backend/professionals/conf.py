@@ -0,0 +1,90 @@
+"""
+Settings for the professionals app.
+
+Values come from the ``PROFESSIONALS`` dict in Django settings and fall back
+to ``DEFAULTS`` for any key that is not set there.
+"""
+
+from django.conf import settings
+
+DEFAULTS = {
+    # Worker threads that run queued resume parses.
+    'PARSE_JOB_WORKERS': 4,
+    # Queued plus running jobs allowed before new async parses get a 429.
+    'PARSE_JOB_MAX_QUEUE': 100,
+    # Run queued jobs inline in the request thread (tests, debugging).
+    'PARSE_JOB_EAGER': False,
+    # Seconds a job may stay running before it is treated as abandoned by a
+    # crashed worker and failed. Keep it above the LLM read timeout times retries.
+    'PARSE_JOB_TIMEOUT': 15 * 60,
+    # Tiered parsing: fields that must reach PARSE_LOCAL_MIN_CONFIDENCE from
+    # local extraction before the LLM is skipped, the extracted text length
+    # below which a PDF is treated as scanned and sent whole, how much text is
+    # sent when asking the LLM for the remaining fields, and the most pages
+    # read locally. Company and job title are found locally only on a
+    # "<title> at <company>" line, so requiring them sends most resumes to
+    # the LLM; they are filled when found and left empty otherwise.
+    'PARSE_REQUIRED_FIELDS': ['full_name', 'email', 'phone'],
+    'PARSE_LOCAL_MIN_CONFIDENCE': 80,
+    'PARSE_MIN_TEXT_CHARS': 40,
+    'PARSE_LLM_TEXT_MAX_CHARS': 12000,
+    'PARSE_MAX_PAGES': 10,
+    # Batch resume parsing: files parsed concurrently per batch, and the most
+    # files and total bytes one batch may contain.
+    'PARSE_BATCH_CONCURRENCY': 8,
+    'PARSE_BATCH_MAX_FILES': 200,
+    'PARSE_BATCH_MAX_BYTES': 200 * 1024 * 1024,
+    # NDJSON bulk ingest: failed records listed in the response (the summary
+    # still counts all of them), and the longest record echoed back with each.
+    'INGEST_MAX_FAILURES': 1000,
+    'INGEST_FAILED_RECORD_MAX_CHARS': 2000,
+    # Country code assumed for phone numbers entered without one when
+    # building the ``phone_e164`` dedup key.
+    'PHONE_DEFAULT_COUNTRY_CODE': '1',
+    # Duplicate detection: lowest pair score stored as a candidate, and the
+    # largest block compared (bigger blocks are too unspecific to be useful).
+    'DEDUP_MIN_SCORE': 70,
+    'DEDUP_MAX_BLOCK_SIZE': 50,
+    # Seconds after which an unfinished run is treated as crashed, so it no
+    # longer blocks new runs.
+    'DEDUP_RUN_TIMEOUT': 60 * 60,
+    # List response cache: on/off, the Django cache alias it uses and how
+    # long a page is kept (writes invalidate it sooner).
+    'LIST_CACHE_ENABLED': True,
+    'LIST_CACHE_ALIAS': 'default',
+    'LIST_CACHE_TTL': 300,
+    # SQLite pragmas run on every new connection: a profile from
+    # db_profile.PROFILES and per-pragma overrides, e.g. {'mmap_size': 0}.
+    'SQLITE_PROFILE': 'production',
+    'SQLITE_PRAGMAS': {},
+    # Request latency histogram buckets, in seconds (see metrics.py).
+    'METRICS_LATENCY_BUCKETS': [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0],
+    # Resume parse cache: entries kept in the per-process LRU tier, entries
+    # kept in the database tier, and how long either tier serves a result.
+    'RESUME_CACHE_MEMORY_ENTRIES': 256,
+    'RESUME_CACHE_MAX_ENTRIES': 10000,
+    'RESUME_CACHE_TTL': 30 * 24 * 60 * 60,
+    # Seconds an unreferenced resume file is kept before collect_resume_files
+    # deletes it, so uploads whose row is still being saved are not removed.
+    'RESUME_STORAGE_GC_GRACE': 60 * 60,
+    # OpenAI client: alternative API base URL (e.g. a local stand-in), timeouts
+    # in seconds, connection pool size, in-flight call cap per process and
+    # retry policy for transient errors.
+    'OPENAI_BASE_URL': None,
+    'LLM_CONNECT_TIMEOUT': 5.0,
+    'LLM_READ_TIMEOUT': 60.0,
+    'LLM_MAX_CONNECTIONS': 16,
+    'LLM_MAX_CONCURRENCY': 8,
+    # In-flight calls (and pooled connections) per event loop for async views.
+    'LLM_ASYNC_MAX_CONCURRENCY': 256,
+    'LLM_MAX_RETRIES': 3,
+    'LLM_BACKOFF_BASE': 0.5,
+    'LLM_BACKOFF_MAX': 8.0,
+}
+
+
+def get_setting(name):
+    """
+    Return the configured value for ``name``, or its default.
+    """
+    return getattr(settings, 'PROFESSIONALS', {}).get(name, DEFAULTS[name])
@@ -0,0 +1,72 @@
+"""
+SQLite storage profiles.
+
+A profile is a set of ``PRAGMA`` statements run on every new SQLite
+connection (from the ``connection_created`` signal, see ``apps.py``).
+``SQLITE_PROFILE`` picks one:
+
+- ``production``: write-ahead logging, so readers keep reading from a
+  snapshot while a bulk import writes instead of waiting for it;
+  ``busy_timeout`` so a second writer waits for the lock instead of failing
+  with ``database is locked``; ``synchronous=NORMAL``, which in WAL mode
+  still never corrupts the database but may lose the last transactions on
+  power loss; a memory-mapped read path, a 64 MiB page cache and temporary
+  tables in memory.
+- ``default``: SQLite's own behaviour (rollback journal). The journal mode
+  is stored in the database file, so this profile switches it back.
+
+``SQLITE_PRAGMAS`` overrides single pragmas of the chosen profile. Compare
+the two with ``python manage.py bench_sqlite_profile``.
+"""
+
+from .conf import get_setting
+
+PROFILES = {
+    'default': {
+        'journal_mode': 'DELETE',
+    },
+    'production': {
+        'journal_mode': 'WAL',
+        'busy_timeout': 5000,
+        'synchronous': 'NORMAL',
+        'mmap_size': 256 * 1024 * 1024,
+        'cache_size': -64 * 1024,
+        'temp_store': 'MEMORY',
+    },
+}
+
+
+def profile_pragmas(profile=None):
+    """
+    Return the pragmas for ``profile`` (the configured one by default), with overrides applied.
+
+    Raises:
+        ValueError: If the profile is unknown
+    """
+    profile = profile or get_setting('SQLITE_PROFILE')
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown SQLITE_PROFILE {profile!r}. Must be one of: {', '.join(PROFILES)}")
+    return {**PROFILES[profile], **get_setting('SQLITE_PRAGMAS')}
+
+
+def apply_profile(sender, connection, **kwargs):
+    """
+    ``connection_created`` receiver that runs the profile's pragmas on SQLite connections.
+    """
+    if connection.vendor != 'sqlite':
+        return
+    # On the raw connection, so the pragmas stay out of query logs and metrics.
+    for name, value in profile_pragmas().items():
+        connection.connection.execute(f'PRAGMA {name} = {value}')
+
+
+def current_pragmas(connection, names=None):
+    """
+    Read back pragma values from ``connection``, e.g. to check a profile took effect.
+    """
+    with connection.cursor() as cursor:
+        values = {}
+        for name in names or PROFILES['production']:
+            cursor.execute(f'PRAGMA {name}')
+            values[name] = cursor.fetchone()[0]
+        return values
@@ -0,0 +1,337 @@
+"""
+Near-duplicate detection across sources.
+
+The same expert often arrives through several sources with slightly
+different details ("Jane Smith, Acme Inc." and "Smith, Jane Q., ACME").
+Comparing every pair of rows is quadratic, so rows are grouped into blocks
+by cheap keys and only rows sharing a block are compared:
+
+- ``name``: the alphabetically first and last name tokens
+- ``company``: normalized company name plus name initials
+- ``email``: email local part without dots and ``+tags``
+- ``domain``: email domain plus name initials
+- ``phone``: last 7 digits of the E.164 phone
+
+Blocks larger than ``DEDUP_MAX_BLOCK_SIZE`` (a common name at a large
+company, ``info@``) are skipped as too unspecific to be useful. Pairs are
+scored 0-100 from name similarity (Jaro-Winkler) plus company and contact matches,
+and those reaching ``DEDUP_MIN_SCORE`` are stored as ``DuplicateCandidate``
+rows for review.
+
+Runs are incremental: only pairs with at least one row changed since the
+last run are compared. The table is still read once per run to find the
+unchanged rows sharing a block with a changed one, but that is a linear
+scan, not a comparison.
+
+One run at a time: a run is recorded as unfinished ``DedupRun`` row when it
+starts, and ``find_duplicates`` raises ``DedupInProgress`` while another
+one exists. Unfinished rows older than ``DEDUP_RUN_TIMEOUT`` seconds belong
+to a crashed run and are discarded.
+"""
+
+import re
+import time
+import unicodedata
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .conf import get_setting
+from .models import DedupRun, DuplicateCandidate, Professional
+from .normalize import normalize_email, normalize_phone
+
+BLOCK_KINDS = ['name', 'company', 'email', 'domain', 'phone']
+SCAN_CHUNK_SIZE = 5000
+LOOKUP_BATCH_SIZE = 900
+WRITE_BATCH_SIZE = 500
+
+TOKEN_RE = re.compile(r'[a-z0-9]+')
+NAME_NOISE = {'mr', 'mrs', 'ms', 'dr', 'prof', 'jr', 'sr', 'ii', 'iii', 'phd', 'md', 'mba'}
+COMPANY_NOISE = {'inc', 'llc', 'ltd', 'limited', 'corp', 'corporation', 'co', 'company', 'gmbh', 'plc', 'the'}
+
+# Score weights: name similarity, same company, shared email local part or
+# phone suffix. An identical name alone (60) stays under the default
+# DEDUP_MIN_SCORE; it needs a company or contact match as well.
+NAME_WEIGHT = 60
+NAME_FLOOR = 0.8
+COMPANY_WEIGHT = 20
+CONTACT_WEIGHT = 25
+
+
+class _Row:
+    __slots__ = ('id', 'name', 'company', 'local', 'suffix', 'keys')
+
+    def __init__(self, pk, full_name, company_name, email, phone):
+        self.id = pk
+        self.name = normalize_name(full_name)
+        self.company = normalize_company(company_name)
+        local, domain = _split_email(normalize_email(email))
+        self.local = local
+        digits = (normalize_phone(phone) or '+')[1:]
+        self.suffix = digits[-7:] if len(digits) >= 7 else None
+
+        tokens = self.name.split()
+        initials = tokens[0][0] + tokens[-1][0] if tokens else None
+        self.keys = (
+            hash(f'{tokens[0]}|{tokens[-1]}') if len(tokens) >= 2 else None,
+            hash(f'{self.company}|{initials}') if self.company and initials else None,
+            hash(local) if local and len(local) >= 4 else None,
+            hash(f'{domain}|{initials}') if domain and initials else None,
+            hash(self.suffix) if self.suffix else None,
+        )
+
+
+def normalize_name(value):
+    """
+    Return the name lower-cased, without accents, titles, initials or
+    punctuation, with tokens sorted so word order does not matter.
+    """
+    tokens = [token for token in TOKEN_RE.findall(_fold(value)) if len(token) > 1 and token not in NAME_NOISE]
+    return ' '.join(sorted(tokens))
+
+
+def normalize_company(value):
+    """
+    Return the company name lower-cased, without punctuation or legal suffixes.
+    """
+    return ' '.join(token for token in TOKEN_RE.findall(_fold(value)) if token not in COMPANY_NOISE)
+
+
+def similarity(a, b):
+    """
+    Jaro-Winkler similarity of two strings (0.0-1.0).
+
+    Suited to short strings such as names: a typo or swapped pair of
+    letters costs little, and a shared prefix counts extra.
+    """
+    if a == b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+
+    window = max(0, max(len(a), len(b)) // 2 - 1)
+    taken = [False] * len(b)
+    matches_a = []
+    for i, char in enumerate(a):
+        for j in range(max(0, i - window), min(i + window + 1, len(b))):
+            if not taken[j] and b[j] == char:
+                taken[j] = True
+                matches_a.append(char)
+                break
+    if not matches_a:
+        return 0.0
+
+    matches_b = [char for char, used in zip(b, taken) if used]
+    m = len(matches_a)
+    transpositions = sum(x != y for x, y in zip(matches_a, matches_b)) // 2
+    jaro = (m / len(a) + m / len(b) + (m - transpositions) / m) / 3
+
+    prefix = 0
+    for x, y in zip(a[:4], b[:4]):
+        if x != y:
+            break
+        prefix += 1
+    return jaro + prefix * 0.1 * (1 - jaro)
+
+
+def score_pair(a, b):
+    """
+    Score how likely two scanned rows are the same person.
+
+    Returns:
+        tuple: (score 0-100, list of the block kinds the rows share)
+    """
+    # Unrelated names still score around 0.6-0.8, so only the part above
+    # NAME_FLOOR counts.
+    score = NAME_WEIGHT * max(0.0, similarity(a.name, b.name) - NAME_FLOOR) / (1 - NAME_FLOOR)
+    if a.company and a.company == b.company:
+        score += COMPANY_WEIGHT
+    if (a.local and a.local == b.local) or (a.suffix and a.suffix == b.suffix):
+        score += CONTACT_WEIGHT
+    shared = [kind for kind, key_a, key_b in zip(BLOCK_KINDS, a.keys, b.keys) if key_a is not None and key_a == key_b]
+    return min(100, round(score)), shared
+
+
+class DedupInProgress(Exception):
+    """
+    Raised when another duplicate detection run has not finished.
+    """
+
+
+def find_duplicates(full=False, min_score=None, max_block_size=None):
+    """
+    Compare rows changed since the last run against their blocks and store candidates.
+
+    Args:
+        full: Compare every row, not just those changed since the last run
+        min_score: Lowest score stored (defaults to ``DEDUP_MIN_SCORE``)
+        max_block_size: Largest block compared (defaults to ``DEDUP_MAX_BLOCK_SIZE``)
+
+    Returns:
+        DedupRun: The recorded run, with counts of rows changed, pairs
+        compared, blocks skipped and candidates found
+
+    Raises:
+        DedupInProgress: If another run is in progress
+    """
+    if min_score is None:
+        min_score = get_setting('DEDUP_MIN_SCORE')
+    if max_block_size is None:
+        max_block_size = get_setting('DEDUP_MAX_BLOCK_SIZE')
+
+    run = _start_run()
+    try:
+        return _run(run, full, min_score, max_block_size)
+    except BaseException:
+        run.delete()
+        raise
+
+
+def _start_run():
+    """
+    Record a new unfinished run, unless another one is in progress.
+    """
+    with transaction.atomic():
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute(f'LOCK TABLE {DedupRun._meta.db_table} IN SHARE ROW EXCLUSIVE MODE')
+        # On SQLite this first write takes the database write lock, so the
+        # check and insert below are serialized either way.
+        DedupRun.objects.filter(
+            finished_at__isnull=True,
+            started_at__lt=timezone.now() - timedelta(seconds=get_setting('DEDUP_RUN_TIMEOUT')),
+        ).delete()
+        if DedupRun.objects.filter(finished_at__isnull=True).exists():
+            raise DedupInProgress("Duplicate detection is already running.")
+        return DedupRun.objects.create(started_at=timezone.now())
+
+
+def _run(run, full, min_score, max_block_size):
+    clock = time.perf_counter()
+    last_run = DedupRun.objects.filter(finished_at__isnull=False).order_by('-started_at').first()
+    full = full or last_run is None
+
+    changed = None
+    wanted = None
+    if not full:
+        changed_rows = _scan(Professional.objects.filter(updated_at__gte=last_run.started_at))
+        changed = {row.id for row in changed_rows}
+        wanted = [{row.keys[k] for row in changed_rows} - {None} for k in range(len(BLOCK_KINDS))]
+
+    rows = _scan(Professional.objects.all(), wanted) if changed is None or changed else []
+    found, compared, skipped = _compare(rows, changed, wanted, min_score, max_block_size)
+
+    with transaction.atomic():
+        stale = DuplicateCandidate.objects.filter(status=DuplicateCandidate.PENDING)
+        if changed is None:
+            stale.delete()
+        else:
+            ids = list(changed)
+            for start in range(0, len(ids), LOOKUP_BATCH_SIZE):
+                chunk = ids[start:start + LOOKUP_BATCH_SIZE]
+                stale.filter(Q(professional_a__in=chunk) | Q(professional_b__in=chunk)).delete()
+
+        # Dismissed pairs keep their status; only the score is refreshed.
+        DuplicateCandidate.objects.bulk_create(
+            [
+                DuplicateCandidate(professional_a_id=a, professional_b_id=b, score=score, reasons=reasons)
+                for (a, b), (score, reasons) in found.items()
+            ],
+            batch_size=WRITE_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=['professional_a', 'professional_b'],
+            update_fields=['score', 'reasons', 'updated_at'],
+        )
+
+        run.full = full
+        run.rows_scanned = len(rows)
+        run.rows_changed = len(rows) if changed is None else len(changed)
+        run.pairs_compared = compared
+        run.blocks_skipped = skipped
+        run.candidates = len(found)
+        run.elapsed_ms = round((time.perf_counter() - clock) * 1000)
+        run.finished_at = timezone.now()
+        run.save()
+        return run
+
+
+def _scan(queryset, wanted=None):
+    """
+    Read rows as ``_Row`` objects, keeping only those with a key in ``wanted`` (per kind).
+    """
+    rows = []
+    # Raw email and phone: rows that predate the normalized keys and lost
+    # them to an older duplicate (migration 0007) have NULL keys.
+    values = queryset.order_by().values_list('id', 'full_name', 'company_name', 'email', 'phone')
+    for values_row in values.iterator(chunk_size=SCAN_CHUNK_SIZE):
+        row = _Row(*values_row)
+        if wanted is None or any(key in keys for key, keys in zip(row.keys, wanted)):
+            rows.append(row)
+    return rows
+
+
+def _compare(rows, changed, wanted, min_score, max_block_size):
+    """
+    Score pairs within each block, once per pair.
+
+    A pair sharing several blocks is only scored in the first kind it shares
+    (unless that block was skipped as oversized). In incremental runs only
+    blocks containing a changed row are built, and only pairs involving a
+    changed row are scored.
+
+    Returns:
+        tuple: (``{(id_a, id_b): (score, reasons)}``, pairs compared, blocks skipped)
+    """
+    found = {}
+    compared = 0
+    oversized = [set() for _ in BLOCK_KINDS]
+
+    for k in range(len(BLOCK_KINDS)):
+        blocks = defaultdict(list)
+        for row in rows:
+            key = row.keys[k]
+            if key is not None and (wanted is None or key in wanted[k]):
+                blocks[key].append(row)
+
+        for key, members in blocks.items():
+            if len(members) < 2:
+                continue
+            if len(members) > max_block_size:
+                oversized[k].add(key)
+                continue
+            for i, a in enumerate(members):
+                for b in members[i + 1:]:
+                    if changed is not None and a.id not in changed and b.id not in changed:
+                        continue
+                    if _scored_earlier(a, b, k, oversized):
+                        continue
+                    compared += 1
+                    score, reasons = score_pair(a, b)
+                    if score >= min_score:
+                        found[(a.id, b.id) if a.id < b.id else (b.id, a.id)] = (score, reasons)
+
+    return found, compared, sum(len(keys) for keys in oversized)
+
+
+def _scored_earlier(a, b, kind, oversized):
+    for k in range(kind):
+        key = a.keys[k]
+        if key is not None and key == b.keys[k] and key not in oversized[k]:
+            return True
+    return False
+
+
+def _split_email(email):
+    if not email or '@' not in email:
+        return None, None
+    local, domain = email.rsplit('@', 1)
+    return local.split('+', 1)[0].replace('.', ''), domain
+
+
+def _fold(value):
+    if not value:
+        return ''
+    return unicodedata.normalize('NFKD', value).encode('ascii', 'ignore').decode().lower()
@@ -6,41 +6,18 @@ import os
 import json
 import base64
 from typing import Dict, Optional
-from openai import OpenAI, OpenAIError
+from openai import OpenAIError
+from .llm_client import llm
 
+MODEL = "gpt-4o-mini"  # Using GPT-4o mini for cost efficiency and PDF support
 
-def parse_resume_with_gpt(pdf_file) -> Dict[str, any]:
-    """
-    Parse a resume PDF using GPT-4o with base64 encoding.
+# Bump whenever the prompt or response schema changes, so results cached for
+# an older prompt are no longer served (see resume_cache.py).
+# v2: tiered parsing (resume_parser.py) adds "tier" and "sources".
+PROMPT_VERSION = 2
 
-    Args:
-        pdf_file: A file object containing PDF data
-
-    Returns:
-        dict: Parsed professional information with confidence scores
-
-    Raises:
-        ValueError: If OpenAI API key is not configured
-        OpenAIError: If API request fails
-    """
-    # Check if API key is configured
-    api_key = os.environ.get('OPENAI_API_KEY')
-    if not api_key:
-        raise ValueError(
-            "OpenAI API key not configured. "
-            "Please set OPENAI_API_KEY environment variable to use GPT-based resume parsing."
-        )
-
-    try:
-        client = OpenAI(api_key=api_key)
-
-        # Read and encode the PDF file to base64
-        pdf_file.seek(0)  # Reset file pointer to beginning
-        pdf_data = pdf_file.read()
-        base64_string = base64.b64encode(pdf_data).decode("utf-8")
-
-        # Create a prompt for extracting professional information
-        prompt = """
+# Prompt for extracting professional information
+RESUME_PROMPT = """
         Please analyze this resume PDF and extract the following information in JSON format:
 
         {
@@ -66,33 +43,26 @@ def parse_resume_with_gpt(pdf_file) -> Dict[str, any]:
         Return ONLY the JSON object, no additional text.
         """
 
-        # Call GPT-4o with the base64-encoded PDF
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",  # Using GPT-4o mini for cost efficiency and PDF support
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a professional resume parser. Extract information accurately and provide confidence scores."
-                },
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": prompt
-                        },
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:application/pdf;base64,{base64_string}"
-                            }
-                        }
-                    ]
-                }
-            ],
-            response_format={"type": "json_object"},
-            temperature=0.1  # Low temperature for consistent extraction
-        )
+
+def parse_resume_with_gpt(pdf_file) -> Dict[str, any]:
+    """
+    Parse a resume PDF using GPT-4o with base64 encoding.
+
+    Args:
+        pdf_file: A file object containing PDF data
+
+    Returns:
+        dict: Parsed professional information with confidence scores
+
+    Raises:
+        ValueError: If OpenAI API key is not configured
+        OpenAIError: If API request fails
+    """
+    _require_api_key()
+
+    try:
+        # Call GPT-4o with the base64-encoded PDF through the shared, pooled client
+        response = llm.chat_completion(**_resume_request(pdf_file))
 
         # Parse the JSON response
         result = json.loads(response.choices[0].message.content)
@@ -107,6 +77,149 @@ def parse_resume_with_gpt(pdf_file) -> Dict[str, any]:
         raise Exception(f"Unexpected error during resume parsing: {str(e)}")
 
 
+async def aparse_resume_with_gpt(pdf_file) -> Dict[str, any]:
+    """
+    Async ``parse_resume_with_gpt``, on the async OpenAI client.
+    """
+    _require_api_key()
+
+    try:
+        response = await llm.achat_completion(**_resume_request(pdf_file))
+        return json.loads(response.choices[0].message.content)
+
+    except OpenAIError as e:
+        raise OpenAIError(f"OpenAI API error: {str(e)}")
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Failed to parse GPT response as JSON: {str(e)}")
+    except Exception as e:
+        raise Exception(f"Unexpected error during resume parsing: {str(e)}")
+
+
+def _resume_request(pdf_file):
+    """
+    Build the chat completion arguments for parsing a whole PDF.
+    """
+    # Read and encode the PDF file to base64
+    pdf_file.seek(0)  # Reset file pointer to beginning
+    base64_string = base64.b64encode(pdf_file.read()).decode("utf-8")
+
+    return dict(
+        model=MODEL,
+        messages=[
+            {
+                "role": "system",
+                "content": "You are a professional resume parser. Extract information accurately and provide confidence scores."
+            },
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": RESUME_PROMPT
+                    },
+                    {
+                        "type": "image_url",
+                        "image_url": {
+                            "url": f"data:application/pdf;base64,{base64_string}"
+                        }
+                    }
+                ]
+            }
+        ],
+        response_format={"type": "json_object"},
+        temperature=0.1  # Low temperature for consistent extraction
+    )
+
+
+# Prompt for filling specific fields from already-extracted resume text
+TEXT_FIELDS_PROMPT = """
+        Below is the text of a resume. Extract ONLY these fields: {fields}.
+        Return a JSON object with each of those fields plus a "confidence" object
+        scoring each of them 0-100. For company_name and job_title use the most
+        recent position. If a field is not present, set it to null and its
+        confidence to 0. Return ONLY the JSON object, no additional text.
+
+        Resume text:
+        {text}
+        """
+
+
+def parse_fields_from_text(text: str, fields) -> Dict[str, any]:
+    """
+    Ask GPT for specific fields using resume text instead of the PDF.
+
+    Used by the tiered parser for the fields local extraction could not fill,
+    so the request carries a few KB of text and a short field list rather
+    than the whole base64-encoded document.
+
+    Args:
+        text: Text extracted from the resume PDF
+        fields: Names of the fields to extract
+
+    Returns:
+        dict: The requested fields with confidence scores
+
+    Raises:
+        ValueError: If OpenAI API key is not configured
+        OpenAIError: If API request fails
+    """
+    _require_api_key()
+
+    try:
+        response = llm.chat_completion(**_fields_request(text, fields))
+        return json.loads(response.choices[0].message.content)
+
+    except OpenAIError as e:
+        raise OpenAIError(f"OpenAI API error: {str(e)}")
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Failed to parse GPT response as JSON: {str(e)}")
+
+
+async def aparse_fields_from_text(text: str, fields) -> Dict[str, any]:
+    """
+    Async ``parse_fields_from_text``, on the async OpenAI client.
+    """
+    _require_api_key()
+
+    try:
+        response = await llm.achat_completion(**_fields_request(text, fields))
+        return json.loads(response.choices[0].message.content)
+
+    except OpenAIError as e:
+        raise OpenAIError(f"OpenAI API error: {str(e)}")
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Failed to parse GPT response as JSON: {str(e)}")
+
+
+def _fields_request(text, fields):
+    """
+    Build the chat completion arguments for filling ``fields`` from resume text.
+    """
+    return dict(
+        model=MODEL,
+        messages=[
+            {
+                "role": "system",
+                "content": "You are a professional resume parser. Extract information accurately and provide confidence scores."
+            },
+            {
+                "role": "user",
+                "content": TEXT_FIELDS_PROMPT.format(fields=", ".join(fields), text=text)
+            }
+        ],
+        response_format={"type": "json_object"},
+        temperature=0.1
+    )
+
+
+def _require_api_key():
+    if not is_gpt_parsing_available():
+        raise ValueError(
+            "OpenAI API key not configured. "
+            "Please set OPENAI_API_KEY environment variable to use GPT-based resume parsing."
+        )
+
+
 def is_gpt_parsing_available() -> bool:
     """
     Check if GPT-based parsing is available (API key configured).
@@ -0,0 +1,179 @@
+"""
+Local worker pool for asynchronous resume parsing.
+
+Jobs live in the ``ParseJob`` table, so no external broker is needed. Each
+submission wakes a worker thread; workers claim the oldest queued job with a
+conditional UPDATE, run it and keep draining the queue until it is empty, so
+jobs left queued by a restart are picked up by the next submission. Jobs
+left running by a crashed worker are failed once they have run for longer
+than ``PARSE_JOB_TIMEOUT`` seconds, so they stop counting towards the queue
+limit.
+"""
+
+import io
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.db import connection, connections, transaction
+from django.utils import timezone
+
+from .conf import get_setting
+from .models import ParseJob
+from .resume_cache import parse_resume_cached
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = [ParseJob.QUEUED, ParseJob.RUNNING]
+
+
+class QueueFull(Exception):
+    """Raised when the parse queue is at its configured depth limit."""
+
+
+class ParseJobPool:
+    """
+    Lazily started thread pool sized by ``PARSE_JOB_WORKERS``.
+    """
+
+    def __init__(self):
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def submit(self):
+        """
+        Wake a worker to drain the queue (or drain inline in eager mode).
+        """
+        if get_setting('PARSE_JOB_EAGER'):
+            drain_queue()
+            return
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=get_setting('PARSE_JOB_WORKERS'),
+                    thread_name_prefix='parse-job',
+                )
+        self._executor.submit(_worker)
+
+
+pool = ParseJobPool()
+
+
+def enqueue_parse_job(resume_file):
+    """
+    Store an uploaded resume as a queued job and wake the pool once committed.
+
+    Args:
+        resume_file: Uploaded PDF file object
+
+    Returns:
+        ParseJob: The queued job
+
+    Raises:
+        QueueFull: If queued plus running jobs reached ``PARSE_JOB_MAX_QUEUE``
+    """
+    resume_file.seek(0)
+    pdf_data = resume_file.read()
+
+    with transaction.atomic():
+        # Lock the queue first, so concurrent uploads cannot both pass the
+        # depth check before either inserts.
+        _lock_queue()
+        depth = ParseJob.objects.filter(status__in=ACTIVE_STATUSES).count()
+        if depth >= get_setting('PARSE_JOB_MAX_QUEUE'):
+            raise QueueFull(f"Parse queue is full ({depth} jobs pending).")
+        job = ParseJob.objects.create(file_name=resume_file.name, pdf_data=pdf_data)
+    transaction.on_commit(pool.submit)
+    return job
+
+
+def fail_stale_jobs():
+    """
+    Fail running jobs started more than ``PARSE_JOB_TIMEOUT`` seconds ago.
+
+    Their worker died (crash or restart) without recording an outcome.
+
+    Returns:
+        int: Jobs failed
+    """
+    now = timezone.now()
+    return ParseJob.objects.filter(
+        status=ParseJob.RUNNING,
+        started_at__lt=now - timedelta(seconds=get_setting('PARSE_JOB_TIMEOUT')),
+    ).update(
+        status=ParseJob.FAILED, error="Parse did not finish: its worker stopped.", pdf_data=b'', finished_at=now,
+    )
+
+
+def drain_queue():
+    """
+    Run queued jobs one at a time until none are left.
+    """
+    fail_stale_jobs()
+    while True:
+        job = _claim_next_job()
+        if job is None:
+            return
+        run_parse_job(job)
+
+
+def run_parse_job(job):
+    """
+    Parse a claimed job's PDF and store the result or the error.
+    """
+    try:
+        result, _ = parse_resume_cached(io.BytesIO(bytes(job.pdf_data)))
+    except Exception as e:
+        logger.exception("Parse job %s failed: %s", job.pk, e)
+        job.status = ParseJob.FAILED
+        job.error = str(e)
+    else:
+        job.status = ParseJob.SUCCEEDED
+        job.result = result
+
+    job.pdf_data = b''
+    job.finished_at = timezone.now()
+    job.save(update_fields=['status', 'result', 'error', 'pdf_data', 'finished_at'])
+
+
+def _claim_next_job():
+    """
+    Atomically move the oldest queued job to running and return it.
+    """
+    while True:
+        job_id = (
+            ParseJob.objects.filter(status=ParseJob.QUEUED)
+            .order_by('created_at')
+            .values_list('id', flat=True)
+            .first()
+        )
+        if job_id is None:
+            return None
+
+        claimed = ParseJob.objects.filter(pk=job_id, status=ParseJob.QUEUED).update(
+            status=ParseJob.RUNNING, started_at=timezone.now()
+        )
+        if claimed:
+            return ParseJob.objects.get(pk=job_id)
+
+
+def _lock_queue():
+    """
+    Take a write lock that serializes enqueues until the transaction ends.
+    """
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute(f'LOCK TABLE {ParseJob._meta.db_table} IN SHARE ROW EXCLUSIVE MODE')
+    # On SQLite the first write of a transaction takes the database write
+    # lock, even when it changes no rows.
+    fail_stale_jobs()
+
+
+def _worker():
+    try:
+        drain_queue()
+    finally:
+        # Worker threads outlive requests, so close their connections here.
+        connections.close_all()
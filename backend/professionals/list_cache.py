@@ -0,0 +1,194 @@
+"""
+Response cache for ``GET /api/professionals/``.
+
+Serialized list pages are stored in the Django cache named by
+``LIST_CACHE_ALIAS`` (locmem by default, or the file backend so several
+worker processes share it; see ``CACHES`` in settings), together with
+their ETag and Last-Modified. A hit costs two cache reads and no queries;
+only rendering is left.
+
+Keys carry a version counter per scope: one for the unfiltered list and one
+per source. Every write to a professional bumps the unfiltered scope and
+the row's old and new source (``Professional.save``/``delete`` and the
+model's bulk queryset methods, which cover the single and bulk upserts and
+the admin), so a write to ``partner`` rows leaves cached ``direct`` pages
+valid. Old entries are never deleted; nothing reads their version again and
+they expire after ``LIST_CACHE_TTL`` seconds.
+
+``aentry_key``, ``aget`` and ``astore`` are the same for async views; they
+go through the cache's async API, so file cache I/O stays off the event loop.
+
+Writes that bypass the model (``QuerySet.update()``, raw SQL) are not seen.
+Locmem is per process, so with several workers use the file backend or
+each process may serve its own stale copy until the TTL.
+"""
+
+import hashlib
+import threading
+import time
+
+from asgiref.sync import sync_to_async
+from django.core.cache import caches
+from django.db import transaction
+
+from .conf import get_setting
+
+HIT = 'hit'
+MISS = 'miss'
+
+KEY_PREFIX = 'professionals:list'
+ALL_SCOPE = 'all'
+
+
+class ListCacheStats:
+    """
+    Per-process hit/miss counters for the list cache.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def record(self, outcome):
+        with self._lock:
+            if outcome == HIT:
+                self._hits += 1
+            else:
+                self._misses += 1
+
+    def snapshot(self):
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": self._hits / lookups if lookups else 0.0,
+            }
+
+    def reset(self):
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+
+
+stats = ListCacheStats()
+
+
+def enabled():
+    return get_setting('LIST_CACHE_ENABLED')
+
+
+def entry_key(request, source=None):
+    """
+    Build the cache key for a list request under the current version of its scope.
+
+    The key covers the query string (filter, cursor and limit) and the
+    negotiated renderer, whose format is part of the cached ETag.
+    """
+    scope = _scope(source)
+    version = _cache().get(_version_key(scope))
+    if version is None:
+        version = _new_version(scope)
+    return _entry_key(request, scope, version)
+
+
+async def aentry_key(request, source=None):
+    """
+    Async ``entry_key``.
+    """
+    scope = _scope(source)
+    version = await _cache().aget(_version_key(scope))
+    if version is None:
+        version = await sync_to_async(_new_version)(scope)
+    return _entry_key(request, scope, version)
+
+
+def get(key):
+    """
+    Return the cached ``(data, etag, last_modified)`` for ``key``, or None.
+    """
+    entry = _cache().get(key)
+    stats.record(MISS if entry is None else HIT)
+    return entry
+
+
+async def aget(key):
+    """
+    Async ``get``.
+    """
+    entry = await _cache().aget(key)
+    stats.record(MISS if entry is None else HIT)
+    return entry
+
+
+def store(key, data, etag, last_modified):
+    """
+    Cache serialized list data with its validators.
+    """
+    _cache().set(key, (data, etag, last_modified), timeout=get_setting('LIST_CACHE_TTL'))
+
+
+async def astore(key, data, etag, last_modified):
+    """
+    Async ``store``.
+    """
+    await _cache().aset(key, (data, etag, last_modified), timeout=get_setting('LIST_CACHE_TTL'))
+
+
+def invalidate(sources):
+    """
+    Bump the versions of the unfiltered list and of each of ``sources``.
+
+    The bump happens now, so the writing transaction (and tests) read fresh
+    pages, and again on commit, so a page another request cached from the
+    pre-commit rows in between is dropped as well.
+    """
+    scopes = [ALL_SCOPE] + [_scope(source) for source in set(sources) if source]
+    _bump(scopes)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: _bump(scopes))
+
+
+def clear():
+    """
+    Invalidate every cached list page and reset the counters.
+    """
+    from .models import Professional
+
+    _bump([ALL_SCOPE] + [_scope(source) for source, _ in Professional.SOURCE_CHOICES])
+    stats.reset()
+
+
+def _bump(scopes):
+    cache = _cache()
+    for scope in scopes:
+        try:
+            cache.incr(_version_key(scope))
+        except ValueError:
+            _new_version(scope)
+
+
+def _entry_key(request, scope, version):
+    query = '&'.join(sorted(request.GET.urlencode().split('&')))
+    digest = hashlib.blake2b(query.encode(), digest_size=12).hexdigest()
+    return f'{KEY_PREFIX}:{scope}:{version}:{request.accepted_renderer.format}:{digest}'
+
+
+def _new_version(scope):
+    # Start from the clock so an evicted counter never reuses an old version.
+    version = time.time_ns()
+    if not _cache().add(_version_key(scope), version, timeout=None):
+        return _cache().get(_version_key(scope), version)
+    return version
+
+
+def _scope(source):
+    return f'source:{source}' if source else ALL_SCOPE
+
+
+def _version_key(scope):
+    return f'{KEY_PREFIX}:version:{scope}'
+
+
+def _cache():
+    return caches[get_setting('LIST_CACHE_ALIAS')]
@@ -0,0 +1,213 @@
+"""
+Process-wide OpenAI client for resume parsing.
+
+One client (and one pool of keep-alive connections) is shared by every
+request in the process instead of opening a new connection and TLS session
+per parse. Calls go through ``chat_completion``, which:
+
+- applies ``LLM_CONNECT_TIMEOUT``/``LLM_READ_TIMEOUT``,
+- caps in-flight calls per process at ``LLM_MAX_CONCURRENCY``,
+- retries connection errors, timeouts, 429s and 5xx responses up to
+  ``LLM_MAX_RETRIES`` times with jittered exponential backoff.
+
+``achat_completion`` is the same for async views, on an ``AsyncOpenAI``
+client. An in-flight async call holds no thread, so its cap is the separate
+``LLM_ASYNC_MAX_CONCURRENCY``. Async clients and their connections belong to
+the event loop that made them, so there is one per loop.
+"""
+
+import asyncio
+import os
+import random
+import threading
+import time
+import weakref
+
+import httpx
+from openai import (
+    APIConnectionError,
+    APIStatusError,
+    AsyncOpenAI,
+    OpenAI,
+)
+
+from .conf import get_setting
+
+RETRYABLE_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
+
+class LLMClientManager:
+    """
+    Lazily builds the shared client and rebuilds it when the API key or base
+    URL changes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._client = None
+        self._client_config = None
+        self._semaphore = None
+        self._semaphore_size = None
+        # Event loop -> (client, config, semaphore) for async callers.
+        self._async_state = weakref.WeakKeyDictionary()
+
+    def get_client(self):
+        config = _client_config(get_setting('LLM_MAX_CONNECTIONS'))
+
+        with self._lock:
+            if self._client is None or self._client_config != config:
+                if self._client is not None:
+                    self._client.close()
+                self._client = self._build_client(*config)
+                self._client_config = config
+            return self._client
+
+    def chat_completion(self, **kwargs):
+        """
+        Create a chat completion with the shared client, retrying transient errors.
+        """
+        client = self.get_client()
+        max_retries = get_setting('LLM_MAX_RETRIES')
+
+        with self._get_semaphore():
+            attempt = 0
+            while True:
+                try:
+                    return client.chat.completions.create(**kwargs)
+                except (APIConnectionError, APIStatusError) as e:
+                    if attempt >= max_retries or not is_retryable(e):
+                        raise
+                    time.sleep(backoff_delay(attempt, e))
+                    attempt += 1
+
+    async def achat_completion(self, **kwargs):
+        """
+        Async ``chat_completion``: same retry policy, on this event loop's client.
+        """
+        client, semaphore = self._get_async_client()
+        max_retries = get_setting('LLM_MAX_RETRIES')
+
+        async with semaphore:
+            attempt = 0
+            while True:
+                try:
+                    return await client.chat.completions.create(**kwargs)
+                except (APIConnectionError, APIStatusError) as e:
+                    if attempt >= max_retries or not is_retryable(e):
+                        raise
+                    await asyncio.sleep(backoff_delay(attempt, e))
+                    attempt += 1
+
+    def reset(self):
+        """
+        Close the shared client; the next call builds a fresh one.
+
+        Async clients are dropped without closing, since their event loops may
+        be gone; their connections close when they are collected.
+        """
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+            self._client = None
+            self._client_config = None
+            self._async_state.clear()
+
+    def _get_async_client(self):
+        loop = asyncio.get_running_loop()
+        size = get_setting('LLM_ASYNC_MAX_CONCURRENCY')
+        config = _client_config(size)
+
+        with self._lock:
+            state = self._async_state.get(loop)
+            if state is None or state[1] != config:
+                state = (self._build_async_client(*config), config, asyncio.Semaphore(size))
+                self._async_state[loop] = state
+            return state[0], state[2]
+
+    def _get_semaphore(self):
+        size = get_setting('LLM_MAX_CONCURRENCY')
+        with self._lock:
+            if self._semaphore is None or self._semaphore_size != size:
+                self._semaphore = threading.BoundedSemaphore(size)
+                self._semaphore_size = size
+            return self._semaphore
+
+    @staticmethod
+    def _build_client(api_key, base_url, connect_timeout, read_timeout, max_connections):
+        timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        http_client = httpx.Client(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+        # Retries are handled in chat_completion so they share the backoff policy.
+        return OpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout,
+            max_retries=0,
+            http_client=http_client,
+        )
+
+    @staticmethod
+    def _build_async_client(api_key, base_url, connect_timeout, read_timeout, max_connections):
+        timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+        http_client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+        return AsyncOpenAI(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout,
+            max_retries=0,
+            http_client=http_client,
+        )
+
+
+def _client_config(max_connections):
+    return (
+        os.environ.get('OPENAI_API_KEY'),
+        get_setting('OPENAI_BASE_URL') or None,
+        get_setting('LLM_CONNECT_TIMEOUT'),
+        get_setting('LLM_READ_TIMEOUT'),
+        max_connections,
+    )
+
+
+def is_retryable(error):
+    """
+    Return True for errors worth retrying: network failures, timeouts, 429 and 5xx.
+    """
+    if isinstance(error, APIConnectionError):
+        return True
+    return error.status_code in RETRYABLE_STATUS_CODES
+
+
+def backoff_delay(attempt, error=None):
+    """
+    Full-jitter exponential backoff, honouring a server Retry-After header.
+    """
+    retry_after = _retry_after(error)
+    if retry_after is not None:
+        return min(retry_after, get_setting('LLM_BACKOFF_MAX'))
+    ceiling = min(get_setting('LLM_BACKOFF_MAX'), get_setting('LLM_BACKOFF_BASE') * 2 ** attempt)
+    return random.uniform(0, ceiling)
+
+
+def _retry_after(error):
+    response = getattr(error, 'response', None)
+    if response is None:
+        return None
+    try:
+        return float(response.headers.get('retry-after'))
+    except (TypeError, ValueError):
+        return None
+
+
+llm = LLMClientManager()
@@ -0,0 +1,268 @@
+"""
+Local stand-in for the OpenAI chat completions API.
+
+Serves ``POST /v1/chat/completions`` with a deterministic resume JSON derived
+from the request body, so the parse path can be tested and benchmarked
+without network access. Point ``OPENAI_BASE_URL`` at ``server.base_url``,
+or run it on its own with ``python manage.py llm_standin``.
+"""
+
+import hashlib
+import json
+import math
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .synthetic import COMPANIES, FIRST_NAMES, JOB_TITLES, LAST_NAMES
+
+
+def fake_resume(seed_bytes):
+    """
+    Build a resume result matching the parse prompt's schema from ``seed_bytes``.
+    """
+    digest = hashlib.sha256(seed_bytes).digest()
+    first = FIRST_NAMES[digest[0] % len(FIRST_NAMES)]
+    last = LAST_NAMES[digest[1] % len(LAST_NAMES)]
+    number = int.from_bytes(digest[2:6], 'big') % 10000000
+    return {
+        "full_name": f"{first} {last}",
+        "email": f"{first.lower()}.{last.lower()}@example.com",
+        "phone": f"+1 555 {number // 10000:03d} {number % 10000:04d}",
+        "company_name": COMPANIES[digest[6] % len(COMPANIES)],
+        "job_title": JOB_TITLES[digest[7] % len(JOB_TITLES)],
+        "confidence": {
+            "full_name": 95,
+            "email": 100,
+            "phone": 90,
+            "company_name": 85,
+            "job_title": 85,
+        },
+    }
+
+
+class Latency:
+    """
+    Response delay distribution, in seconds.
+
+    Kinds and their parameters:
+        ``fixed`` (seconds), ``uniform`` (low, high), ``normal`` (mean,
+        stddev; clipped at 0) and ``lognormal`` (median, sigma), whose long
+        tail is closest to real LLM latencies.
+    """
+    KINDS = {'fixed': 1, 'uniform': 2, 'normal': 2, 'lognormal': 2}
+
+    def __init__(self, kind='fixed', *params):
+        if kind not in self.KINDS or len(params) != self.KINDS[kind]:
+            raise ValueError(f"Invalid latency {kind}{list(params)}")
+        self.kind = kind
+        self.params = params
+
+    @classmethod
+    def parse(cls, spec):
+        """
+        Build a distribution from ``"0.3"``, ``"uniform:0.1,0.5"`` or ``"lognormal:0.8,0.5"``.
+        """
+        kind, _, params = str(spec).partition(':')
+        if not params:
+            return cls('fixed', float(kind))
+        return cls(kind, *(float(param) for param in params.split(',')))
+
+    def sample(self, rng):
+        if self.kind == 'fixed':
+            return self.params[0]
+        if self.kind == 'uniform':
+            return rng.uniform(*self.params)
+        if self.kind == 'normal':
+            return max(0.0, rng.gauss(*self.params))
+        median, sigma = self.params
+        return rng.lognormvariate(math.log(median), sigma) if median > 0 else 0.0
+
+    def __str__(self):
+        return f"{self.kind}:{','.join(str(param) for param in self.params)}"
+
+
+class StandInLLMServer:
+    """
+    Threaded HTTP server speaking the chat completions protocol.
+
+    Besides explicit ``fail_next`` failures, the server can misbehave the way
+    the real API does: a share of requests fails with 500 (``error_rate``)
+    and requests above ``rate_limit`` per second get 429 with a
+    ``Retry-After`` header. The same ``seed`` gives the same sequence of
+    delays and injected errors.
+
+    Args:
+        latency: Seconds to wait before answering, or a ``Latency``
+        host: Interface to bind
+        port: Port to bind (0 picks a free one)
+        error_rate: Fraction of requests answered with a 500
+        rate_limit: Requests per second allowed before 429s (None for no limit)
+        seed: Random seed for latency samples and injected errors
+    """
+
+    def __init__(self, latency=0.0, host='127.0.0.1', port=0, error_rate=0.0, rate_limit=None, seed=0):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit
+        self.requests = 0
+        self.bytes_received = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.errors_injected = 0
+        self.rate_limited = 0
+        self._failures = []
+        self._rng = random.Random(seed)
+        self._tokens = float(rate_limit or 0)
+        self._refilled_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._httpd = _HTTPServer((host, port), _handler_for(self))
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def fail_next(self, count, status=500):
+        """
+        Answer the next ``count`` requests with ``status`` instead of a completion.
+        """
+        with self._lock:
+            self._failures.extend([status] * count)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'requests': self.requests,
+                'bytes_received': self.bytes_received,
+                'max_in_flight': self.max_in_flight,
+                'errors_injected': self.errors_injected,
+                'rate_limited': self.rate_limited,
+            }
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self._httpd.serve_forever()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def respond(self, body):
+        """
+        Return ``(status, payload, headers)`` for a request body.
+        """
+        with self._lock:
+            self.requests += 1
+            self.bytes_received += len(body)
+            failure = self._failures.pop(0) if self._failures else None
+            retry_after = self._take_token() if failure is None else None
+            if retry_after is not None:
+                self.rate_limited += 1
+                return 429, _error("Rate limit reached for requests", 'rate_limit_exceeded'), {
+                    'Retry-After': f'{math.ceil(retry_after * 1000) / 1000:.3f}',
+                }
+            if failure is None and self.error_rate and self._rng.random() < self.error_rate:
+                failure = 500
+                self.errors_injected += 1
+            delay = self.latency.sample(self._rng) if isinstance(self.latency, Latency) else self.latency
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        try:
+            if delay:
+                time.sleep(delay)
+            return (*self._completion(body, failure), {})
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def _take_token(self):
+        """
+        Token bucket for ``rate_limit``: None if the request may proceed, else
+        seconds until it could.
+        """
+        if not self.rate_limit:
+            return None
+        now = time.monotonic()
+        self._tokens = min(float(self.rate_limit), self._tokens + (now - self._refilled_at) * self.rate_limit)
+        self._refilled_at = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return None
+        return (1 - self._tokens) / self.rate_limit
+
+    def _completion(self, body, failure):
+        if failure is not None:
+            return failure, _error("Stand-in failure", 'server_error')
+
+        try:
+            model = json.loads(body).get('model', 'stand-in')
+        except ValueError:
+            return 400, _error("Invalid JSON body", 'invalid_request_error')
+
+        return 200, {
+            "id": "chatcmpl-" + hashlib.sha256(body).hexdigest()[:24],
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": json.dumps(fake_resume(body))},
+                "finish_reason": "stop",
+            }],
+            "usage": {"prompt_tokens": len(body) // 4, "completion_tokens": 60, "total_tokens": len(body) // 4 + 60},
+        }
+
+
+def _error(message, error_type):
+    return {"error": {"message": message, "type": error_type}}
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 resets connections under concurrent load.
+    request_queue_size = 128
+
+
+def _handler_for(server):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        # Headers and body are separate writes; without this every keep-alive
+        # response waits out the client's delayed ACK.
+        disable_nagle_algorithm = True
+
+        def do_POST(self):
+            length = int(self.headers.get('Content-Length', 0))
+            body = self.rfile.read(length)
+
+            if not self.path.rstrip('/').endswith('/chat/completions'):
+                status, payload, headers = 404, _error("Not found", 'invalid_request_error'), {}
+            else:
+                status, payload, headers = server.respond(body)
+
+            data = json.dumps(payload).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
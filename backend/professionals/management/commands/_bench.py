@@ -0,0 +1,94 @@
+"""
+Shared helpers for the benchmark management commands.
+"""
+
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import httpx
+from django.db import connection
+
+
+@contextmanager
+def isolated_database():
+    """
+    Run the block against a throwaway test database instead of the dev data.
+    """
+    old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+
+def percentile(samples, pct):
+    """
+    Nearest-rank percentile of ``samples`` (``pct`` between 0 and 100).
+    """
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def drive_http(base_url, batch, concurrency, keepalive=True):
+    """
+    Send ``batch`` of ``(method, path, httpx kwargs)`` requests from
+    ``concurrency`` threads; return throughput and latency percentiles.
+
+    Without ``keepalive`` every request opens its own connection.
+    """
+    samples = []
+    errors = 0
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency if keepalive else 0)
+
+    with httpx.Client(base_url=base_url, limits=limits, timeout=120) as client:
+        def send(request):
+            method, path, kwargs = request
+            started = time.perf_counter()
+            try:
+                ok = client.request(method, path, **kwargs).status_code < 400
+            except httpx.HTTPError:
+                ok = False
+            return (time.perf_counter() - started) * 1000, ok
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            for elapsed_ms, ok in pool.map(send, batch):
+                samples.append(elapsed_ms)
+                errors += not ok
+        wall = time.perf_counter() - started
+
+    return {
+        'requests': len(batch),
+        'errors': errors,
+        'rps': len(batch) / wall if wall else None,
+        'p50_ms': percentile(samples, 50),
+        'p95_ms': percentile(samples, 95),
+        'p99_ms': percentile(samples, 99),
+    }
+
+
+def write_results(command, rows, columns, as_json=False):
+    """
+    Print benchmark rows as an aligned table, or as JSON for comparing runs.
+    """
+    if as_json:
+        command.stdout.write(json.dumps(rows, indent=2))
+        return
+
+    widths = [max(len(column), *(len(_format(row.get(column))) for row in rows)) for column in columns]
+    command.stdout.write('  '.join(column.ljust(width) for column, width in zip(columns, widths)))
+    for row in rows:
+        command.stdout.write('  '.join(_format(row.get(column)).ljust(width) for column, width in zip(columns, widths)))
+
+
+def _format(value):
+    if isinstance(value, float):
+        return f'{value:,.1f}'
+    if value is None:
+        return '-'
+    return str(value)
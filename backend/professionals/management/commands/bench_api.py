@@ -0,0 +1,191 @@
+"""
+Load-test the API end to end over HTTP.
+
+    python manage.py bench_api --rows 100000 --concurrency 1 8 32 --requests 500 --output bench.json
+
+By default the command builds a throwaway on-disk database with ``--rows``
+seeded professionals (see ``seed_professionals``), serves the project from a
+threaded WSGI server in this process and points resume parsing at the local
+LLM stand-in (``--llm-latency``, ``--llm-error-rate``, ``--llm-rate-limit``).
+With ``--base-url`` it drives an already running server instead and seeds
+nothing; start that server with ``OPENAI_BASE_URL`` pointing at a stand-in
+(``python manage.py llm_standin``) to include ``parse``.
+
+Each scenario is run at every ``--concurrency`` level with ``--requests``
+requests spread over that many client threads. The report has throughput,
+p50/p95/p99 latency and errors per scenario and level, and ``--output``
+writes it as JSON together with the git commit, so runs can be compared
+between commits.
+
+Scenarios:
+    list     GET /api/professionals/?limit=50
+    filter   GET /api/professionals/?source=<source>&limit=50
+    upsert   POST /api/professionals/ (new and existing emails)
+    bulk     POST /api/professionals/bulk with --bulk-size records
+    parse    POST /api/professionals/parse-resume with a distinct PDF each time
+"""
+
+import itertools
+import json
+import os
+import subprocess
+import tempfile
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.core.servers.basehttp import ThreadedWSGIServer, WSGIRequestHandler, get_internal_wsgi_application
+from django.db import connection
+from django.test import override_settings
+
+from professionals.llm_standin import Latency, StandInLLMServer
+from professionals.synthetic import SOURCES, professional_records, resume_pdf
+
+from ._bench import drive_http, isolated_database, write_results
+from .seed_professionals import seed_professionals
+
+SCENARIOS = ['list', 'filter', 'upsert', 'bulk', 'parse']
+
+
+class Command(BaseCommand):
+    help = 'Drive the list, filter, upsert, bulk and parse endpoints at several concurrency levels.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--base-url', help='Server to test, e.g. http://127.0.0.1:8000 (default: start one).')
+        parser.add_argument('--rows', type=int, default=100000, help='Professionals seeded before the run.')
+        parser.add_argument('--scenarios', nargs='+', choices=SCENARIOS, default=SCENARIOS)
+        parser.add_argument('--concurrency', nargs='+', type=int, default=[1, 8, 32])
+        parser.add_argument('--requests', type=int, default=200, help='Requests per scenario and level.')
+        parser.add_argument('--bulk-size', type=int, default=100)
+        parser.add_argument(
+            '--llm-latency', type=Latency.parse, default=0.2,
+            help='Stand-in LLM latency in seconds, or a distribution such as lognormal:0.8,0.5 (see llm_standin).'
+        )
+        parser.add_argument('--llm-error-rate', type=float, default=0.0, help='Fraction of LLM calls answered with 500.')
+        parser.add_argument('--llm-rate-limit', type=float, default=None, help='LLM calls per second before 429s.')
+        parser.add_argument('--output', help='Write the report as JSON to this file.')
+        parser.add_argument('--json', action='store_true', help='Emit results as JSON.')
+
+    def handle(self, *args, **options):
+        with ExitStack() as stack:
+            base_url = options['base_url']
+            if not base_url:
+                base_url = stack.enter_context(self._local_server(options))
+            results = self._run(base_url.rstrip('/'), options)
+
+        report = {
+            'commit': _git_commit(),
+            'base_url': options['base_url'] or 'in-process',
+            'rows': None if options['base_url'] else options['rows'],
+            'requests': options['requests'],
+            'results': results,
+        }
+        if options['output']:
+            with open(options['output'], 'w') as handle:
+                json.dump(report, handle, indent=2)
+        if options['json']:
+            self.stdout.write(json.dumps(report, indent=2))
+        else:
+            write_results(self, results, [
+                'scenario', 'concurrency', 'requests', 'errors', 'rps', 'p50_ms', 'p95_ms', 'p99_ms',
+            ])
+
+    @contextmanager
+    def _local_server(self, options):
+        """
+        Serve the project on a free port, backed by a seeded throwaway database.
+        """
+        os.environ.setdefault('OPENAI_API_KEY', 'stand-in')
+        with tempfile.TemporaryDirectory() as directory, ExitStack() as stack:
+            # On disk rather than in memory, so every server thread gets its own connection.
+            connection.settings_dict.setdefault('TEST', {})['NAME'] = os.path.join(directory, 'bench.sqlite3')
+            stack.enter_context(isolated_database())
+
+            started = time.perf_counter()
+            seed_professionals(options['rows'])
+            self.stderr.write(f"Seeded {options['rows']} professionals in {time.perf_counter() - started:.1f}s")
+
+            llm_server = stack.enter_context(StandInLLMServer(
+                latency=options['llm_latency'], error_rate=options['llm_error_rate'],
+                rate_limit=options['llm_rate_limit'],
+            ))
+            stack.enter_context(override_settings(
+                PROFESSIONALS={**getattr(settings, 'PROFESSIONALS', {}), 'OPENAI_BASE_URL': llm_server.base_url}
+            ))
+
+            httpd = ThreadedWSGIServer(('127.0.0.1', 0), _QuietHandler)
+            httpd.set_app(get_internal_wsgi_application())
+            thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+            thread.start()
+            try:
+                yield f'http://127.0.0.1:{httpd.server_address[1]}'
+            finally:
+                httpd.shutdown()
+                httpd.server_close()
+                connection.close()
+                self.stderr.write('LLM stand-in: ' + ', '.join(
+                    f'{name}={value}' for name, value in llm_server.stats().items()
+                ))
+
+    def _run(self, base_url, options):
+        results = []
+        for scenario in options['scenarios']:
+            requests = _requests(scenario, options)
+            for concurrency in options['concurrency']:
+                batch = [next(requests) for _ in range(options['requests'])]
+                results.append({'scenario': scenario, 'concurrency': concurrency,
+                                **drive_http(base_url, batch, concurrency)})
+                self.stderr.write(f"{scenario} x{concurrency}: {results[-1]['rps']:.1f} req/s")
+        return results
+
+
+def _requests(scenario, options):
+    """
+    Endless ``(method, path, httpx kwargs)`` requests for ``scenario``.
+
+    Written records are numbered past the seeded rows, so upserts create new
+    people; every other upsert repeats the previous email to exercise the
+    update path.
+    """
+    counter = itertools.count(10 ** 8)
+
+    if scenario == 'list':
+        return itertools.repeat(('GET', '/api/professionals/', {'params': {'limit': 50}}))
+    if scenario == 'filter':
+        return (('GET', '/api/professionals/', {'params': {'source': source, 'limit': 50}})
+                for source in itertools.cycle(SOURCES))
+    if scenario == 'upsert':
+        return (('POST', '/api/professionals/', {'json': professional_records(1, start=next(counter) // 2)[0]})
+                for _ in itertools.count())
+    if scenario == 'bulk':
+        size = options['bulk_size']
+        return (('POST', '/api/professionals/bulk', {'json': professional_records(size, start=next(counter) * size)})
+                for _ in itertools.count())
+    return (('POST', '/api/professionals/parse-resume', {'files': {'resume': ('resume.pdf', _resume(next(counter)))}})
+            for _ in itertools.count())
+
+
+def _resume(n):
+    # Without a job title line the tiered parser has to ask the LLM.
+    record = professional_records(1, start=n)[0]
+    return resume_pdf([record['full_name'], f"{record['email']} | {record['phone']}"])
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class _QuietHandler(WSGIRequestHandler):
+    # Headers and body are separate writes; with Nagle on, each response
+    # would wait out the client's delayed ACK (~40ms).
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
@@ -0,0 +1,203 @@
+"""
+Compare concurrent resume parsing under WSGI threads and under ASGI.
+
+    python manage.py bench_asgi --concurrency 16 64 256 --requests 256 --llm-latency 0.5 --threads 32
+
+Both servers run in this process on a throwaway on-disk database, against
+the local LLM stand-in:
+
+- ``wsgi``: the sync ``parse-resume`` view on a WSGI server with a pool of
+  ``--threads`` threads, like ``gunicorn --threads``. Each parse holds a
+  thread for its whole LLM call.
+- ``asgi``: the async ``async/parse-resume`` view on uvicorn, one event
+  loop. A parse waiting on the LLM holds no thread.
+
+Every parse uploads a distinct PDF, so each one misses the cache and calls
+the LLM. Clients open a connection per request: a pooled WSGI thread serves
+one connection at a time, so kept-alive idle connections would starve the
+rest. While parses run, one client keeps fetching a list page (the sync
+view under WSGI, the async one under ASGI), to show whether the server
+still answers ordinary requests under parse load.
+"""
+
+import os
+import socket
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+
+import httpx
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.core.servers.basehttp import ThreadedWSGIServer, WSGIRequestHandler, get_internal_wsgi_application
+from django.db import connection
+from django.test import override_settings
+
+from professionals.llm_standin import Latency, StandInLLMServer
+from professionals.synthetic import professional_records, resume_pdf
+
+from ._bench import drive_http, isolated_database, percentile, write_results
+from .seed_professionals import seed_professionals
+
+try:
+    import uvicorn
+except ImportError:
+    uvicorn = None
+
+SERVERS = ['wsgi', 'asgi']
+PATHS = {
+    'wsgi': {'parse': '/api/professionals/parse-resume', 'list': '/api/professionals/'},
+    'asgi': {'parse': '/api/professionals/async/parse-resume', 'list': '/api/professionals/async'},
+}
+
+
+class Command(BaseCommand):
+    help = 'Measure concurrent parse-resume throughput on a threaded WSGI server and on uvicorn (ASGI).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--servers', nargs='+', choices=SERVERS, default=SERVERS)
+        parser.add_argument('--concurrency', nargs='+', type=int, default=[16, 64, 256])
+        parser.add_argument('--requests', type=int, default=256, help='Parse requests per server and level.')
+        parser.add_argument('--threads', type=int, default=32, help='WSGI worker threads.')
+        parser.add_argument(
+            '--llm-latency', type=Latency.parse, default=0.5,
+            help='Stand-in LLM latency in seconds, or a distribution such as lognormal:0.8,0.5 (see llm_standin).'
+        )
+        parser.add_argument('--rows', type=int, default=10000, help='Professionals seeded for the list probe.')
+        parser.add_argument('--json', action='store_true', help='Emit results as JSON.')
+
+    def handle(self, *args, **options):
+        if 'asgi' in options['servers'] and uvicorn is None:
+            raise CommandError('The asgi server needs uvicorn: pip install uvicorn')
+
+        os.environ.setdefault('OPENAI_API_KEY', 'stand-in')
+        rows = []
+        with tempfile.TemporaryDirectory() as directory, ExitStack() as stack:
+            # On disk rather than in memory, so every server thread gets its own connection.
+            connection.settings_dict.setdefault('TEST', {})['NAME'] = os.path.join(directory, 'bench.sqlite3')
+            stack.enter_context(isolated_database())
+            seed_professionals(options['rows'])
+
+            llm_server = stack.enter_context(StandInLLMServer(latency=options['llm_latency']))
+            stack.enter_context(override_settings(PROFESSIONALS={
+                **getattr(settings, 'PROFESSIONALS', {}),
+                'OPENAI_BASE_URL': llm_server.base_url,
+                # Let the WSGI side use every thread it has for LLM calls.
+                'LLM_MAX_CONCURRENCY': options['threads'],
+                'LLM_MAX_CONNECTIONS': options['threads'],
+            }))
+
+            pdfs = iter(range(10 ** 8, 10 ** 9))
+            for server in options['servers']:
+                serve = self._wsgi if server == 'wsgi' else self._asgi
+                with serve(options) as base_url:
+                    for concurrency in options['concurrency']:
+                        llm_server.max_in_flight = 0
+                        batch = [_parse_request(server, next(pdfs)) for _ in range(options['requests'])]
+                        with _list_probe(base_url, PATHS[server]['list']) as probe:
+                            result = drive_http(base_url, batch, concurrency, keepalive=False)
+                        rows.append({
+                            'server': server, 'concurrency': concurrency, **result,
+                            'llm_in_flight': llm_server.max_in_flight, **probe,
+                        })
+                        self.stderr.write(f"{server} x{concurrency}: {result['rps']:.1f} parses/s")
+
+        write_results(self, rows, [
+            'server', 'concurrency', 'requests', 'errors', 'rps', 'p50_ms', 'p99_ms', 'llm_in_flight',
+            'list_p50_ms', 'list_p99_ms',
+        ], options['json'])
+
+    @contextmanager
+    def _wsgi(self, options):
+        httpd = _PooledWSGIServer(('127.0.0.1', 0), _QuietHandler, threads=options['threads'])
+        httpd.set_app(get_internal_wsgi_application())
+        thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        thread.start()
+        try:
+            yield f'http://127.0.0.1:{httpd.server_address[1]}'
+        finally:
+            httpd.shutdown()
+            httpd.server_close()
+
+    @contextmanager
+    def _asgi(self, options):
+        from newtonx_project.asgi import application
+
+        sock = socket.socket()
+        sock.bind(('127.0.0.1', 0))
+        server = uvicorn.Server(uvicorn.Config(
+            application, lifespan='off', log_level='warning', backlog=2048,
+            limit_concurrency=None, timeout_keep_alive=30,
+        ))
+        thread = threading.Thread(target=server.run, kwargs={'sockets': [sock]}, daemon=True)
+        thread.start()
+        while not server.started:
+            time.sleep(0.01)
+        try:
+            yield f'http://127.0.0.1:{sock.getsockname()[1]}'
+        finally:
+            server.should_exit = True
+            thread.join()
+            sock.close()
+
+
+def _parse_request(server, n):
+    # No job title line, so the tiered parser has to ask the LLM.
+    record = professional_records(1, start=n)[0]
+    pdf = resume_pdf([record['full_name'], f"{record['email']} | {record['phone']}"])
+    return 'POST', PATHS[server]['parse'], {'files': {'resume': ('resume.pdf', pdf)}}
+
+
+@contextmanager
+def _list_probe(base_url, path):
+    """
+    Fetch a list page in a loop while the block runs; report its latency percentiles.
+    """
+    samples = []
+    done = threading.Event()
+    limits = httpx.Limits(max_keepalive_connections=0)
+
+    def probe():
+        with httpx.Client(base_url=base_url, limits=limits, timeout=120) as client:
+            while not done.is_set():
+                started = time.perf_counter()
+                client.get(path, params={'limit': 50, 'source': 'direct'})
+                samples.append((time.perf_counter() - started) * 1000)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(probe)
+        result = {}
+        try:
+            yield result
+        finally:
+            done.set()
+            future.result()
+            result.update({'list_p50_ms': percentile(samples, 50), 'list_p99_ms': percentile(samples, 99)})
+
+
+class _PooledWSGIServer(ThreadedWSGIServer):
+    """
+    WSGI server that handles requests on a fixed pool of threads instead of one thread per request.
+    """
+    request_queue_size = 2048
+
+    def __init__(self, *args, threads, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pool = ThreadPoolExecutor(max_workers=threads)
+
+    def process_request(self, request, client_address):
+        self._pool.submit(self.process_request_thread, request, client_address)
+
+    def server_close(self):
+        super().server_close()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+class _QuietHandler(WSGIRequestHandler):
+    # See bench_api: without this each keep-alive response waits out a delayed ACK.
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
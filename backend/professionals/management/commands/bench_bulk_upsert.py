@@ -0,0 +1,77 @@
+"""
+Benchmark the bulk upsert engine against the row-by-row upsert it replaced.
+
+    python manage.py bench_bulk_upsert --sizes 1000 10000 100000
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from professionals.models import Professional
+from professionals.serializers import BulkProfessionalSerializer
+from professionals.synthetic import professional_records
+from professionals.upsert import bulk_upsert_professionals, upsert_professional
+
+from ._bench import isolated_database, write_results
+
+
+class Command(BaseCommand):
+    help = 'Measure bulk upsert throughput (rows/sec) on a throwaway database.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', nargs='+', type=int, default=[1000, 10000, 100000])
+        parser.add_argument(
+            '--row-limit', type=int, default=10000,
+            help='Skip the row-by-row baseline above this many records (it is slow).'
+        )
+        parser.add_argument('--json', action='store_true', help='Emit results as JSON.')
+
+    def handle(self, *args, **options):
+        rows = []
+
+        with isolated_database():
+            for size in options['sizes']:
+                row = {'records': size, 'set_based': self._run(size, bulk_upsert_professionals)}
+                if size <= options['row_limit']:
+                    row['row_by_row'] = self._run(size, _row_by_row_upsert)
+                    row['speedup'] = row['set_based'] / row['row_by_row']
+                rows.append(row)
+
+        write_results(self, rows, ['records', 'set_based', 'row_by_row', 'speedup'], options['json'])
+
+    def _run(self, size, upsert):
+        """
+        Upsert ``size`` records, half of them updates of existing rows; return rows/sec.
+        """
+        Professional.objects.all().delete()
+        Professional.objects.bulk_create(
+            [Professional(**record) for record in professional_records(size // 2, seed=1)],
+            batch_size=500,
+        )
+        records = professional_records(size, seed=2)
+
+        started = time.perf_counter()
+        with transaction.atomic():
+            success, failed = upsert(records)
+        elapsed = time.perf_counter() - started
+
+        if failed or len(success) != size:
+            raise RuntimeError(f'Benchmark upsert failed for {len(failed)} of {size} records')
+        return size / elapsed
+
+
+def _row_by_row_upsert(records):
+    success = []
+    failed = []
+
+    for index, record in enumerate(records):
+        serializer = BulkProfessionalSerializer(data=record)
+        if not serializer.is_valid():
+            failed.append(index)
+            continue
+        professional, _ = upsert_professional(serializer.validated_data)
+        success.append(professional)
+
+    return success, failed
@@ -0,0 +1,96 @@
+"""
+Benchmark duplicate detection on a synthetic table with planted duplicates.
+
+    python manage.py bench_dedup --rows 1000000
+
+Runs a full pass, then an incremental pass after touching ``--changed``
+of the rows, on a throwaway database, and reports time, pairs compared and
+precision/recall against the planted pairs. Comparing every pair instead
+would take rows * (rows - 1) / 2 comparisons.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from professionals.dedup import find_duplicates
+from professionals.models import DuplicateCandidate, Professional
+from professionals.synthetic import people_records
+
+from ._bench import isolated_database, write_results
+
+
+class Command(BaseCommand):
+    help = 'Time full and incremental duplicate detection and score it against planted duplicates.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=100000)
+        parser.add_argument('--duplicate-rate', type=float, default=0.05)
+        parser.add_argument('--changed', type=float, default=0.01, help='Share of rows touched before the incremental run.')
+        parser.add_argument('--json', action='store_true', help='Emit results as JSON.')
+
+    def handle(self, *args, **options):
+        records, planted = people_records(options['rows'], options['duplicate_rate'])
+        rows = []
+
+        with isolated_database():
+            ids = self._populate(records)
+            truth = _true_pairs(planted, ids)
+
+            run = find_duplicates(full=True)
+            rows.append(self._row('full', run, truth))
+
+            touched = ids[::max(1, round(1 / options['changed']))] if options['changed'] else []
+            for start in range(0, len(touched), 900):
+                Professional.objects.filter(id__in=touched[start:start + 900]).update(updated_at=timezone.now())
+            run = find_duplicates()
+            rows.append(self._row('incremental', run, truth))
+
+        write_results(self, rows, [
+            'run', 'changed', 'seconds', 'pairs_compared', 'naive_pairs', 'candidates', 'precision', 'recall',
+        ], options['json'])
+
+    def _populate(self, records, batch=10000):
+        started = time.perf_counter()
+        for start in range(0, len(records), batch):
+            with transaction.atomic():
+                Professional.objects.bulk_create(
+                    [Professional(**record) for record in records[start:start + batch]], batch_size=1000
+                )
+        self.stderr.write(f'Inserted {len(records)} rows in {time.perf_counter() - started:.1f}s')
+        return list(Professional.objects.order_by('id').values_list('id', flat=True))
+
+    def _row(self, label, run, truth):
+        found = set(DuplicateCandidate.objects.values_list('professional_a', 'professional_b'))
+        hits = len(found & truth)
+        changed = run.rows_changed
+        total = Professional.objects.count()
+        return {
+            'run': label,
+            'changed': changed,
+            'seconds': run.elapsed_ms / 1000,
+            'pairs_compared': run.pairs_compared,
+            # Pairs involving a changed row, i.e. what a nested loop would compare.
+            'naive_pairs': changed * (changed - 1) // 2 + changed * (total - changed),
+            'candidates': len(found),
+            'precision': 100 * hits / len(found) if found else None,
+            'recall': 100 * hits / len(truth) if truth else None,
+        }
+
+
+def _true_pairs(planted, ids):
+    """
+    Expand planted ``(original, duplicate)`` pairs to every pair within each
+    person, since two duplicates of one original are also a true pair.
+    """
+    people = {}
+    for original, duplicate in planted:
+        people.setdefault(original, [original]).append(duplicate)
+    return {
+        (ids[a], ids[b])
+        for indexes in people.values()
+        for i, a in enumerate(indexes)
+        for b in indexes[i + 1:]
+    }
@@ -0,0 +1,81 @@
+"""
+Benchmark per-row serialization cost of the professionals list.
+
+    python manage.py bench_list_serialize --rows 50000
+
+Compares ``ProfessionalSerializer(many=True)`` (the list path before the
+read path existed) with ``ProfessionalReader``, for every column and for the
+columns the UI table shows, on a throwaway database. Query time is included
+in both; rendering to JSON is timed separately.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from professionals.models import Professional
+from professionals.readers import ProfessionalReader
+from professionals.serializers import ProfessionalSerializer
+from professionals.synthetic import professional_records
+
+from ._bench import isolated_database, percentile, write_results
+
+TABLE_FIELDS = ['id', 'full_name', 'email', 'phone', 'company_name', 'job_title', 'source', 'created_at']
+
+
+class Command(BaseCommand):
+    help = 'Compare ModelSerializer and the values_list() reader on the list endpoint.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=50000)
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--json', action='store_true', help='Emit results as JSON.')
+
+    def handle(self, *args, **options):
+        count = options['rows']
+        renderer = JSONRenderer()
+        strategies = [
+            ('model_serializer', lambda qs: ProfessionalSerializer(qs, many=True).data),
+            ('reader', lambda qs: ProfessionalReader().rows(qs)),
+            ('reader_table_fields', lambda qs: ProfessionalReader(TABLE_FIELDS).rows(qs)),
+        ]
+        rows = []
+
+        with isolated_database():
+            self._populate(count)
+            queryset = Professional.objects.all()
+            baseline = None
+            for name, serialize in strategies:
+                serialize_ms, data = self._time(lambda: serialize(queryset), options['repeat'])
+                render_ms, content = self._time(lambda: renderer.render(data), options['repeat'])
+                baseline = baseline or serialize_ms
+                rows.append({
+                    'strategy': name,
+                    'serialize_ms': serialize_ms,
+                    'us_per_row': serialize_ms * 1000 / count,
+                    'render_ms': render_ms,
+                    'bytes': len(content),
+                    'speedup': baseline / serialize_ms if serialize_ms else None,
+                })
+
+        write_results(
+            self, rows, ['strategy', 'serialize_ms', 'us_per_row', 'render_ms', 'bytes', 'speedup'], options['json']
+        )
+
+    def _populate(self, count, batch=10000):
+        for start in range(0, count, batch):
+            with transaction.atomic():
+                Professional.objects.bulk_create(
+                    [Professional(**record) for record in professional_records(min(batch, count - start), start=start)],
+                    batch_size=1000,
+                )
+
+    def _time(self, run, repeat):
+        samples = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            result = run()
+            samples.append((time.perf_counter() - started) * 1000)
+        return percentile(samples, 50), result
@@ -0,0 +1,99 @@
+"""
+Benchmark LLM call latency with a client per call versus the pooled client.
+
+    python manage.py bench_llm_client --requests 400 --concurrency 32 --latency 0.05
+
+Both modes talk to the local stand-in server, so the numbers isolate client
+overhead (client construction, connection setup) from model latency.
+"""
+
+import base64
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+from openai import OpenAI
+
+from professionals.gpt_parser import MODEL, RESUME_PROMPT
+from professionals.llm_client import llm
+from professionals.llm_standin import Latency, StandInLLMServer
+
+from ._bench import percentile, write_results
+
+
+class Command(BaseCommand):
+    help = 'Measure p50/p99 LLM call latency under concurrent load against a local stand-in.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=400)
+        parser.add_argument('--concurrency', type=int, default=32)
+        parser.add_argument(
+            '--latency', type=Latency.parse, default=0.05,
+            help='Stand-in latency in seconds, or a distribution such as lognormal:0.8,0.5 (see llm_standin).'
+        )
+        parser.add_argument(
+            '--max-concurrency', type=int, default=None,
+            help='LLM_MAX_CONCURRENCY for the pooled client (defaults to --concurrency).'
+        )
+        parser.add_argument('--json', action='store_true', help='Emit results as JSON.')
+
+    def handle(self, *args, **options):
+        os.environ.setdefault('OPENAI_API_KEY', 'stand-in')
+        messages = _messages()
+        rows = []
+
+        with StandInLLMServer(latency=options['latency']) as server:
+            def per_call_client():
+                client = OpenAI(base_url=server.base_url, max_retries=0)
+                try:
+                    client.chat.completions.create(model=MODEL, messages=messages)
+                finally:
+                    client.close()
+
+            def pooled_client():
+                llm.chat_completion(model=MODEL, messages=messages)
+
+            pooled_settings = override_settings(PROFESSIONALS={
+                'OPENAI_BASE_URL': server.base_url,
+                'LLM_MAX_CONCURRENCY': options['max_concurrency'] or options['concurrency'],
+                'LLM_MAX_CONNECTIONS': options['concurrency'],
+            })
+
+            rows.append(self._run('client per call', per_call_client, options))
+            with pooled_settings:
+                rows.append(self._run('pooled client', pooled_client, options))
+                llm.reset()
+
+        write_results(self, rows, ['mode', 'requests', 'req_per_sec', 'p50_ms', 'p99_ms'], options['json'])
+
+    def _run(self, mode, call, options):
+        def timed(_):
+            started = time.perf_counter()
+            call()
+            return (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options['concurrency']) as executor:
+            samples = list(executor.map(timed, range(options['requests'])))
+        elapsed = time.perf_counter() - started
+
+        return {
+            'mode': mode,
+            'requests': len(samples),
+            'req_per_sec': len(samples) / elapsed,
+            'p50_ms': percentile(samples, 50),
+            'p99_ms': percentile(samples, 99),
+        }
+
+
+def _messages():
+    pdf = base64.b64encode(b"%PDF-1.4 " + b"x" * 50000).decode("utf-8")
+    return [{
+        "role": "user",
+        "content": [
+            {"type": "text", "text": RESUME_PROMPT},
+            {"type": "image_url", "image_url": {"url": f"data:application/pdf;base64,{pdf}"}},
+        ],
+    }]
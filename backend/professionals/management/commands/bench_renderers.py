@@ -0,0 +1,82 @@
+"""
+Benchmark encode time and payload size of the list renderers.
+
+    python manage.py bench_renderers --rows 100000
+
+Renders the same list of professionals (as ``ProfessionalReader`` produces
+it) with each renderer, for every column and for the UI table's columns.
+Renderers whose optional library is missing are reported as skipped.
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from professionals.models import Professional
+from professionals.readers import ProfessionalReader
+from professionals.renderers import ColumnarJSONRenderer, MessagePackRenderer, ORJSONRenderer, orjson
+from professionals.synthetic import professional_records
+
+from ._bench import isolated_database, percentile, write_results
+
+TABLE_FIELDS = ['id', 'full_name', 'email', 'phone', 'company_name', 'job_title', 'source', 'created_at']
+RENDERERS = [
+    ('stdlib_json', JSONRenderer, True),
+    ('orjson', ORJSONRenderer, orjson is not None),
+    ('msgpack', MessagePackRenderer, MessagePackRenderer.available),
+    ('columnar', ColumnarJSONRenderer, True),
+]
+
+
+class Command(BaseCommand):
+    help = 'Compare encode time and bytes of the JSON, orjson, MessagePack and columnar renderers.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=100000)
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--json', action='store_true', help='Emit results as JSON.')
+
+    def handle(self, *args, **options):
+        rows = []
+
+        with isolated_database():
+            self._populate(options['rows'])
+            for label, fields in (('all', None), ('table', TABLE_FIELDS)):
+                data = ProfessionalReader(fields).rows(Professional.objects.all())
+                baseline = None
+                for name, renderer_class, available in RENDERERS:
+                    if not available:
+                        rows.append({'renderer': name, 'fields': label, 'note': 'skipped (library missing)'})
+                        continue
+                    encode_ms, content = self._time(renderer_class().render, data, options['repeat'])
+                    baseline = baseline or (encode_ms, len(content))
+                    rows.append({
+                        'renderer': name,
+                        'fields': label,
+                        'encode_ms': encode_ms,
+                        'bytes': len(content),
+                        'speedup': baseline[0] / encode_ms if encode_ms else None,
+                        'size_ratio': len(content) / baseline[1],
+                    })
+
+        write_results(
+            self, rows, ['renderer', 'fields', 'encode_ms', 'bytes', 'speedup', 'size_ratio', 'note'], options['json']
+        )
+
+    def _populate(self, count, batch=10000):
+        for start in range(0, count, batch):
+            with transaction.atomic():
+                Professional.objects.bulk_create(
+                    [Professional(**record) for record in professional_records(min(batch, count - start), start=start)],
+                    batch_size=1000,
+                )
+
+    def _time(self, render, data, repeat):
+        samples = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            content = render(data)
+            samples.append((time.perf_counter() - started) * 1000)
+        return percentile(samples, 50), content
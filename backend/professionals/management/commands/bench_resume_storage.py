@@ -0,0 +1,88 @@
+"""
+Compare resume upserts on plain file storage and on content-addressed storage.
+
+    python manage.py bench_resume_storage --uploads 2000 --distinct 200 --pages 4
+
+Each storage gets a throwaway database and media directory. ``--uploads``
+professionals are upserted with a resume drawn from ``--distinct`` different
+PDFs, as when the same CV arrives through several sources. The command
+reports upsert latency, files and bytes on disk, and throughput.
+"""
+
+import os
+import tempfile
+import time
+
+from django.core.files.storage import FileSystemStorage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+
+from professionals.models import Professional
+from professionals.storage import resume_storage
+from professionals.synthetic import professional_records, resume_pdf
+from professionals.upsert import upsert_professional
+
+from ._bench import isolated_database, percentile, write_results
+
+STORAGES = ['filesystem', 'content']
+
+
+class Command(BaseCommand):
+    help = 'Measure resume upsert latency and disk use with and without content-addressed storage.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--storages', nargs='+', choices=STORAGES, default=STORAGES)
+        parser.add_argument('--uploads', type=int, default=2000, help='Professionals upserted with a resume.')
+        parser.add_argument('--distinct', type=int, default=200, help='Different resume PDFs among the uploads.')
+        parser.add_argument('--pages', type=int, default=4, help='Pages per resume PDF.')
+        parser.add_argument('--json', action='store_true', help='Emit results as JSON.')
+
+    def handle(self, *args, **options):
+        pdfs = [
+            resume_pdf([f'Candidate {n}'], [[f'Experience {n}.{page}'] * 40 for page in range(options['pages'] - 1)])
+            for n in range(options['distinct'])
+        ]
+        records = professional_records(options['uploads'], seed=5)
+        field = Professional._meta.get_field('resume')
+
+        rows = []
+        for name in options['storages']:
+            with tempfile.TemporaryDirectory() as media_root, override_settings(MEDIA_ROOT=media_root), \
+                    isolated_database():
+                field.storage = resume_storage if name == 'content' else FileSystemStorage()
+                try:
+                    rows.append({'storage': name, **self._run(records, pdfs, media_root)})
+                finally:
+                    field.storage = resume_storage
+                self.stderr.write(f"{name}: {rows[-1]['files']} files")
+
+        write_results(self, rows, [
+            'storage', 'uploads', 'upserts_per_sec', 'p50_ms', 'p99_ms', 'files', 'disk_mib',
+        ], options['json'])
+
+    def _run(self, records, pdfs, media_root):
+        samples = []
+        started = time.perf_counter()
+        for n, record in enumerate(records):
+            resume = SimpleUploadedFile('resume.pdf', pdfs[n % len(pdfs)], content_type='application/pdf')
+            upload_started = time.perf_counter()
+            upsert_professional({**record, 'resume': resume})
+            samples.append((time.perf_counter() - upload_started) * 1000)
+        elapsed = time.perf_counter() - started
+
+        files = 0
+        size = 0
+        for directory, _, file_names in os.walk(media_root):
+            for file_name in file_names:
+                files += 1
+                size += os.path.getsize(os.path.join(directory, file_name))
+
+        return {
+            'uploads': len(records),
+            'upserts_per_sec': len(records) / elapsed,
+            'p50_ms': percentile(samples, 50),
+            'p99_ms': percentile(samples, 99),
+            'files': files,
+            'disk_mib': size / 1024 / 1024,
+        }
@@ -0,0 +1,83 @@
+"""
+Benchmark full-text search against the admin's icontains LIKE scan.
+
+    python manage.py bench_search --rows 1000000
+
+Both run the same free-text queries for the top 20 matches on a throwaway
+database; the LIKE scan is what ``ProfessionalAdmin.search_fields`` compiles
+to (every term OR-ed across five columns).
+"""
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Q
+
+from professionals.models import Professional
+from professionals.search import search_professionals
+from professionals.synthetic import professional_records
+
+from ._bench import isolated_database, percentile, write_results
+
+LIKE_FIELDS = ['full_name', 'email', 'phone', 'company_name', 'job_title']
+QUERIES = ['ada', 'grace hopper', 'senior eng', 'glob', 'lovelace.12340', '54321', 'zzz']
+
+
+class Command(BaseCommand):
+    help = 'Compare FTS5 search latency with the LIKE scan on a large table.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=1000000)
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--limit', type=int, default=20)
+        parser.add_argument('--json', action='store_true', help='Emit results as JSON.')
+
+    def handle(self, *args, **options):
+        rows = []
+
+        with isolated_database():
+            self._populate(options['rows'])
+            for query in QUERIES:
+                like_ms, like_results = self._time(lambda: _like_search(query, options['limit']), options['repeat'])
+                fts_ms, fts_results = self._time(
+                    lambda: search_professionals(query, limit=options['limit']), options['repeat']
+                )
+                rows.append({
+                    'query': query,
+                    'like_ms': like_ms,
+                    'fts_ms': fts_ms,
+                    'speedup': like_ms / fts_ms if fts_ms else None,
+                    'like_hits': len(like_results),
+                    'fts_hits': len(fts_results),
+                })
+
+        write_results(self, rows, ['query', 'like_ms', 'fts_ms', 'speedup', 'like_hits', 'fts_hits'], options['json'])
+
+    def _populate(self, count, batch=10000):
+        started = time.perf_counter()
+        for start in range(0, count, batch):
+            with transaction.atomic():
+                Professional.objects.bulk_create(
+                    [Professional(**record) for record in professional_records(min(batch, count - start), start=start)],
+                    batch_size=1000,
+                )
+        self.stderr.write(f'Inserted {count} rows (with index triggers) in {time.perf_counter() - started:.1f}s')
+
+    def _time(self, search, repeat):
+        samples = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            results = search()
+            samples.append((time.perf_counter() - started) * 1000)
+        return percentile(samples, 50), results
+
+
+def _like_search(query, limit):
+    condition = Q()
+    for term in query.split():
+        term_condition = Q()
+        for field in LIKE_FIELDS:
+            term_condition |= Q(**{f'{field}__icontains': term})
+        condition &= term_condition
+    return list(Professional.objects.filter(condition).order_by('-created_at')[:limit])
@@ -0,0 +1,120 @@
+"""
+Measure read latency while a bulk import runs, per SQLite storage profile.
+
+    python manage.py bench_sqlite_profile --rows 50000 --import-rows 50000 --readers 8
+
+For each profile (see ``professionals/db_profile.py``) the command seeds a
+throwaway on-disk database, then runs a bulk upsert of ``--import-rows``
+records in ``--batch-size`` transactions on one thread while ``--readers``
+threads keep fetching the first list page. It reports read latency
+percentiles, the longest read, import throughput and ``database is locked``
+errors on either side.
+"""
+
+import os
+import tempfile
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import OperationalError, connection, transaction
+from django.test import override_settings
+
+from professionals.db_profile import PROFILES, current_pragmas
+from professionals.models import Professional
+from professionals.readers import ProfessionalReader
+from professionals.synthetic import SOURCES, professional_records
+from professionals.upsert import bulk_upsert_professionals
+
+from ._bench import isolated_database, percentile, write_results
+from .seed_professionals import seed_professionals
+
+
+class Command(BaseCommand):
+    help = 'Compare list read latency during a bulk import under each SQLite storage profile.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--profiles', nargs='+', choices=list(PROFILES), default=list(PROFILES))
+        parser.add_argument('--rows', type=int, default=50000, help='Professionals seeded before the import.')
+        parser.add_argument('--import-rows', type=int, default=50000, help='Records upserted by the import.')
+        parser.add_argument('--batch-size', type=int, default=1000, help='Records per import transaction.')
+        parser.add_argument('--readers', type=int, default=8, help='Concurrent reader threads.')
+        parser.add_argument('--json', action='store_true', help='Emit results as JSON.')
+
+    def handle(self, *args, **options):
+        rows = []
+        for profile in options['profiles']:
+            profile_settings = {**getattr(settings, 'PROFESSIONALS', {}), 'SQLITE_PROFILE': profile}
+            with tempfile.TemporaryDirectory() as directory, override_settings(PROFESSIONALS=profile_settings):
+                # On disk, so every thread has its own connection and locks are real.
+                connection.settings_dict.setdefault('TEST', {})['NAME'] = os.path.join(directory, 'bench.sqlite3')
+                with isolated_database():
+                    seed_professionals(options['rows'])
+                    journal_mode = current_pragmas(connection, ['journal_mode'])['journal_mode']
+                    rows.append({'profile': profile, 'journal_mode': journal_mode, **self._run(options)})
+                    self.stderr.write(f"{profile}: read p99 {rows[-1]['read_p99_ms']:.1f}ms")
+
+        write_results(self, rows, [
+            'profile', 'journal_mode', 'reads', 'read_p50_ms', 'read_p95_ms', 'read_p99_ms', 'read_max_ms',
+            'read_errors', 'import_rows_per_sec', 'import_errors',
+        ], options['json'])
+
+    def _run(self, options):
+        importing = threading.Event()
+        importing.set()
+        samples = []
+        errors = {'read': 0, 'import': 0}
+        lock = threading.Lock()
+        reader = ProfessionalReader()
+
+        def read():
+            try:
+                while importing.is_set():
+                    source = SOURCES[len(samples) % len(SOURCES)]
+                    started = time.perf_counter()
+                    try:
+                        reader.rows(Professional.objects.filter(source=source).order_by('-created_at', '-id')[:50])
+                    except OperationalError:
+                        with lock:
+                            errors['read'] += 1
+                        continue
+                    with lock:
+                        samples.append((time.perf_counter() - started) * 1000)
+            finally:
+                connection.close()
+
+        def write():
+            # New people, numbered clear of the seeded rows.
+            start = 10 ** 8
+            try:
+                for offset in range(0, options['import_rows'], options['batch_size']):
+                    size = min(options['batch_size'], options['import_rows'] - offset)
+                    try:
+                        with transaction.atomic():
+                            bulk_upsert_professionals(professional_records(size, start=start + offset, seed=3))
+                    except OperationalError:
+                        errors['import'] += 1
+            finally:
+                importing.clear()
+                connection.close()
+
+        threads = [threading.Thread(target=read) for _ in range(options['readers'])]
+        for thread in threads:
+            thread.start()
+        started = time.perf_counter()
+        write()
+        elapsed = time.perf_counter() - started
+        for thread in threads:
+            thread.join()
+
+        return {
+            'reads': len(samples),
+            'read_p50_ms': percentile(samples, 50),
+            'read_p95_ms': percentile(samples, 95),
+            'read_p99_ms': percentile(samples, 99),
+            'read_max_ms': max(samples, default=None),
+            'read_errors': errors['read'],
+            'import_rows_per_sec': options['import_rows'] / elapsed,
+            'import_errors': errors['import'],
+        }
@@ -0,0 +1,37 @@
+"""
+Delete resume files that no professional references.
+
+    python manage.py collect_resume_files [--grace 3600] [--dry-run] [--recount]
+
+Files are shared between professionals with the same resume and reference
+counted (see ``professionals/storage.py``); this removes the ones whose
+count has dropped to zero, plus untracked files under the resume directory,
+once they have been unused for ``--grace`` seconds.
+"""
+
+from django.core.management.base import BaseCommand
+
+from professionals.storage import collect_garbage, recount_references
+
+
+class Command(BaseCommand):
+    help = 'Garbage-collect unreferenced files from the content-addressed resume storage.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--grace', type=int, default=None,
+            help='Keep files unused for fewer than this many seconds (default RESUME_STORAGE_GC_GRACE).'
+        )
+        parser.add_argument('--dry-run', action='store_true', help='Report what would be deleted without deleting it.')
+        parser.add_argument('--recount', action='store_true', help='Rebuild every reference count from the professionals table first.')
+
+    def handle(self, *args, **options):
+        if options['recount']:
+            self.stdout.write(f'Corrected {recount_references()} reference counts.')
+
+        removed = collect_garbage(grace=options['grace'], dry_run=options['dry_run'])
+        verb = 'Would delete' if options['dry_run'] else 'Deleted'
+        self.stdout.write(self.style.SUCCESS(
+            f"{verb} {removed['files']} files ({removed['bytes'] / 1024 / 1024:.1f} MiB); "
+            f"{removed['recounted']} drifted reference counts corrected."
+        ))
@@ -0,0 +1,47 @@
+"""
+Serve the OpenAI-compatible LLM stand-in until interrupted.
+
+    python manage.py llm_standin --port 8100 --latency lognormal:0.8,0.5 --error-rate 0.02 --rate-limit 20
+
+Then start the API with ``OPENAI_BASE_URL=http://127.0.0.1:8100/v1`` (and any
+``OPENAI_API_KEY``) to exercise resume parsing, retries and backoff offline.
+Answers are deterministic for a given request body; ``--seed`` fixes the
+sequence of sampled delays and injected errors.
+"""
+
+from django.core.management.base import BaseCommand
+
+from professionals.llm_standin import Latency, StandInLLMServer
+
+
+class Command(BaseCommand):
+    help = 'Run a local OpenAI-compatible chat completions server with configurable latency, errors and rate limits.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1')
+        parser.add_argument('--port', type=int, default=8100)
+        parser.add_argument(
+            '--latency', type=Latency.parse, default=Latency('fixed', 0.0),
+            help='Seconds per call, or fixed:S, uniform:LOW,HIGH, normal:MEAN,SD, lognormal:MEDIAN,SIGMA.'
+        )
+        parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of calls answered with 500.')
+        parser.add_argument('--rate-limit', type=float, default=None, help='Calls per second before 429s.')
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        server = StandInLLMServer(
+            latency=options['latency'], host=options['host'], port=options['port'],
+            error_rate=options['error_rate'], rate_limit=options['rate_limit'], seed=options['seed'],
+        )
+        self.stdout.write(
+            f"LLM stand-in on {server.base_url} (latency {options['latency']}, "
+            f"error rate {options['error_rate']}, rate limit {options['rate_limit'] or 'none'})"
+        )
+        self.stdout.write(f"Set OPENAI_BASE_URL={server.base_url} and press Ctrl-C to stop.")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.stop()
+        self.stdout.write(', '.join(f'{name}={value}' for name, value in server.stats().items()))
@@ -0,0 +1,26 @@
+"""
+Rebuild the professionals full-text search index.
+
+    python manage.py rebuild_search_index [--optimize]
+
+Triggers keep the index current on every write, so this is only needed after
+writes that bypassed them (raw imports, restored backups).
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from professionals.search import fts_enabled, rebuild_index
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the FTS5 search index from the professionals table.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--optimize', action='store_true', help='Merge index segments after rebuilding.')
+
+    def handle(self, *args, **options):
+        if not fts_enabled():
+            raise CommandError('Full-text search index is only available on SQLite.')
+
+        count = rebuild_index(optimize=options['optimize'])
+        self.stdout.write(self.style.SUCCESS(f'Indexed {count} professionals.'))
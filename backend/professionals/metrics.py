@@ -0,0 +1,179 @@
+"""
+Request and database metrics in Prometheus format.
+
+``MetricsMiddleware`` records, per URL name, method and status: request
+count and latency, database queries and time, and response bytes.
+``GET /api/metrics`` exposes them in the Prometheus text format.
+
+Queries are counted by an execute wrapper installed on every connection
+when it opens (``install_query_timer``, connected in ``apps.py``), which
+adds to the ``QueryTimer`` of the current request. The timer lives in a
+context variable, so queries that async views run through
+``sync_to_async`` are counted too. The middleware is sync and async
+capable, so under ASGI async views are not pushed into a thread.
+
+Each worker process keeps its own counters. To serve totals across
+workers (gunicorn, several runserver processes), point
+``PROMETHEUS_MULTIPROC_DIR`` at an empty directory shared by all of them,
+before they start: prometheus_client then keeps every metric in
+memory-mapped files there and ``/api/metrics`` sums them. Clear the
+directory between deployments.
+
+Streaming responses are recorded when the stream finishes, so their bytes
+and the queries issued while streaming are included.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Histogram, REGISTRY, generate_latest
+from prometheus_client import multiprocess
+
+from .conf import get_setting
+
+LABELS = ['route', 'method', 'status']
+
+REQUESTS = Counter('http_requests_total', 'Requests handled.', LABELS)
+LATENCY = Histogram(
+    'http_request_duration_seconds', 'Time to the response (or to the end of a stream).', LABELS,
+    buckets=get_setting('METRICS_LATENCY_BUCKETS'),
+)
+DB_QUERIES = Counter('http_request_db_queries_total', 'Database queries issued while handling requests.', LABELS)
+DB_TIME = Counter('http_request_db_seconds_total', 'Time spent in database queries.', LABELS)
+RESPONSE_BYTES = Counter('http_response_bytes_total', 'Response body bytes sent.', LABELS)
+
+_current_timer = ContextVar('professionals_query_timer', default=None)
+
+
+class QueryTimer:
+    """
+    Query count and time of one request.
+    """
+
+    def __init__(self):
+        self.queries = 0
+        self.seconds = 0.0
+
+    @contextmanager
+    def active(self):
+        """
+        Count the queries run in this context (and its ``sync_to_async`` calls).
+        """
+        token = _current_timer.set(self)
+        try:
+            yield self
+        finally:
+            _current_timer.reset(token)
+
+
+def install_query_timer(sender, connection, **kwargs):
+    """
+    ``connection_created`` receiver that adds the query timing wrapper once per connection.
+    """
+    if _timed_execute not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, _timed_execute)
+
+
+def _timed_execute(execute, sql, params, many, context):
+    timer = _current_timer.get()
+    if timer is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timer.seconds += time.perf_counter() - started
+        timer.queries += 1
+
+
+class MetricsMiddleware:
+    """
+    Record request metrics for every request, under its URL name.
+
+    Unresolved URLs (404s outside any route) are grouped as ``unmatched``.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        started = time.perf_counter()
+        timer = QueryTimer()
+        with timer.active():
+            response = self.get_response(request)
+        return self._finish(request, response, timer, started)
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+        timer = QueryTimer()
+        with timer.active():
+            response = await self.get_response(request)
+        return self._finish(request, response, timer, started)
+
+    def _finish(self, request, response, timer, started):
+        if not response.streaming:
+            self._record(request, response, timer, started, len(response.content))
+        elif response.is_async:
+            stream = response.streaming_content
+            response.streaming_content = self._arecorded_stream(stream, request, response, timer, started)
+        else:
+            stream = response.streaming_content
+            response.streaming_content = self._recorded_stream(stream, request, response, timer, started)
+        return response
+
+    def _recorded_stream(self, stream, request, response, timer, started):
+        sent = 0
+        chunks = iter(stream)
+        try:
+            while True:
+                # Activated per chunk: the server iterates outside the request's context.
+                with timer.active():
+                    chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                sent += len(chunk)
+                yield chunk
+        finally:
+            self._record(request, response, timer, started, sent)
+
+    async def _arecorded_stream(self, stream, request, response, timer, started):
+        sent = 0
+        try:
+            with timer.active():
+                async for chunk in stream:
+                    sent += len(chunk)
+                    yield chunk
+        finally:
+            self._record(request, response, timer, started, sent)
+
+    def _record(self, request, response, timer, started, sent):
+        match = request.resolver_match
+        route = (match.url_name or match.view_name) if match else 'unmatched'
+        labels = (route, request.method, response.status_code)
+        REQUESTS.labels(*labels).inc()
+        LATENCY.labels(*labels).observe(time.perf_counter() - started)
+        DB_QUERIES.labels(*labels).inc(timer.queries)
+        DB_TIME.labels(*labels).inc(timer.seconds)
+        RESPONSE_BYTES.labels(*labels).inc(sent)
+
+
+def render_metrics():
+    """
+    Return the Prometheus text exposition, summed across processes in multiprocess mode.
+    """
+    if 'PROMETHEUS_MULTIPROC_DIR' in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry)
@@ -0,0 +1,25 @@
+# Generated by Django 5.0.1 on 2026-10-16 20:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("professionals", "0002_alter_professional_phone"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="professional",
+            index=models.Index(
+                fields=["created_at", "id"], name="professiona_created_d71b47_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="professional",
+            index=models.Index(
+                fields=["source", "created_at", "id"],
+                name="professiona_source_22ab17_idx",
+            ),
+        ),
+    ]
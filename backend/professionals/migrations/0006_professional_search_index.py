@@ -0,0 +1,73 @@
+"""
+Full-text search index for professionals (SQLite FTS5).
+
+An external-content FTS5 table mirrors full_name, company_name, job_title and
+email. Triggers keep it in sync with every write to professionals_professional,
+including bulk_create, bulk_update and ON CONFLICT upserts. Other databases
+skip this migration; search falls back to icontains filters there.
+"""
+
+from django.db import migrations
+
+FTS_TABLE = "professionals_professional_fts"
+COLUMNS = "full_name, company_name, job_title, email"
+
+CREATE_SQL = [
+    f"""
+    CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5(
+        {COLUMNS},
+        content='professionals_professional',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    )
+    """,
+    f"""
+    CREATE TRIGGER {FTS_TABLE}_ai AFTER INSERT ON professionals_professional BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, {COLUMNS})
+        VALUES (new.id, new.full_name, new.company_name, new.job_title, new.email);
+    END
+    """,
+    f"""
+    CREATE TRIGGER {FTS_TABLE}_ad AFTER DELETE ON professionals_professional BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {COLUMNS})
+        VALUES ('delete', old.id, old.full_name, old.company_name, old.job_title, old.email);
+    END
+    """,
+    f"""
+    CREATE TRIGGER {FTS_TABLE}_au AFTER UPDATE OF {COLUMNS} ON professionals_professional BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {COLUMNS})
+        VALUES ('delete', old.id, old.full_name, old.company_name, old.job_title, old.email);
+        INSERT INTO {FTS_TABLE}(rowid, {COLUMNS})
+        VALUES (new.id, new.full_name, new.company_name, new.job_title, new.email);
+    END
+    """,
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+
+DROP_SQL = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+
+def _run_on_sqlite(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != "sqlite":
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+
+    return run
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("professionals", "0005_parsedresume"),
+    ]
+
+    operations = [
+        migrations.RunPython(_run_on_sqlite(CREATE_SQL), _run_on_sqlite(DROP_SQL)),
+    ]
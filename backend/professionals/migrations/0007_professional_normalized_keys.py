@@ -0,0 +1,132 @@
+"""
+Canonical dedup keys for professionals.
+
+Adds ``email_normalized`` and ``phone_e164``, backfills them in chunks of
+``BACKFILL_CHUNK_SIZE`` rows, then makes each unique. Existing rows that
+normalize to the same key (``Jane@X.com`` and ``jane@x.com``) are
+duplicates: the oldest row keeps the key and the others are left NULL, so
+the unique indexes can be built without deleting or merging data. Their
+count is logged as a warning; they are the rows with an email or phone but
+a NULL key, and should be merged by hand. Until then, saving one with its
+duplicate email or phone is rejected with a validation error.
+
+The normalization is a frozen copy of ``professionals/normalize.py`` as of
+this migration, so later changes there do not change what it backfills.
+"""
+
+import logging
+import re
+
+from django.conf import settings
+from django.db import migrations, models
+
+logger = logging.getLogger(__name__)
+
+BACKFILL_CHUNK_SIZE = 2000
+NON_DIGIT_RE = re.compile(r"\D+")
+EXTENSION_RE = re.compile(r"\s*(?:ext\.?|x|#)\s*\d+\s*$", re.IGNORECASE)
+
+
+def normalize_email(value):
+    if not value:
+        return None
+    return value.strip().lower() or None
+
+
+def normalize_phone(value, country_code):
+    if not value:
+        return None
+    value = EXTENSION_RE.sub("", value).strip()
+    digits = NON_DIGIT_RE.sub("", value)
+    if not digits:
+        return None
+
+    if value.startswith("+"):
+        return "+" + digits
+    if digits.startswith("00"):
+        return "+" + digits[2:]
+    if digits.startswith(country_code) and len(digits) > 10:
+        return "+" + digits
+    if digits.startswith("0"):
+        digits = digits[1:]
+    return "+" + country_code + digits
+
+
+def backfill_normalized_keys(apps, schema_editor):
+    Professional = apps.get_model("professionals", "Professional")
+    # The keys must match what the app computes on save, so the deployment's
+    # country code is used (the setting, not the app's code).
+    country_code = getattr(settings, "PROFESSIONALS", {}).get("PHONE_DEFAULT_COUNTRY_CODE", "1")
+    seen = {"email_normalized": set(), "phone_e164": set()}
+    unkeyed = []
+    last_id = 0
+
+    with schema_editor.connection.cursor() as cursor:
+        while True:
+            rows = list(
+                Professional.objects.filter(id__gt=last_id)
+                .order_by("id")
+                .values_list("id", "email", "phone")[:BACKFILL_CHUNK_SIZE]
+            )
+            if not rows:
+                break
+            last_id = rows[-1][0]
+
+            updates = []
+            for pk, email, phone in rows:
+                keys = {"email_normalized": normalize_email(email), "phone_e164": normalize_phone(phone, country_code)}
+                for field, value in keys.items():
+                    if value in seen[field]:
+                        keys[field] = None
+                        unkeyed.append(pk)
+                    elif value:
+                        seen[field].add(value)
+                updates.append((keys["email_normalized"], keys["phone_e164"], pk))
+
+            cursor.executemany(
+                f"UPDATE {Professional._meta.db_table} SET email_normalized = %s, phone_e164 = %s WHERE id = %s",
+                updates,
+            )
+
+    if unkeyed:
+        ids = sorted(set(unkeyed))
+        logger.warning("%d duplicate professionals left without a normalized key, e.g. ids %s", len(ids), ids[:20])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("professionals", "0006_professional_search_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="professional",
+            name="email_normalized",
+            field=models.CharField(blank=True, editable=False, max_length=254, null=True),
+        ),
+        migrations.AddField(
+            model_name="professional",
+            name="phone_e164",
+            field=models.CharField(blank=True, editable=False, max_length=50, null=True),
+        ),
+        migrations.RunPython(backfill_normalized_keys, migrations.RunPython.noop),
+        # Partial unique constraints are added as plain CREATE UNIQUE INDEX
+        # statements; SQLite would otherwise rebuild the table and drop the
+        # search triggers from 0006.
+        migrations.AddConstraint(
+            model_name="professional",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("email_normalized__isnull", False)),
+                fields=("email_normalized",),
+                name="professional_unique_email_normalized",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="professional",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("phone_e164__isnull", False)),
+                fields=("phone_e164",),
+                name="professional_unique_phone_e164",
+            ),
+        ),
+    ]
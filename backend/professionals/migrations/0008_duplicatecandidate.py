@@ -0,0 +1,98 @@
+# Generated by Django 5.0.1 on 2026-10-16 21:07
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("professionals", "0007_professional_normalized_keys"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DedupRun",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("started_at", models.DateTimeField()),
+                ("finished_at", models.DateTimeField(auto_now_add=True)),
+                ("full", models.BooleanField(default=False)),
+                ("rows_scanned", models.PositiveIntegerField(default=0)),
+                ("rows_changed", models.PositiveIntegerField(default=0)),
+                ("pairs_compared", models.PositiveBigIntegerField(default=0)),
+                ("blocks_skipped", models.PositiveIntegerField(default=0)),
+                ("candidates", models.PositiveIntegerField(default=0)),
+                ("elapsed_ms", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "ordering": ["-started_at"],
+            },
+        ),
+        migrations.CreateModel(
+            name="DuplicateCandidate",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("score", models.PositiveSmallIntegerField()),
+                ("reasons", models.JSONField(default=list)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("pending", "Pending"), ("dismissed", "Dismissed")],
+                        default="pending",
+                        max_length=20,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "professional_a",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="professionals.professional",
+                    ),
+                ),
+                (
+                    "professional_b",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="professionals.professional",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["-score", "id"],
+                "indexes": [
+                    models.Index(
+                        fields=["status", "-score"],
+                        name="professiona_status_fa710c_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="duplicatecandidate",
+            constraint=models.UniqueConstraint(
+                fields=("professional_a", "professional_b"),
+                name="duplicate_candidate_pair",
+            ),
+        ),
+    ]
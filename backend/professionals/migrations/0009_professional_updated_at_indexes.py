@@ -0,0 +1,25 @@
+# Generated by Django 5.0.1 on 2026-10-16 21:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("professionals", "0008_duplicatecandidate"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="professional",
+            index=models.Index(
+                fields=["updated_at"], name="professiona_updated_f2b9bd_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="professional",
+            index=models.Index(
+                fields=["source", "updated_at"], name="professiona_source_4872ce_idx"
+            ),
+        ),
+    ]
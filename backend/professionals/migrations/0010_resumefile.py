@@ -0,0 +1,58 @@
+# Generated by Django 5.0.1 on 2026-10-16 22:52
+
+import professionals.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("professionals", "0009_professional_updated_at_indexes"),
+    ]
+
+    operations = [
+        # The storage backend does not change the column. Applied to the
+        # database, SQLite would rebuild the table and drop the search
+        # triggers from 0006.
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AlterField(
+                    model_name="professional",
+                    name="resume",
+                    field=models.FileField(
+                        blank=True,
+                        null=True,
+                        storage=professionals.storage.ContentAddressedStorage(),
+                        upload_to="resumes/",
+                    ),
+                ),
+            ],
+        ),
+        migrations.CreateModel(
+            name="ResumeFile",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("name", models.CharField(max_length=255, unique=True)),
+                ("size", models.BigIntegerField()),
+                ("ref_count", models.PositiveIntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["ref_count", "updated_at"],
+                        name="professiona_ref_cou_8ec0f4_idx",
+                    )
+                ],
+            },
+        ),
+    ]
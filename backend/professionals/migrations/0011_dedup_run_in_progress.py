@@ -0,0 +1,18 @@
+# Generated by Django 5.0.1 on 2026-10-16 23:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("professionals", "0010_resumefile"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="deduprun",
+            name="finished_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
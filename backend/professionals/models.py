@@ -1,4 +1,74 @@
+import uuid
+from collections import Counter
+
+from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models import Q
+
+from . import list_cache, storage
+from .normalize import normalized_keys
+
+
+KEY_SOURCE_FIELDS = {'email', 'phone'}
+KEY_FIELDS = ['email_normalized', 'phone_e164']
+# The field each key is computed from, for error messages.
+KEY_SOURCES = {'email_normalized': 'email', 'phone_e164': 'phone'}
+
+
+class ProfessionalQuerySet(models.QuerySet):
+    """
+    Keeps the normalized dedup keys filled and the list cache invalidated on
+    bulk writes, which skip ``save()`` and ``delete()``.
+    """
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = list(objs)
+        for obj in objs:
+            obj.normalize_keys()
+        if kwargs.get('update_fields'):
+            kwargs['update_fields'] = _with_key_fields(kwargs['update_fields'])
+        created = super().bulk_create(objs, *args, **kwargs)
+        list_cache.invalidate(_touched_sources(objs))
+        return created
+
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        objs = list(objs)
+        if KEY_SOURCE_FIELDS.intersection(fields):
+            for obj in objs:
+                obj.normalize_keys()
+            fields = _with_key_fields(fields)
+        updated = super().bulk_update(objs, fields, *args, **kwargs)
+        list_cache.invalidate(_touched_sources(objs))
+        return updated
+
+    def delete(self):
+        sources = set(self.order_by().values_list('source', flat=True).distinct())
+        resumes = Counter(self.order_by().exclude(resume='').exclude(resume__isnull=True).values_list('resume', flat=True))
+        deleted = super().delete()
+        list_cache.invalidate(sources)
+        for name, count in resumes.items():
+            storage.release(name, count)
+        return deleted
+
+
+def _with_key_fields(fields):
+    return list(fields) + [field for field in KEY_FIELDS if field not in fields]
+
+
+def _key_conflict_message(field):
+    return f"Professional with this {field} already exists."
+
+
+def _touched_sources(objs):
+    """
+    Sources whose cached list pages a write to ``objs`` affects: the new
+    source of each row and the one it was loaded with.
+    """
+    sources = set()
+    for obj in objs:
+        sources.add(obj.source)
+        sources.add(getattr(obj, '_loaded_source', None))
+    return sources
 
 
 class Professional(models.Model):
@@ -17,17 +87,252 @@ class Professional(models.Model):
     job_title = models.CharField(max_length=255, null=True, blank=True)
     phone = models.CharField(max_length=50, unique=True, null=True, blank=True)
     source = models.CharField(max_length=20, choices=SOURCE_CHOICES)
-    resume = models.FileField(upload_to='resumes/', null=True, blank=True)
+    # Stored once per distinct content and reference counted (see storage.py).
+    resume = models.FileField(upload_to='resumes/', storage=storage.resume_storage, null=True, blank=True)
+    # Canonical dedup keys derived from email and phone (see normalize.py).
+    email_normalized = models.CharField(max_length=254, null=True, blank=True, editable=False)
+    phone_e164 = models.CharField(max_length=50, null=True, blank=True, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = ProfessionalQuerySet.as_manager()
+
     class Meta:
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['email']),
             models.Index(fields=['phone']),
             models.Index(fields=['source']),
+            # Keyset pagination walks (created_at, id), optionally within a source.
+            models.Index(fields=['created_at', 'id']),
+            models.Index(fields=['source', 'created_at', 'id']),
+            # MAX(updated_at) for the list's conditional GET validators.
+            models.Index(fields=['updated_at']),
+            models.Index(fields=['source', 'updated_at']),
+        ]
+        constraints = [
+            # Partial unique indexes: SQLite adds these without rebuilding the
+            # table, which would drop the search triggers.
+            models.UniqueConstraint(
+                fields=['email_normalized'],
+                condition=Q(email_normalized__isnull=False),
+                name='professional_unique_email_normalized',
+            ),
+            models.UniqueConstraint(
+                fields=['phone_e164'],
+                condition=Q(phone_e164__isnull=False),
+                name='professional_unique_phone_e164',
+            ),
         ]
 
     def __str__(self):
         return f"{self.full_name} ({self.source})"
+
+    def normalize_keys(self):
+        """
+        Recompute ``email_normalized`` and ``phone_e164`` from email and phone.
+        """
+        for field, value in normalized_keys({'email': self.email, 'phone': self.phone}).items():
+            setattr(self, field, value)
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored source so moving a row between sources
+        # invalidates the cached pages of both.
+        instance._loaded_source = instance.__dict__.get('source')
+        # And the stored resume, to move its reference count when it changes
+        # (unless it was deferred: then save() does not write it).
+        if 'resume' in instance.__dict__:
+            instance._loaded_resume = instance.__dict__['resume'] or None
+        return instance
+
+    def key_conflicts(self):
+        """
+        Return ``{field: message}`` for each normalized key another professional holds.
+        """
+        others = Professional.objects.exclude(pk=self.pk)
+        return {
+            field: _key_conflict_message(field)
+            for key, field in KEY_SOURCES.items()
+            if getattr(self, key) and others.filter(**{key: getattr(self, key)}).exists()
+        }
+
+    def validate_constraints(self, exclude=None):
+        # The key constraints are checked here, on the email and phone fields
+        # forms edit, rather than on the generated key columns.
+        exclude = set(exclude or ()) | set(KEY_FIELDS)
+        errors = {}
+        try:
+            super().validate_constraints(exclude=exclude)
+        except ValidationError as e:
+            errors = e.update_error_dict(errors)
+        if not KEY_SOURCE_FIELDS.issubset(exclude):
+            self.normalize_keys()
+            for field, message in self.key_conflicts().items():
+                if field not in exclude:
+                    errors.setdefault(field, []).append(message)
+        if errors:
+            raise ValidationError(errors)
+
+    def save(self, *args, **kwargs):
+        self.normalize_keys()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = _with_key_fields(update_fields)
+        tracked = self._state.adding or hasattr(self, '_loaded_resume')
+        super().save(*args, **kwargs)
+        list_cache.invalidate(_touched_sources([self]))
+        self._loaded_source = self.source
+        if tracked and (update_fields is None or 'resume' in update_fields):
+            self._update_resume_references()
+
+    def delete(self, *args, **kwargs):
+        deleted = super().delete(*args, **kwargs)
+        list_cache.invalidate(_touched_sources([self]))
+        storage.release(getattr(self, '_loaded_resume', self.resume.name))
+        return deleted
+
+    def _update_resume_references(self):
+        name = self.resume.name or None
+        loaded = getattr(self, '_loaded_resume', None)
+        if name != loaded:
+            storage.retain(name)
+            storage.release(loaded)
+        self._loaded_resume = name
+
+
+class ParseJob(models.Model):
+    """
+    A resume parse queued by ``POST /api/professionals/parse-resume?async=1``
+    and run by the local worker pool in ``jobs.py``.
+    """
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    SUCCEEDED = 'succeeded'
+    FAILED = 'failed'
+    STATUS_CHOICES = [
+        (QUEUED, 'Queued'),
+        (RUNNING, 'Running'),
+        (SUCCEEDED, 'Succeeded'),
+        (FAILED, 'Failed'),
+    ]
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=QUEUED)
+    file_name = models.CharField(max_length=255)
+    # The uploaded PDF, cleared once the job finishes.
+    pdf_data = models.BinaryField(blank=True)
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.file_name} ({self.status})"
+
+
+class ParsedResume(models.Model):
+    """
+    Persistent tier of the resume parse cache, keyed by the SHA-256 of the
+    PDF plus the model and prompt version (see ``resume_cache.py``).
+    """
+    key = models.CharField(max_length=128, unique=True)
+    result = models.JSONField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_used_at = models.DateTimeField()
+    expires_at = models.DateTimeField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['last_used_at']),
+        ]
+
+    def __str__(self):
+        return self.key
+
+
+class ResumeFile(models.Model):
+    """
+    A file in the content-addressed resume storage and how many
+    professionals reference it (see ``storage.py``).
+    """
+    name = models.CharField(max_length=255, unique=True)
+    size = models.BigIntegerField()
+    ref_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    # Last upload or reference change; garbage collection waits out a grace period after it.
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['ref_count', 'updated_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.ref_count} references)"
+
+
+class DuplicateCandidate(models.Model):
+    """
+    A pair of professionals that look like the same person, found by
+    ``find_duplicates`` (see ``dedup.py``). ``professional_a`` always has the
+    lower id.
+    """
+    PENDING = 'pending'
+    DISMISSED = 'dismissed'
+    STATUS_CHOICES = [
+        (PENDING, 'Pending'),
+        (DISMISSED, 'Dismissed'),
+    ]
+
+    professional_a = models.ForeignKey(Professional, on_delete=models.CASCADE, related_name='+')
+    professional_b = models.ForeignKey(Professional, on_delete=models.CASCADE, related_name='+')
+    score = models.PositiveSmallIntegerField()
+    # Blocking keys the pair shares ('name', 'company', 'email', 'domain', 'phone').
+    reasons = models.JSONField(default=list)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=PENDING)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['-score', 'id']
+        constraints = [
+            models.UniqueConstraint(fields=['professional_a', 'professional_b'], name='duplicate_candidate_pair'),
+        ]
+        indexes = [
+            models.Index(fields=['status', '-score']),
+        ]
+
+    def __str__(self):
+        return f"{self.professional_a_id} ~ {self.professional_b_id} ({self.score})"
+
+
+class DedupRun(models.Model):
+    """
+    One ``find_duplicates`` run. The next incremental run compares rows
+    updated since the latest finished run's ``started_at``. A run in
+    progress has no ``finished_at``.
+    """
+    started_at = models.DateTimeField()
+    finished_at = models.DateTimeField(null=True, blank=True)
+    full = models.BooleanField(default=False)
+    rows_scanned = models.PositiveIntegerField(default=0)
+    rows_changed = models.PositiveIntegerField(default=0)
+    pairs_compared = models.PositiveBigIntegerField(default=0)
+    blocks_skipped = models.PositiveIntegerField(default=0)
+    candidates = models.PositiveIntegerField(default=0)
+    elapsed_ms = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ['-started_at']
+
+    def __str__(self):
+        return f"{'Full' if self.full else 'Incremental'} run at {self.started_at}"
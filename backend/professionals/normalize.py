@@ -0,0 +1,76 @@
+"""
+Canonical forms of the keys professionals are deduplicated on.
+
+``email`` and ``phone`` are stored as entered. Their canonical forms live in
+the indexed ``email_normalized`` and ``phone_e164`` columns, so
+``Jane@X.com`` and ``jane@x.com``, or ``+1 (555) 123-4567`` and
+``555-123-4567``, find the same row with one index probe. Both columns are
+filled in ``Professional.save()`` and by the bulk upsert path, which writes
+with ``bulk_create`` and so bypasses ``save()``.
+"""
+
+import re
+from typing import Dict, Optional
+
+from .conf import get_setting
+
+NON_DIGIT_RE = re.compile(r'\D+')
+# A trailing extension ("x12", "ext. 12", "#12") is not part of the number.
+EXTENSION_RE = re.compile(r'\s*(?:ext\.?|x|#)\s*\d+\s*$', re.IGNORECASE)
+
+
+def normalize_email(value: Optional[str]) -> Optional[str]:
+    """
+    Return ``value`` trimmed and lower-cased, or None if it is empty.
+    """
+    if not value:
+        return None
+    return value.strip().lower() or None
+
+
+def normalize_phone(value: Optional[str], country_code: Optional[str] = None) -> Optional[str]:
+    """
+    Return ``value`` in E.164 form (``+`` and digits only), or None if it has no digits.
+
+    Numbers written with ``+`` or an ``00`` international prefix keep their
+    country code. Anything else is a national number: a leading trunk ``0``
+    is dropped and ``country_code`` is prepended unless the number already
+    starts with it.
+
+    Args:
+        value: Phone number as entered
+        country_code: Country code for national numbers (defaults to
+            ``PHONE_DEFAULT_COUNTRY_CODE``)
+
+    Returns:
+        str: The canonical number, or None
+    """
+    if not value:
+        return None
+    value = EXTENSION_RE.sub('', value).strip()
+    digits = NON_DIGIT_RE.sub('', value)
+    if not digits:
+        return None
+
+    if value.startswith('+'):
+        return '+' + digits
+    if digits.startswith('00'):
+        return '+' + digits[2:]
+
+    if country_code is None:
+        country_code = get_setting('PHONE_DEFAULT_COUNTRY_CODE')
+    if digits.startswith(country_code) and len(digits) > 10:
+        return '+' + digits
+    if digits.startswith('0'):
+        digits = digits[1:]
+    return '+' + country_code + digits
+
+
+def normalized_keys(data: Dict[str, Optional[str]]) -> Dict[str, Optional[str]]:
+    """
+    Return the ``email_normalized`` and ``phone_e164`` values for a record.
+    """
+    return {
+        'email_normalized': normalize_email(data.get('email')),
+        'phone_e164': normalize_phone(data.get('phone')),
+    }
@@ -0,0 +1,145 @@
+"""
+Keyset (cursor) pagination for the professionals list.
+
+Pages are ordered newest first by ``(created_at, id)`` and each page is
+fetched with a range condition on that key instead of an OFFSET, so a deep
+page costs the same as the first one.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from django.db.models import Q
+
+ORDERING = ['-created_at', '-id']
+
+
+class PaginationError(ValueError):
+    """Raised when the cursor or limit query parameter is malformed."""
+
+
+class KeysetPagination:
+    """
+    Opt-in pagination for ``GET /api/professionals/``.
+
+    Enabled when the request carries a ``limit`` or ``cursor`` parameter.
+    Responses carry opaque ``next``/``prev`` cursors that encode the
+    ``(created_at, id)`` key of the page edge and the direction to read in.
+    """
+    default_limit = 50
+    max_limit = 500
+
+    def __init__(self):
+        self.next_cursor = None
+        self.prev_cursor = None
+        self.limit = self.default_limit
+
+    @staticmethod
+    def is_requested(request):
+        return 'limit' in request.query_params or 'cursor' in request.query_params
+
+    def paginate_queryset(self, queryset, request, cursor_key=None):
+        """
+        Return one page of ``queryset`` as a list of its rows.
+
+        ``cursor_key`` maps a row to its ``(created_at, id)`` key; the default
+        reads model instances, pass ``ProfessionalReader.cursor_key`` for
+        ``values_list()`` rows.
+
+        Raises:
+            PaginationError: If ``limit`` or ``cursor`` is malformed
+        """
+        window, cursor, direction = self._window(queryset, request)
+        return self._page(list(window), cursor, direction, cursor_key)
+
+    async def apaginate_queryset(self, queryset, request, cursor_key=None):
+        """
+        Async ``paginate_queryset``, for async views.
+        """
+        window, cursor, direction = self._window(queryset, request)
+        return self._page([row async for row in window], cursor, direction, cursor_key)
+
+    def _window(self, queryset, request):
+        """
+        Return the unevaluated ``limit + 1`` rows to read, the cursor and the direction.
+        """
+        self.limit = self._get_limit(request)
+        cursor = request.query_params.get('cursor')
+        created_at, pk, direction = self.decode_cursor(cursor) if cursor else (None, None, 'next')
+
+        if direction == 'next':
+            if cursor:
+                queryset = queryset.filter(
+                    Q(created_at__lte=created_at) & (Q(created_at__lt=created_at) | Q(id__lt=pk))
+                )
+            return queryset.order_by(*ORDERING)[:self.limit + 1], cursor, direction
+
+        queryset = queryset.filter(
+            Q(created_at__gte=created_at) & (Q(created_at__gt=created_at) | Q(id__gt=pk))
+        )
+        return queryset.order_by('created_at', 'id')[:self.limit + 1], cursor, direction
+
+    def _page(self, rows, cursor, direction, cursor_key):
+        has_more = len(rows) > self.limit
+        if direction == 'next':
+            page = rows[:self.limit]
+            has_next, has_prev = has_more, bool(cursor)
+        else:
+            page = rows[:self.limit][::-1]
+            has_next, has_prev = True, has_more
+
+        cursor_key = cursor_key or _instance_key
+        if page:
+            self.next_cursor = self.encode_cursor(*cursor_key(page[-1]), 'next') if has_next else None
+            self.prev_cursor = self.encode_cursor(*cursor_key(page[0]), 'prev') if has_prev else None
+        return page
+
+    def get_response_data(self, data):
+        return {
+            'results': data,
+            'next': self.next_cursor,
+            'prev': self.prev_cursor,
+            'limit': self.limit,
+        }
+
+    @staticmethod
+    def encode_cursor(created_at, pk, direction):
+        payload = json.dumps({
+            'c': created_at.isoformat(),
+            'i': pk,
+            'd': direction,
+        }, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+    @staticmethod
+    def decode_cursor(cursor):
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+            created_at = datetime.fromisoformat(payload['c'])
+            pk = int(payload['i'])
+            direction = payload['d']
+        except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError):
+            raise PaginationError("Invalid cursor.")
+
+        if direction not in ('next', 'prev'):
+            raise PaginationError("Invalid cursor.")
+        return created_at, pk, direction
+
+    def _get_limit(self, request):
+        raw = request.query_params.get('limit')
+        if raw is None:
+            return self.default_limit
+        try:
+            limit = int(raw)
+        except ValueError:
+            raise PaginationError("limit must be a positive integer.")
+        if limit < 1:
+            raise PaginationError("limit must be a positive integer.")
+        return min(limit, self.max_limit)
+
+
+def _instance_key(professional):
+    return professional.created_at, professional.pk
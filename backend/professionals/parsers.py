@@ -0,0 +1,44 @@
+"""
+Request parsers for the professionals API.
+"""
+
+import json
+
+from django.conf import settings
+from rest_framework.parsers import BaseParser
+
+
+class InvalidLine:
+    """
+    Placeholder yielded for an NDJSON line that is not valid JSON.
+    """
+
+    def __init__(self, text, error):
+        self.text = text
+        self.error = error
+
+
+class NDJSONParser(BaseParser):
+    """
+    Parses ``application/x-ndjson`` bodies (one JSON record per line) lazily.
+
+    ``request.data`` becomes a generator that reads the request stream line by
+    line, so a large upload is never held in memory as a whole. Blank lines
+    are skipped and undecodable lines are yielded as ``InvalidLine``.
+    """
+    media_type = 'application/x-ndjson'
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get('encoding', settings.DEFAULT_CHARSET)
+        return self._iter_records(stream, encoding)
+
+    def _iter_records(self, stream, encoding):
+        for raw in stream:
+            text = raw.decode(encoding, errors='replace').strip()
+            if not text:
+                continue
+            try:
+                yield json.loads(text)
+            except json.JSONDecodeError as e:
+                yield InvalidLine(text, str(e))
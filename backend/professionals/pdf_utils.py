@@ -8,29 +8,152 @@ For production use, consider more robust solutions like:
 - LLM APIs (OpenAI, Anthropic) for intelligent field extraction
 """
 
+import io
+import os
 import PyPDF2
 import re
-from typing import Dict, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
+# Fields reported by the parsers, in the order of the LLM response schema.
+PROFESSIONAL_FIELDS = ['full_name', 'email', 'phone', 'company_name', 'job_title']
 
-def extract_text_from_pdf(pdf_file) -> str:
+EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+# Either an international number ("+" and a country code, then digit groups),
+# an unformatted North American one (10 digits, or 11 with the leading 1), or
+# a local one whose first group is an area code: 2-3 digits, 4 if it starts
+# with the trunk 0, or any parenthesised group, followed by a separator and
+# optionally preceded by the "1-" trunk prefix. That shape rules out years,
+# date ranges and zip+4 codes, none of which start with a short separated
+# group. A bare 10-digit ID has the same shape as an unformatted number, so
+# callers skip matches labelled as references (see ``_is_reference``). A
+# match never starts or ends inside a longer word, number, dashed run or
+# email address. The leading lookahead lets the regex engine skip positions
+# that cannot start a number.
+PHONE_RE = re.compile(
+    r'(?=[+(\d])(?<![\w+/$-])'
+    r'(?:\+\d{1,3}(?:[ .-]?\(\d{1,4}\))?(?:[ .-]?\d{1,8}){1,5}'
+    r'|1?\d{10}'
+    r'|(?:1[ .-])?(?:\(\d{2,4}\)[ .-]?|(?:0\d{3}|\d{2,3})[ .-])\d{2,8}(?:[ .-]\d{2,8}){0,3})'
+    r'(?![\w/@-])'
+)
+# Labels that mark the number after them as a reference, not a phone number.
+REFERENCE_LABEL_RE = re.compile(r'(?:\bref|\bid|\bno|#|\binvoice|\border|\bcase|\baccount)\.?:? ?$', re.IGNORECASE)
+TITLE_AT_COMPANY_RE = re.compile(
+    r'^(?P<title>[A-Z][\w/&,.\- ]{1,60}?)\s+(?:at|@)\s+(?P<company>[A-Z0-9][\w&,.\- ]{0,60}?)\s*$'
+)
+# Lines near the top of a resume searched for the name and current role.
+HEADER_LINES = 15
+
+
+def iter_pdf_pages(pdf_file, max_pages: Optional[int] = None) -> Iterator[str]:
+    """
+    Yield the text of each page in order, decoding pages only as they are consumed.
+
+    Args:
+        pdf_file: A file object or file-like object containing PDF data
+        max_pages: Stop after this many pages (None reads every page)
+
+    Yields:
+        str: Text of one page
+    """
+    try:
+        pdf_reader = PyPDF2.PdfReader(pdf_file)
+        pages = pdf_reader.pages
+        count = len(pages) if max_pages is None else min(max_pages, len(pages))
+    except Exception as e:
+        raise ValueError(f"Failed to extract text from PDF: {str(e)}")
+
+    for number in range(count):
+        try:
+            text = pages[number].extract_text()
+        except Exception as e:
+            raise ValueError(f"Failed to extract text from PDF: {str(e)}")
+        yield text
+
+
+def extract_text_from_pdf(pdf_file, max_pages: Optional[int] = None, processes: int = 1) -> str:
     """
     Extract text content from a PDF file.
 
     Args:
         pdf_file: A file object or file-like object containing PDF data
+        max_pages: Only read the first ``max_pages`` pages (None reads all)
+        processes: Split the pages across up to this many worker processes
+            (capped at the CPU count); worth it only for long documents,
+            since each worker re-parses the file
 
     Returns:
-        str: Extracted text content from all pages
+        str: Extracted text content from the pages read
     """
+    if min(processes, os.cpu_count() or 1) > 1:
+        pages = _extract_pages_parallel(pdf_file, max_pages, processes)
+    else:
+        pages = iter_pdf_pages(pdf_file, max_pages)
+    return "\n".join(pages).strip()
+
+
+def extract_until_found(
+    pdf_file,
+    fields: Iterable[str],
+    min_confidence: int = 80,
+    max_pages: Optional[int] = None,
+) -> Tuple[str, Dict[str, object]]:
+    """
+    Read pages until every field in ``fields`` reaches ``min_confidence``.
+
+    Contact details are almost always on the first page, so long CVs stop
+    after a page or two instead of being decoded in full.
+
+    Args:
+        pdf_file: A file object or file-like object containing PDF data
+        fields: Field names that must be found before stopping early
+        min_confidence: Confidence a field needs to count as found
+        max_pages: Never read past this many pages (None reads all)
+
+    Returns:
+        tuple: (text read so far, scored fields as from extract_professional_info_scored)
+    """
+    fields = list(fields)
+    pages = []
+    scorer = FieldScorer()
+    info = scorer.result()
+
+    for page in iter_pdf_pages(pdf_file, max_pages):
+        pages.append(page)
+        scorer.feed(page)
+        info = scorer.result()
+        if all(info['confidence'][field] >= min_confidence for field in fields):
+            break
+
+    return "\n".join(pages).strip(), info
+
+
+def _extract_pages_parallel(pdf_file, max_pages, processes):
+    """
+    Extract contiguous page ranges in a process pool, returning pages in order.
+    """
+    pdf_file.seek(0)
+    data = pdf_file.read()
     try:
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-        text = ""
+        count = len(PyPDF2.PdfReader(io.BytesIO(data)).pages)
+    except Exception as e:
+        raise ValueError(f"Failed to extract text from PDF: {str(e)}")
+    if max_pages is not None:
+        count = min(count, max_pages)
+
+    step = -(-count // processes) or 1
+    ranges = [(data, start, min(start + step, count)) for start in range(0, count, step)]
+    with ProcessPoolExecutor(max_workers=min(processes, len(ranges) or 1)) as executor:
+        chunks = list(executor.map(_extract_page_range, ranges))
+    return [page for chunk in chunks for page in chunk]
 
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
 
-        return text.strip()
+def _extract_page_range(args):
+    data, start, stop = args
+    pages = PyPDF2.PdfReader(io.BytesIO(data)).pages
+    try:
+        return [pages[number].extract_text() for number in range(start, stop)]
     except Exception as e:
         raise ValueError(f"Failed to extract text from PDF: {str(e)}")
 
@@ -45,43 +168,31 @@ def extract_professional_info(pdf_text: str) -> Dict[str, Optional[str]]:
     - LLM-based extraction (GPT-4, Claude, etc.)
     - Specialized resume parsing APIs
 
+    Email and phone each take one scan with a module-level compiled
+    pattern. The phone pattern only accepts phone-shaped numbers and
+    candidates need 10-15 digits, so dates, years and ID numbers earlier in
+    the text are skipped rather than returned.
+
     Args:
         pdf_text: Text extracted from resume PDF
 
     Returns:
         dict: Dictionary containing extracted fields
     """
-    info = {
-        'full_name': None,
-        'email': None,
-        'phone': None,
-        'company_name': None,
-        'job_title': None,
-    }
-
-    # Extract email using regex
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    email_match = re.search(email_pattern, pdf_text)
+    info = dict.fromkeys(PROFESSIONAL_FIELDS)
+
+    email_match = EMAIL_RE.search(pdf_text)
     if email_match:
         info['email'] = email_match.group(0)
 
-    # Extract phone number (multiple formats)
-    phone_patterns = [
-        r'\+?\d{1,3}[-.\s]?\(?\d{1,4}\)?[-.\s]?\d{1,4}[-.\s]?\d{1,9}',
-        r'\(\d{3}\)\s*\d{3}-\d{4}',
-        r'\d{3}-\d{3}-\d{4}',
-    ]
-    for pattern in phone_patterns:
-        phone_match = re.search(pattern, pdf_text)
-        if phone_match:
-            info['phone'] = phone_match.group(0)
+    for match in PHONE_RE.finditer(pdf_text):
+        if _phone_candidate(pdf_text, match):
+            info['phone'] = match.group(0)
             break
 
-    # Extract name (first few words, heuristic - often resume starts with name)
-    lines = [line.strip() for line in pdf_text.split('\n') if line.strip()]
-    if lines:
-        # Assume first non-empty line might be the name
-        potential_name = lines[0]
+    # Extract name (heuristic - often resume starts with name)
+    potential_name = _first_line(pdf_text)
+    if potential_name:
         # Basic validation: name should be 2-4 words, mostly letters
         words = potential_name.split()
         if 2 <= len(words) <= 4 and all(word.replace('.', '').replace(',', '').isalpha() for word in words):
@@ -93,6 +204,142 @@ def extract_professional_info(pdf_text: str) -> Dict[str, Optional[str]]:
     return info
 
 
+def extract_professional_info_batch(
+    texts: Iterable[str], processes: int = 1, chunksize: int = 500
+) -> List[Dict[str, Optional[str]]]:
+    """
+    Run ``extract_professional_info`` over many texts.
+
+    Args:
+        texts: Resume texts
+        processes: Spread the work over up to this many worker processes
+            (capped at the CPU count)
+        chunksize: Texts sent to a worker per task when using processes
+
+    Returns:
+        list: One result dict per text, in input order
+    """
+    processes = min(processes, os.cpu_count() or 1)
+    if processes > 1:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            return list(executor.map(extract_professional_info, texts, chunksize=chunksize))
+    return [extract_professional_info(text) for text in texts]
+
+
+def phone_digits(candidate: str) -> int:
+    """
+    Return how many digits a phone candidate has; 10-15 is a full number.
+    """
+    return sum(map(str.isdigit, candidate))
+
+
+def _phone_candidate(text: str, match) -> bool:
+    """
+    Whether a ``PHONE_RE`` match is accepted as a phone number: 10-15 digits
+    and not labelled as a reference. Shorter numbers (local 7-digit ones,
+    SSN-shaped 3-2-4 groups) are too ambiguous to report.
+    """
+    return 10 <= phone_digits(match.group(0)) <= 15 and not _is_reference(text, match)
+
+
+def _is_reference(text: str, match) -> bool:
+    start = match.start()
+    return bool(REFERENCE_LABEL_RE.search(text, max(0, start - 12), start))
+
+
+def _first_line(text: str) -> Optional[str]:
+    for line in text.split('\n', HEADER_LINES):
+        line = line.strip()
+        if line:
+            return line
+    return None
+
+
+def extract_professional_info_scored(pdf_text: str) -> Dict[str, object]:
+    """
+    Extract professional information with a 0-100 confidence per field.
+
+    Returns the same shape as the LLM parser (the fields plus a
+    ``confidence`` dict), so callers can decide field by field whether the
+    local result is good enough. Missing fields are None with confidence 0.
+
+    Args:
+        pdf_text: Text extracted from resume PDF
+
+    Returns:
+        dict: Extracted fields and their confidence scores
+    """
+    scorer = FieldScorer()
+    scorer.feed(pdf_text)
+    return scorer.result()
+
+
+class FieldScorer:
+    """
+    Incremental form of ``extract_professional_info_scored``.
+
+    Text is fed a page at a time and each page is scanned once, so checking
+    the result after every page stays linear in the document length.
+    """
+
+    def __init__(self):
+        self.header = []
+        self.emails = []
+        self.phone = None
+
+    def feed(self, text: str) -> None:
+        if len(self.header) < HEADER_LINES:
+            for line in text.split('\n'):
+                line = line.strip()
+                if line:
+                    self.header.append(line)
+                    if len(self.header) == HEADER_LINES:
+                        break
+
+        # Only whether there is a second address matters, not how many.
+        if len(self.emails) < 2:
+            for email in EMAIL_RE.findall(text):
+                if email not in self.emails:
+                    self.emails.append(email)
+
+        # The first accepted number wins, as in extract_professional_info.
+        if self.phone is None:
+            for match in PHONE_RE.finditer(text):
+                if _phone_candidate(text, match):
+                    self.phone = match.group(0)
+                    break
+
+    def result(self) -> Dict[str, object]:
+        info = dict.fromkeys(PROFESSIONAL_FIELDS)
+        confidence = dict.fromkeys(PROFESSIONAL_FIELDS, 0)
+
+        if self.emails:
+            info['email'] = self.emails[0]
+            # A second address (e.g. a referee's) makes the first a guess.
+            confidence['email'] = 95 if len(self.emails) == 1 else 75
+
+        if self.phone:
+            info['phone'] = self.phone
+            confidence['phone'] = 90
+
+        if self.header:
+            words = self.header[0].split()
+            if 2 <= len(words) <= 4 and all(word.replace('.', '').replace(',', '').isalpha() for word in words):
+                info['full_name'] = self.header[0]
+                confidence['full_name'] = 85 if all(word[0].isupper() for word in words) else 60
+
+        for line in self.header[1:]:
+            match = TITLE_AT_COMPANY_RE.match(line)
+            if match:
+                info['job_title'] = match.group('title').strip()
+                info['company_name'] = match.group('company').strip()
+                confidence['job_title'] = confidence['company_name'] = 85
+                break
+
+        info['confidence'] = confidence
+        return info
+
+
 def process_resume_upload(pdf_file) -> Dict[str, Optional[str]]:
     """
     Complete pipeline to process an uploaded resume PDF.
@@ -0,0 +1,103 @@
+"""
+Response renderers for the professionals API.
+
+Clients pick one with the ``Accept`` header or ``?format=``:
+
+- ``json`` (``application/json``): orjson when it is installed, otherwise
+  DRF's stdlib ``JSONRenderer``. Same document either way.
+- ``msgpack`` (``application/msgpack``): MessagePack, when ``msgpack`` is
+  installed.
+- ``columnar`` (``application/vnd.newtonx.columnar+json``): lists become
+  ``{"count": n, "columns": {"field": [values...]}}``, one array per field,
+  so keys are not repeated on every row.
+
+orjson and msgpack are optional. A renderer whose library is missing sets
+``available = False`` and ``AvailableRendererNegotiation`` leaves it out, so
+asking for it gets a 406 (or 404 for ``?format=``) instead of a 500.
+"""
+
+from rest_framework.negotiation import DefaultContentNegotiation
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON encoded with orjson, falling back to the stdlib encoder without it.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b''
+        return orjson.dumps(data, default=self.encoder_class().default)
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    MessagePack, for clients that decode binary bodies.
+    """
+    media_type = 'application/msgpack'
+    format = 'msgpack'
+    charset = None
+    render_style = 'binary'
+    available = msgpack is not None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        return msgpack.packb(data, default=_to_primitive)
+
+
+class ColumnarJSONRenderer(ORJSONRenderer):
+    """
+    JSON with list rows turned into one array per field.
+
+    Applies to a top-level list and to the ``results`` of a paginated
+    response; other documents (errors, single objects) render unchanged.
+    """
+    media_type = 'application/vnd.newtonx.columnar+json'
+    format = 'columnar'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if isinstance(data, list):
+            data = to_columns(data)
+        elif isinstance(data, dict) and isinstance(data.get('results'), list):
+            data = {**data, 'results': to_columns(data['results'])}
+        return super().render(data, accepted_media_type, renderer_context)
+
+
+class AvailableRendererNegotiation(DefaultContentNegotiation):
+    """
+    Content negotiation that skips renderers whose optional library is missing.
+    """
+
+    def select_renderer(self, request, renderers, format_suffix=None):
+        renderers = [renderer for renderer in renderers if getattr(renderer, 'available', True)]
+        return super().select_renderer(request, renderers, format_suffix)
+
+
+def to_columns(rows):
+    """
+    Turn a list of dicts sharing the same keys into ``{"count", "columns"}``.
+    """
+    fields = list(rows[0]) if rows else []
+    return {
+        'count': len(rows),
+        'columns': {field: [row.get(field) for row in rows] for field in fields},
+    }
+
+
+def _to_primitive(value):
+    # Decimals, UUIDs, dates and lazy strings, as DRF's JSON encoder does.
+    return JSONRenderer.encoder_class().default(value)
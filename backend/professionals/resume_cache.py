@@ -0,0 +1,294 @@
+"""
+Content-hash cache for resume parsing.
+
+Parsed results are keyed by the SHA-256 of the PDF bytes plus the model,
+the prompt version and the tier settings that shape the result
+(``TIER_SETTINGS``), so re-uploading the same file never pays for another
+LLM call, and changing any of them stops serving the old parses. Lookups
+go through two tiers:
+
+1. An in-process LRU (``RESUME_CACHE_MEMORY_ENTRIES`` entries), which answers
+   repeat uploads in microseconds. Callers get a copy of the cached result,
+   so changing it does not change later hits.
+2. The ``ParsedResume`` table (``RESUME_CACHE_MAX_ENTRIES`` entries), which is
+   shared by every worker process and survives restarts. At most once every
+   ``PRUNE_INTERVAL`` seconds per process, a write deletes expired rows and,
+   if the table is still over its limit, the least recently used tenth.
+
+Both tiers expire entries after ``RESUME_CACHE_TTL`` seconds.
+``aparse_resume_cached`` is the async entry point, for async views.
+"""
+
+import copy
+import hashlib
+import io
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import timedelta
+
+from asgiref.sync import sync_to_async
+from django.db import IntegrityError, OperationalError
+from django.utils import timezone
+
+from .conf import get_setting
+from .models import ParsedResume
+
+logger = logging.getLogger(__name__)
+
+HIT = 'hit'
+MISS = 'miss'
+
+# Settings read by the tiered parser (resume_parser.py) that change its result.
+TIER_SETTINGS = [
+    'PARSE_REQUIRED_FIELDS', 'PARSE_LOCAL_MIN_CONFIDENCE', 'PARSE_MIN_TEXT_CHARS',
+    'PARSE_LLM_TEXT_MAX_CHARS', 'PARSE_MAX_PAGES',
+]
+
+# Fraction of the database tier removed when it exceeds its size limit.
+CULL_FRACTION = 10
+# Seconds between size checks of the database tier, per process.
+PRUNE_INTERVAL = 60
+
+
+class LRUCache:
+    """
+    Small thread-safe LRU cache with per-entry expiry.
+    """
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl, max_entries):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class CacheStats:
+    """
+    Per-process hit/miss counters for the resume cache.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def record(self, outcome, tier=None):
+        with self._lock:
+            if outcome == HIT:
+                self._hits[tier] += 1
+            else:
+                self._misses += 1
+
+    def snapshot(self):
+        with self._lock:
+            hits = sum(self._hits.values())
+            lookups = hits + self._misses
+            return {
+                "hits": hits,
+                "hits_by_tier": dict(self._hits),
+                "misses": self._misses,
+                "hit_rate": hits / lookups if lookups else 0.0,
+            }
+
+    def reset(self):
+        with self._lock:
+            self._hits = {'memory': 0, 'database': 0}
+            self._misses = 0
+
+
+memory_cache = LRUCache()
+stats = CacheStats()
+_prune_lock = threading.Lock()
+_next_prune = 0.0
+
+
+def cache_key(pdf_data):
+    """
+    Build the cache key for a PDF under the current model, prompt version and tier settings.
+    """
+    from .gpt_parser import MODEL, PROMPT_VERSION
+
+    digest = hashlib.sha256(pdf_data).hexdigest()
+    tier = json.dumps([get_setting(name) for name in TIER_SETTINGS])
+    return f"{digest}:{MODEL}:v{PROMPT_VERSION}:{hashlib.sha256(tier.encode()).hexdigest()[:16]}"
+
+
+def parse_resume_cached(pdf_file, parse=None):
+    """
+    Parse a resume PDF, serving repeat uploads from the cache.
+
+    Args:
+        pdf_file: A file object containing PDF data
+        parse: Parser to call on a cache miss (defaults to the tiered parse_resume)
+
+    Returns:
+        tuple: (result, cache) where cache is ``"hit"`` or ``"miss"``
+
+    Raises:
+        Whatever the parser raises on a miss; failures are not cached.
+    """
+    if parse is None:
+        from .resume_parser import parse_resume as parse
+
+    pdf_file.seek(0)
+    pdf_data = pdf_file.read()
+    key = cache_key(pdf_data)
+
+    result = _get_memory(key)
+    if result is not None:
+        stats.record(HIT, 'memory')
+        return result, HIT
+
+    result = _get_persistent(key)
+    if result is not None:
+        stats.record(HIT, 'database')
+        _set_memory(key, result)
+        return result, HIT
+
+    stats.record(MISS)
+    result = parse(io.BytesIO(pdf_data))
+    _set_memory(key, result)
+    _set_persistent(key, result)
+    return result, MISS
+
+
+async def aparse_resume_cached(pdf_file, parse=None):
+    """
+    Async ``parse_resume_cached``; ``parse`` must be a coroutine function
+    (defaults to the tiered ``aparse_resume``).
+    """
+    if parse is None:
+        from .resume_parser import aparse_resume as parse
+
+    pdf_file.seek(0)
+    pdf_data = pdf_file.read()
+    key = cache_key(pdf_data)
+
+    result = _get_memory(key)
+    if result is not None:
+        stats.record(HIT, 'memory')
+        return result, HIT
+
+    result = await _aget_persistent(key)
+    if result is not None:
+        stats.record(HIT, 'database')
+        _set_memory(key, result)
+        return result, HIT
+
+    stats.record(MISS)
+    result = await parse(io.BytesIO(pdf_data))
+    _set_memory(key, result)
+    await sync_to_async(_set_persistent)(key, result)
+    return result, MISS
+
+
+def clear_cache():
+    """
+    Drop every cached parse from both tiers and reset the counters.
+    """
+    global _next_prune
+    memory_cache.clear()
+    ParsedResume.objects.all().delete()
+    stats.reset()
+    with _prune_lock:
+        _next_prune = 0.0
+
+
+def _get_memory(key):
+    result = memory_cache.get(key)
+    return None if result is None else copy.deepcopy(result)
+
+
+def _set_memory(key, result):
+    memory_cache.set(
+        key, copy.deepcopy(result),
+        ttl=get_setting('RESUME_CACHE_TTL'),
+        max_entries=get_setting('RESUME_CACHE_MEMORY_ENTRIES'),
+    )
+
+
+def _get_persistent(key):
+    now = timezone.now()
+    entry = ParsedResume.objects.filter(key=key, expires_at__gt=now).only('result').first()
+    if entry is None:
+        return None
+    ParsedResume.objects.filter(pk=entry.pk).update(last_used_at=now)
+    return entry.result
+
+
+async def _aget_persistent(key):
+    now = timezone.now()
+    entry = await ParsedResume.objects.filter(key=key, expires_at__gt=now).only('result').afirst()
+    if entry is None:
+        return None
+    await ParsedResume.objects.filter(pk=entry.pk).aupdate(last_used_at=now)
+    return entry.result
+
+
+def _set_persistent(key, result):
+    now = timezone.now()
+    expires_at = now + timedelta(seconds=get_setting('RESUME_CACHE_TTL'))
+
+    try:
+        ParsedResume.objects.update_or_create(
+            key=key,
+            defaults={'result': result, 'last_used_at': now, 'expires_at': expires_at},
+        )
+    except IntegrityError:
+        # Another worker stored the same parse concurrently.
+        return
+    except OperationalError as e:
+        # SQLite under concurrent writers ("database is locked"): the parse
+        # succeeded, so skip storing it rather than failing the request.
+        logger.warning("Resume parse not cached (%s): %s", key, e)
+        return
+
+    if _prune_due():
+        prune(now)
+
+
+def prune(now=None):
+    """
+    Delete expired parses, then the least recently used ones while the table
+    holds more than ``RESUME_CACHE_MAX_ENTRIES``.
+    """
+    now = now or timezone.now()
+    ParsedResume.objects.filter(expires_at__lte=now).delete()
+    max_entries = get_setting('RESUME_CACHE_MAX_ENTRIES')
+    excess = ParsedResume.objects.count() - max_entries
+    if excess > 0:
+        cull = max(excess, max_entries // CULL_FRACTION)
+        stale = ParsedResume.objects.order_by('last_used_at').values_list('pk', flat=True)[:cull]
+        ParsedResume.objects.filter(pk__in=list(stale)).delete()
+
+
+def _prune_due():
+    global _next_prune
+    with _prune_lock:
+        if time.monotonic() < _next_prune:
+            return False
+        _next_prune = time.monotonic() + PRUNE_INTERVAL
+        return True
@@ -0,0 +1,129 @@
+"""
+Tiered resume parsing.
+
+Most resumes are text-based PDFs whose contact details a regex can read, so
+the LLM is only used for what local extraction cannot answer:
+
+1. ``local``: pages are extracted with PyPDF2 one at a time and scored field
+   by field (``pdf_utils.extract_until_found``), stopping once every field in
+   ``PARSE_REQUIRED_FIELDS`` reaches ``PARSE_LOCAL_MIN_CONFIDENCE`` or after
+   ``PARSE_MAX_PAGES`` pages. If all of them got there, no LLM call is made.
+2. ``local+llm``: otherwise only the weak fields are requested from the LLM,
+   sending the extracted text instead of the base64-encoded PDF.
+3. ``llm``: PDFs without a usable text layer (scans, images) are sent to the
+   LLM whole, as before.
+
+Results keep the LLM response shape and add ``tier`` plus ``sources`` (the
+tier that produced each field). ``aparse_resume`` is the same for async
+views: local extraction runs in a worker thread and LLM calls use the async
+client.
+"""
+
+from typing import Dict
+
+from asgiref.sync import sync_to_async
+
+from . import gpt_parser
+from .conf import get_setting
+from .pdf_utils import PROFESSIONAL_FIELDS, extract_until_found
+
+TIER_LOCAL = 'local'
+TIER_HYBRID = 'local+llm'
+TIER_LLM = 'llm'
+
+
+def parse_resume(pdf_file) -> Dict[str, any]:
+    """
+    Parse a resume PDF, calling the LLM only for fields local extraction missed.
+
+    Args:
+        pdf_file: A file object containing PDF data
+
+    Returns:
+        dict: Parsed fields, confidence scores, ``tier`` and ``sources``
+
+    Raises:
+        ValueError: If the LLM is needed but the API key is not configured
+        OpenAIError: If an LLM request fails
+    """
+    text, result, weak = _extract_locally(pdf_file)
+
+    if result is None:
+        pdf_file.seek(0)
+        return _whole_pdf_result(gpt_parser.parse_resume_with_gpt(pdf_file))
+
+    if not weak:
+        return {**result, 'tier': TIER_LOCAL, 'sources': dict.fromkeys(PROFESSIONAL_FIELDS, TIER_LOCAL)}
+
+    answer = gpt_parser.parse_fields_from_text(text[:get_setting('PARSE_LLM_TEXT_MAX_CHARS')], weak)
+    return _merge_answer(result, weak, answer)
+
+
+async def aparse_resume(pdf_file) -> Dict[str, any]:
+    """
+    Async ``parse_resume``; the PDF is read in a worker thread, off the event loop.
+    """
+    text, result, weak = await sync_to_async(_extract_locally, thread_sensitive=False)(pdf_file)
+
+    if result is None:
+        pdf_file.seek(0)
+        return _whole_pdf_result(await gpt_parser.aparse_resume_with_gpt(pdf_file))
+
+    if not weak:
+        return {**result, 'tier': TIER_LOCAL, 'sources': dict.fromkeys(PROFESSIONAL_FIELDS, TIER_LOCAL)}
+
+    answer = await gpt_parser.aparse_fields_from_text(text[:get_setting('PARSE_LLM_TEXT_MAX_CHARS')], weak)
+    return _merge_answer(result, weak, answer)
+
+
+def _extract_locally(pdf_file):
+    """
+    Extract and score the PDF's text.
+
+    Returns:
+        tuple: (text, result, weak fields), with result None when the PDF has
+        no usable text layer and must be sent to the LLM whole
+    """
+    required = get_setting('PARSE_REQUIRED_FIELDS')
+    threshold = get_setting('PARSE_LOCAL_MIN_CONFIDENCE')
+
+    pdf_file.seek(0)
+    try:
+        # Pages are read only until every required field is found.
+        text, result = extract_until_found(
+            pdf_file, required, threshold, max_pages=get_setting('PARSE_MAX_PAGES')
+        )
+    except ValueError:
+        # Unreadable by PyPDF2: the LLM may still read it.
+        return '', None, list(required)
+
+    if len(text) < get_setting('PARSE_MIN_TEXT_CHARS'):
+        return text, None, list(required)
+    return text, result, [field for field in required if result['confidence'][field] < threshold]
+
+
+def _whole_pdf_result(result):
+    return {**result, 'tier': TIER_LLM, 'sources': dict.fromkeys(PROFESSIONAL_FIELDS, TIER_LLM)}
+
+
+def _merge_answer(result, weak, answer):
+    """
+    Take each weak field from the LLM answer when it is at least as confident.
+    """
+    sources = dict.fromkeys(PROFESSIONAL_FIELDS, TIER_LOCAL)
+    answer_confidence = answer.get('confidence') or {}
+    for field in weak:
+        confidence = _as_score(answer_confidence.get(field))
+        if answer.get(field) and confidence >= result['confidence'][field]:
+            result[field] = answer[field]
+            result['confidence'][field] = confidence
+            sources[field] = TIER_LLM
+
+    return {**result, 'tier': TIER_HYBRID, 'sources': sources}
+
+
+def _as_score(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return 0
@@ -0,0 +1,146 @@
+"""
+Full-text search over professionals.
+
+On SQLite, an FTS5 table (migration 0006) indexes full_name, company_name,
+job_title and email. Database triggers keep it in sync with every write to
+the professionals table, so no upsert path has to know about it. Every
+term is matched as a prefix so results update as the user types.
+
+Results are ranked with bm25 when a query matches at most
+``RANK_MAX_MATCHES`` rows. Scoring is per match, so a query as broad as a
+common first name would spend its time ranking thousands of near-equal
+hits; those return the most recent matches instead, like the list view.
+Other databases fall back to ``icontains`` filters ordered by recency.
+"""
+
+import re
+
+from django.db import connection
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+from .models import Professional
+
+FTS_TABLE = 'professionals_professional_fts'
+SEARCH_FIELDS = ['full_name', 'company_name', 'job_title', 'email']
+# bm25 weights per column, in SEARCH_FIELDS order: a name match outranks a
+# company or title match, which outranks an email match.
+RANK = f'bm25({FTS_TABLE}, 10.0, 4.0, 4.0, 1.0)'
+RANK_MAX_MATCHES = 2000
+
+TERM_RE = re.compile(r'\w+')
+
+
+def fts_enabled():
+    """
+    Return True when the FTS5 index exists for the current database.
+    """
+    return connection.vendor == 'sqlite'
+
+
+def match_expression(query):
+    """
+    Turn free text into an FTS5 MATCH expression of quoted prefix terms.
+
+    Quoting each term means user input can never be parsed as FTS5 syntax
+    (``AND``, ``NEAR``, column filters, unbalanced quotes).
+
+    Returns:
+        str: The expression, or None if the query has no searchable terms
+    """
+    terms = TERM_RE.findall(query)
+    if not terms:
+        return None
+    return ' '.join(f'"{term}"*' for term in terms)
+
+
+def search_professionals(query, source=None, limit=20):
+    """
+    Return professionals matching ``query``, best match first.
+
+    Broad queries (over ``RANK_MAX_MATCHES`` matches) return the most recent
+    matches instead of the best ranked.
+
+    Args:
+        query: Free-text search terms
+        source: Optional source to filter by
+        limit: Maximum number of results
+
+    Returns:
+        list: Matching Professional objects
+    """
+    expression = match_expression(query)
+    if expression is None:
+        return []
+
+    if not fts_enabled():
+        queryset = Professional.objects.filter(_icontains_filter(query))
+        if source:
+            queryset = queryset.filter(source=source)
+        return list(queryset.order_by('-created_at', '-id')[:limit])
+
+    sql = f'SELECT {FTS_TABLE}.rowid FROM {FTS_TABLE}'
+    params = [expression]
+    if source:
+        sql += f' JOIN professionals_professional p ON p.id = {FTS_TABLE}.rowid'
+    sql += f' WHERE {FTS_TABLE} MATCH %s'
+    if source:
+        sql += ' AND p.source = %s'
+        params.append(source)
+
+    with connection.cursor() as cursor:
+        # Counting stops at the cap, so this stays cheap for broad queries.
+        cursor.execute(
+            f'SELECT COUNT(*) FROM (SELECT 1 FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s LIMIT %s)',
+            [expression, RANK_MAX_MATCHES + 1],
+        )
+        ranked = cursor.fetchone()[0] <= RANK_MAX_MATCHES
+
+        sql += f' ORDER BY {RANK if ranked else f"{FTS_TABLE}.rowid DESC"} LIMIT %s'
+        cursor.execute(sql, params + [limit])
+        ids = [row[0] for row in cursor.fetchall()]
+
+    professionals = Professional.objects.in_bulk(ids)
+    return [professionals[pk] for pk in ids if pk in professionals]
+
+
+def search_filter(query):
+    """
+    Return a Q object matching ``query``, for filtering an existing queryset.
+
+    Unranked; used where the caller applies its own ordering (the admin).
+    """
+    expression = match_expression(query)
+    if expression is None:
+        return Q()
+    if not fts_enabled():
+        return _icontains_filter(query)
+    return Q(pk__in=RawSQL(f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s', [expression]))
+
+
+def rebuild_index(optimize=False):
+    """
+    Rebuild the FTS5 index from the professionals table.
+
+    Only needed if rows were written with the triggers disabled (raw SQL
+    imports, restored backups) or the index is suspected to be out of sync.
+
+    Returns:
+        int: Number of indexed rows
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+        if optimize:
+            cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('optimize')")
+        cursor.execute(f'SELECT COUNT(*) FROM {FTS_TABLE}')
+        return cursor.fetchone()[0]
+
+
+def _icontains_filter(query):
+    condition = Q()
+    for term in TERM_RE.findall(query):
+        term_condition = Q()
+        for field in SEARCH_FIELDS:
+            term_condition |= Q(**{f'{field}__icontains': term})
+        condition &= term_condition
+    return condition
@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from .models import Professional
+from .models import Professional, ParseJob, DuplicateCandidate, DedupRun
 
 
 class ProfessionalSerializer(serializers.ModelSerializer):
@@ -11,6 +11,12 @@ class ProfessionalSerializer(serializers.ModelSerializer):
         fields = ['id', 'full_name', 'email', 'company_name', 'job_title',
                   'phone', 'source', 'resume', 'created_at']
         read_only_fields = ['id', 'created_at']
+        # POST upserts on the normalized keys, so an existing email or phone
+        # is an update rather than a validation error.
+        extra_kwargs = {
+            'email': {'validators': []},
+            'phone': {'validators': []},
+        }
 
     def validate(self, data):
         """
@@ -84,3 +90,40 @@ class BulkProfessionalSerializer(serializers.Serializer):
             )
 
         return data
+
+
+class ParseJobSerializer(serializers.ModelSerializer):
+    """
+    Read-only serializer for asynchronous resume parse jobs.
+    """
+    job_id = serializers.UUIDField(source='id', read_only=True)
+
+    class Meta:
+        model = ParseJob
+        fields = ['job_id', 'status', 'file_name', 'result', 'error',
+                  'created_at', 'started_at', 'finished_at']
+        read_only_fields = fields
+
+
+class DuplicateCandidateSerializer(serializers.ModelSerializer):
+    """
+    Read-only serializer for a candidate duplicate pair, with both professionals.
+    """
+    professional_a = ProfessionalSerializer(read_only=True)
+    professional_b = ProfessionalSerializer(read_only=True)
+
+    class Meta:
+        model = DuplicateCandidate
+        fields = ['id', 'score', 'reasons', 'status', 'professional_a', 'professional_b', 'updated_at']
+        read_only_fields = fields
+
+
+class DedupRunSerializer(serializers.ModelSerializer):
+    """
+    Read-only serializer for a duplicate detection run.
+    """
+    class Meta:
+        model = DedupRun
+        fields = ['started_at', 'finished_at', 'full', 'rows_scanned', 'rows_changed',
+                  'pairs_compared', 'blocks_skipped', 'candidates', 'elapsed_ms']
+        read_only_fields = fields
@@ -0,0 +1,241 @@
+"""
+Content-addressed storage for resume files.
+
+``Professional.resume`` files are stored once per distinct content, under the
+SHA-256 of their bytes (``resumes/ab/ab12...ef.pdf``), instead of once per
+upload under the uploaded name:
+
+- Saving streams the upload once into a temporary file under the resume
+  directory, hashing it on the way. If a file with that digest already
+  exists, the temporary file is dropped. Otherwise it is renamed into place
+  with ``os.replace``, which is atomic because both paths are on the same
+  filesystem, so a concurrent reader never sees a partial file.
+- ``ResumeFile`` rows count the professionals that reference each file.
+  ``Professional.save()`` and ``delete()`` call ``retain`` and ``release``
+  when a row's resume changes.
+- Because a file can be shared, ``delete()`` on the storage does nothing.
+  Files are removed by ``collect_garbage`` (``python manage.py
+  collect_resume_files``) once nothing references them and they have been
+  unused for ``RESUME_STORAGE_GC_GRACE`` seconds. The grace period covers
+  uploads whose row has not been committed yet.
+"""
+
+import hashlib
+import os
+import tempfile
+import time
+from collections import Counter
+from datetime import timedelta
+
+from django.core.files.storage import FileSystemStorage
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+from django.utils import timezone
+from django.utils.deconstruct import deconstructible
+
+from .conf import get_setting
+
+TEMP_PREFIX = '.upload-'
+
+
+@deconstructible(path='professionals.storage.ContentAddressedStorage')
+class ContentAddressedStorage(FileSystemStorage):
+    """
+    File system storage that names files by the SHA-256 of their content.
+    """
+
+    def get_available_name(self, name, max_length=None):
+        # The final name comes from the content, so the upload name never collides.
+        return name
+
+    def _save(self, name, content):
+        # The temporary file sits in the upload directory, on the same
+        # filesystem as its final path, so the rename below is atomic.
+        upload_dir = self.path(os.path.dirname(name))
+        os.makedirs(upload_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=upload_dir, prefix=TEMP_PREFIX)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                digest, size = file_digest(content, f)
+
+            extension = os.path.splitext(name)[1].lower()
+            name = os.path.join(os.path.dirname(name), digest[:2], digest + extension).replace('\\', '/')
+            path = self.path(name)
+
+            # Register the file before checking for it, so collect_garbage (which
+            # deletes the row before the file) cannot remove it under this upload.
+            _touch(name, size)
+            if os.path.exists(path):
+                os.utime(path)
+                return name
+
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            if self.file_permissions_mode is not None:
+                os.chmod(temp_path, self.file_permissions_mode)
+            os.replace(temp_path, path)
+            return name
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def delete(self, name):
+        """
+        Do nothing: other professionals may share the file (see ``collect_garbage``).
+        """
+
+    def remove(self, name):
+        """
+        Delete the file from disk.
+        """
+        super().delete(name)
+
+
+resume_storage = ContentAddressedStorage()
+
+
+def file_digest(content, copy_to=None):
+    """
+    Return ``(sha256 hex digest, size)`` of a Django ``File``, read in chunks.
+
+    Each chunk is also written to ``copy_to`` when given, so a file can be
+    stored and hashed in one pass.
+    """
+    sha = hashlib.sha256()
+    size = 0
+    for chunk in content.chunks():
+        sha.update(chunk)
+        size += len(chunk)
+        if copy_to is not None:
+            copy_to.write(chunk)
+    return sha.hexdigest(), size
+
+
+def retain(name):
+    """
+    Count a new reference to the stored file ``name``.
+    """
+    if not name:
+        return
+    from .models import ResumeFile
+
+    ResumeFile.objects.filter(name=name).update(ref_count=F('ref_count') + 1, updated_at=timezone.now())
+
+
+def release(name, count=1):
+    """
+    Drop ``count`` references to the stored file ``name``.
+    """
+    if not name:
+        return
+    from .models import ResumeFile
+
+    ResumeFile.objects.filter(name=name).update(
+        ref_count=Greatest(F('ref_count') - count, 0), updated_at=timezone.now()
+    )
+
+
+def collect_garbage(grace=None, dry_run=False):
+    """
+    Delete stored files that no professional references.
+
+    Two kinds of file are collected once they have been unused for ``grace``
+    seconds (``RESUME_STORAGE_GC_GRACE`` by default):
+
+    - files whose ``ResumeFile`` reference count is zero;
+    - files under the resume directory with no ``ResumeFile`` row, such as
+      uploads whose transaction rolled back, files from before this storage,
+      and temporary files left by a crash.
+
+    Before deleting, references are checked against the professionals table,
+    so a count that has drifted never removes a file in use. Such counts are
+    corrected instead.
+
+    Returns:
+        dict: ``files`` and ``bytes`` removed (or that would be, with
+        ``dry_run``), and ``recounted``, the reference counts corrected
+    """
+    from .models import Professional, ResumeFile
+
+    grace = get_setting('RESUME_STORAGE_GC_GRACE') if grace is None else grace
+    cutoff = timezone.now() - timedelta(seconds=grace)
+    removed = {'files': 0, 'bytes': 0, 'recounted': 0}
+
+    for name, size in ResumeFile.objects.filter(ref_count=0, updated_at__lt=cutoff).values_list('name', 'size'):
+        references = Professional.objects.filter(resume=name).count()
+        if references:
+            ResumeFile.objects.filter(name=name).update(ref_count=references)
+            removed['recounted'] += 1
+            continue
+        if dry_run:
+            removed['files'] += 1
+            removed['bytes'] += size
+            continue
+        with transaction.atomic():
+            # Re-check inside the transaction: an upload may have reused the file.
+            deleted, _ = ResumeFile.objects.filter(name=name, ref_count=0, updated_at__lt=cutoff).delete()
+            if deleted:
+                resume_storage.remove(name)
+                removed['files'] += 1
+                removed['bytes'] += size
+
+    upload_dir = Professional._meta.get_field('resume').upload_to.rstrip('/')
+    tracked = set(ResumeFile.objects.values_list('name', flat=True))
+    for name in _walk(upload_dir):
+        if name in tracked:
+            continue
+        path = resume_storage.path(name)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            continue
+        if stat.st_mtime >= time.time() - grace or Professional.objects.filter(resume=name).exists():
+            continue
+        if not dry_run:
+            resume_storage.remove(name)
+        removed['files'] += 1
+        removed['bytes'] += stat.st_size
+
+    return removed
+
+
+def recount_references():
+    """
+    Rebuild every ``ResumeFile`` reference count from the professionals table.
+
+    Returns:
+        int: Rows whose count changed
+    """
+    from .models import Professional, ResumeFile
+
+    references = Counter(
+        Professional.objects.exclude(resume='').exclude(resume__isnull=True).values_list('resume', flat=True)
+    )
+    changed = 0
+    for name, ref_count in ResumeFile.objects.values_list('name', 'ref_count'):
+        if references[name] != ref_count:
+            changed += ResumeFile.objects.filter(name=name).update(ref_count=references[name])
+    return changed
+
+
+def _touch(name, size):
+    from .models import ResumeFile
+
+    # One INSERT ... ON CONFLICT statement whether or not the row exists.
+    ResumeFile.objects.bulk_create(
+        [ResumeFile(name=name, size=size)],
+        update_conflicts=True, unique_fields=['name'], update_fields=['updated_at'],
+    )
+
+
+def _walk(directory):
+    """
+    Yield the storage names of every file under ``directory``.
+    """
+    if not resume_storage.exists(directory):
+        return
+    subdirectories, files = resume_storage.listdir(directory)
+    for file_name in files:
+        yield f'{directory}/{file_name}'
+    for subdirectory in subdirectories:
+        yield from _walk(f'{directory}/{subdirectory}')
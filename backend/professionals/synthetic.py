@@ -0,0 +1,245 @@
+"""
+Deterministic synthetic data used by benchmarks and tests.
+"""
+
+import random
+from typing import Dict, List, Optional, Tuple
+
+FIRST_NAMES = ['Ada', 'Grace', 'Alan', 'Linus', 'Margaret', 'Dennis', 'Barbara', 'Ken', 'Radia', 'Edsger']
+LAST_NAMES = ['Lovelace', 'Hopper', 'Turing', 'Torvalds', 'Hamilton', 'Ritchie', 'Liskov', 'Thompson', 'Perlman', 'Dijkstra']
+COMPANIES = ['Acme Inc.', 'Globex', 'Initech', 'Umbrella Corp', 'Hooli', 'Stark Industries', 'Wayne Enterprises']
+JOB_TITLES = ['Engineer', 'Senior Engineer', 'Product Manager', 'VP, Product', 'Data Scientist', 'CTO']
+SOURCES = ['direct', 'partner', 'internal']
+
+
+def professional_records(count: int, start: int = 0, seed: int = 0) -> List[Dict[str, str]]:
+    """
+    Build bulk-upsert records with unique emails and phones.
+
+    Args:
+        count: Number of records to build
+        start: Offset of the first record, so ranges can overlap on purpose
+        seed: Random seed for company, job title and source
+
+    Returns:
+        list: Record dicts accepted by the bulk upsert endpoint
+    """
+    rng = random.Random(seed)
+    records = []
+
+    for n in range(start, start + count):
+        # Keys depend only on ``n`` so different seeds describe the same people.
+        first = FIRST_NAMES[n % len(FIRST_NAMES)]
+        last = LAST_NAMES[n // len(FIRST_NAMES) % len(LAST_NAMES)]
+        records.append({
+            'full_name': f'{first} {last}',
+            'email': f'{first.lower()}.{last.lower()}.{n}@example.com',
+            'phone': f'+1 555 {n // 10000:03d} {n % 10000:04d}',
+            'company_name': rng.choice(COMPANIES),
+            'job_title': rng.choice(JOB_TITLES),
+            'source': rng.choice(SOURCES),
+        })
+
+    return records
+
+
+PHONE_FORMATS = [
+    '+1 ({a}) {b}-{c}', '{a}-{b}-{c}', '({a}) {b}-{c}', '{a}.{b}.{c}', '+1 {a} {b} {c}', '+44 20 {b}{c1} {c}',
+    '{a}{b}{c}', '1-{a}-{b}-{c}',
+]
+# Numbers that look phone-ish to a loose pattern: date ranges, IDs, zip codes.
+DISTRACTORS = [
+    '{y1}-{y2} {title}, {company}',
+    'Employee ID {id}',
+    'Jan {y1} - Mar {y2}',
+    'SF, CA 94107-{c}',
+    'Since {y1} {title}',
+    'Ref. {c}-{b}-{y1}',
+]
+
+
+def resume_texts(count: int, seed: int = 0) -> List[Tuple[str, Dict[str, Optional[str]]]]:
+    """
+    Build resume-like texts with known contact details for extraction benchmarks.
+
+    Distractor lines (date ranges, employee IDs, zip codes) are mixed in,
+    often before the contact line, and some resumes omit the phone or email.
+
+    Args:
+        count: Number of texts to build
+        seed: Random seed
+
+    Returns:
+        list: ``(text, truth)`` pairs where truth has ``email`` and ``phone``
+    """
+    rng = random.Random(seed)
+    texts = []
+
+    for record in professional_records(count, seed=seed):
+        values = {
+            'a': rng.randint(201, 989), 'b': f'{rng.randint(200, 999)}', 'c': f'{rng.randint(0, 9999):04d}',
+            'c1': rng.randint(0, 9), 'y1': rng.randint(1995, 2015), 'y2': rng.randint(2016, 2024),
+            'id': rng.randint(10 ** 9, 10 ** 10 - 1),
+            'title': record['job_title'], 'company': record['company_name'],
+        }
+        email = record['email'] if rng.random() < 0.95 else None
+        phone = rng.choice(PHONE_FORMATS).format(**values) if rng.random() < 0.85 else None
+
+        contact = ' | '.join(value for value in (email, phone) if value)
+        distractors = [line.format(**values) for line in rng.sample(DISTRACTORS, 3)]
+        lines = [record['full_name'], f"{record['job_title']} at {record['company_name']}"]
+        lines += distractors[:1] + [contact] + distractors[1:] if rng.random() < 0.5 else [contact] + distractors
+        lines += ['Experience', 'Built and ran data pipelines; mentored engineers.'] * 3
+
+        texts.append(('\n'.join(lines), {'email': email, 'phone': phone}))
+
+    return texts
+
+
+def resume_pdf(lines: List[str], extra_pages: List[List[str]] = ()) -> bytes:
+    """
+    Build a minimal text-based PDF with one line of text per entry.
+
+    The file is written by hand (Helvetica, no compression) so tests and
+    benchmarks need no PDF writer; PyPDF2 extracts the lines back in order.
+
+    Args:
+        lines: Text lines of the first page, top to bottom
+        extra_pages: Lines for each further page
+
+    Returns:
+        bytes: The PDF file
+    """
+    def escape(text):
+        return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+    def content(page_lines):
+        ops = ['BT', '/F1 11 Tf', '14 TL', '72 760 Td']
+        ops.extend(f'({escape(line)}) Tj T*' for line in page_lines)
+        ops.append('ET')
+        return '\n'.join(ops).encode('latin-1', 'replace')
+
+    pages = [lines, *extra_pages]
+    # Objects: 1 catalog, 2 page tree, 3 font, then a page and its content
+    # stream for each page.
+    page_numbers = [4 + 2 * n for n in range(len(pages))]
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [%s] /Count %d >>' % (
+            b' '.join(b'%d 0 R' % number for number in page_numbers), len(pages)
+        ),
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>',
+    ]
+    for number, page_lines in zip(page_numbers, pages):
+        stream = content(page_lines)
+        objects.append(
+            b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] '
+            b'/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>' % (number + 1)
+        )
+        objects.append(b'<< /Length %d >>\nstream\n' % len(stream) + stream + b'\nendstream')
+
+    pdf = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b'%d 0 obj\n' % number + body + b'\nendobj\n'
+
+    xref = len(pdf)
+    pdf += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    for offset in offsets:
+        pdf += b'%010d 00000 n \n' % offset
+    pdf += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref)
+    return bytes(pdf)
+
+
+SYLLABLES = ['an', 'ber', 'cal', 'dor', 'el', 'fen', 'gar', 'hol', 'is', 'jan', 'kor', 'lin', 'mar',
+             'nor', 'ol', 'per', 'quin', 'ros', 'sal', 'tor', 'ul', 'ven', 'wil', 'xan', 'yor', 'zel']
+COMPANY_SUFFIXES = ['', ' Inc.', ' LLC', ' Ltd', ' Corp']
+FREE_MAIL_DOMAINS = ['gmail.com', 'outlook.com', 'yahoo.com']
+
+
+def people_records(
+    count: int, duplicate_rate: float = 0.05, seed: int = 0, start: int = 0
+) -> Tuple[List[Dict[str, Optional[str]]], List[Tuple[int, int]]]:
+    """
+    Build professionals with realistic name variety plus planted duplicates.
+
+    Each duplicate re-enters an earlier person through another source with
+    the kind of drift seen in practice: "Last, First" order, a middle
+    initial, a typo, a different company suffix, a personal email with the
+    same local part (plus a tag), or a different phone. Emails and phones stay unique, as the
+    upsert keys require.
+
+    Args:
+        count: Total number of records, duplicates included
+        duplicate_rate: Share of records that duplicate an earlier one
+        seed: Random seed
+        start: Number of the first record; emails and phones are unique
+            across calls with non-overlapping ranges, so a large table can
+            be built in chunks (duplicates then stay within a chunk)
+
+    Returns:
+        tuple: (record dicts, ``(original_index, duplicate_index)`` pairs),
+        indexes into the returned list
+    """
+    rng = random.Random(seed)
+
+    def word(parts):
+        return ''.join(rng.choice(SYLLABLES) for _ in range(parts)).capitalize()
+
+    first_names = sorted({word(2) for _ in range(400)})
+    companies = sorted({word(rng.randint(2, 3)) for _ in range(max(50, count // 50))})
+    records = []
+    originals = []
+    pairs = []
+
+    for index in range(count):
+        n = start + index
+        # Duplicates only copy originals, so the planted pairs are all the true pairs.
+        if originals and rng.random() < duplicate_rate:
+            original_index = rng.choice(originals)
+            records.append(_duplicate_of(records[original_index], n, rng))
+            pairs.append((original_index, index))
+            continue
+
+        originals.append(index)
+
+        first = rng.choice(first_names)
+        last = word(rng.randint(2, 3))
+        company = rng.choice(companies)
+        domain = f'{company.lower()}.com' if rng.random() < 0.6 else rng.choice(FREE_MAIL_DOMAINS)
+        records.append({
+            'full_name': f'{first} {last}',
+            'email': f'{first.lower()}.{last.lower()}{n}@{domain}',
+            'phone': f'+1 {200 + n // 10 ** 7 % 800} {n // 10000 % 1000:03d} {n % 10000:04d}',
+            'company_name': company + rng.choice(COMPANY_SUFFIXES),
+            'job_title': rng.choice(JOB_TITLES),
+            'source': rng.choice(SOURCES),
+        })
+
+    return records, pairs
+
+
+def _duplicate_of(record: Dict[str, str], n: int, rng: random.Random) -> Dict[str, Optional[str]]:
+    first, last = record['full_name'].split(' ', 1)
+    variant = rng.randrange(4)
+    if variant == 0:
+        name = f'{last}, {first}'
+    elif variant == 1:
+        name = f'{first} {rng.choice(SYLLABLES)[0].upper()}. {last}'
+    elif variant == 2 and len(last) > 3:
+        i = rng.randrange(1, len(last) - 1)
+        name = f'{first} {last[:i]}{last[i + 1]}{last[i]}{last[i + 2:]}'
+    else:
+        name = f'{first.upper()} {last.upper()}'
+
+    company = record['company_name'].split(' ')[0]
+    local = record['email'].split('@')[0]
+    return {
+        'full_name': name,
+        'email': f'{local}+{n}@{rng.choice(FREE_MAIL_DOMAINS)}' if rng.random() < 0.5 else None,
+        'phone': f'+44 20 {n // 10000 % 10000:04d} {n % 10000:04d}',
+        'company_name': company + rng.choice(COMPANY_SUFFIXES) if rng.random() < 0.8 else None,
+        'job_title': record['job_title'],
+        'source': rng.choice([source for source in SOURCES if source != record['source']]),
+    }
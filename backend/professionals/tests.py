@@ -1,12 +1,18 @@
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.core.exceptions import ValidationError
 from django.db import IntegrityError
 from rest_framework.test import APITestCase
 from rest_framework import status
+from rest_framework.renderers import JSONRenderer
 from django.core.files.uploadedfile import SimpleUploadedFile
-from .models import Professional
+from . import list_cache, resume_cache
+from .models import Professional, ParseJob, ParsedResume, DuplicateCandidate
 from .serializers import ProfessionalSerializer, BulkProfessionalSerializer
+from unittest import mock
 import io
+import json
+import time
+import zipfile
 
 
 class ProfessionalModelTest(TestCase):
@@ -213,6 +219,9 @@ class BulkProfessionalSerializerTest(TestCase):
 class ProfessionalAPITest(APITestCase):
     """Test cases for Professional API endpoints"""
 
+    def setUp(self):
+        list_cache.clear()
+
     def test_list_professionals_empty(self):
         """Test listing professionals when database is empty"""
         response = self.client.get('/api/professionals/')
@@ -334,7 +343,8 @@ class ProfessionalAPITest(APITestCase):
                 "source": "direct"  # Missing email and phone
             }
         ]
-        response = self.client.post('/api/professionals/bulk', data, format='json')
+        with self.assertLogs('professionals.upsert', 'WARNING'):
+            response = self.client.post('/api/professionals/bulk', data, format='json')
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data['success']), 1)
         self.assertEqual(len(response.data['failed']), 1)
@@ -399,3 +409,1924 @@ class ProfessionalAPITest(APITestCase):
         response = self.client.post('/api/professionals/parse-resume', {'resume': large_file})
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn("File too large", response.data['error'])
+
+
+class BulkUpsertEngineTest(APITestCase):
+    """Test cases for the set-based bulk upsert engine"""
+
+    def test_bulk_upsert_query_count_does_not_grow_per_record(self):
+        """Test bulk upsert of many records uses a constant number of queries"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from .synthetic import professional_records
+
+        Professional.objects.bulk_create(
+            [Professional(**record) for record in professional_records(100)]
+        )
+        data = professional_records(200, seed=1)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post('/api/professionals/bulk', data, format='json')
+        self.assertEqual(len(response.data['success']), 200)
+        self.assertEqual(Professional.objects.count(), 200)
+        self.assertLess(len(queries), 15)
+
+    def test_bulk_upsert_merges_duplicate_keys_in_order(self):
+        """Test repeated keys in one batch behave like sequential upserts"""
+        data = [
+            {"full_name": "First", "email": "dup@example.com", "source": "direct"},
+            {"full_name": "Second", "email": "dup@example.com", "company_name": "Acme", "source": "partner"},
+        ]
+        response = self.client.post('/api/professionals/bulk', data, format='json')
+        self.assertEqual(len(response.data['success']), 2)
+        self.assertEqual(response.data['success'][0]['full_name'], "First")
+        self.assertEqual(response.data['success'][1]['full_name'], "Second")
+        self.assertEqual(response.data['success'][0]['id'], response.data['success'][1]['id'])
+        professional = Professional.objects.get()
+        self.assertEqual(professional.full_name, "Second")
+        self.assertEqual(professional.company_name, "Acme")
+
+    def test_bulk_upsert_reports_unique_conflicts_by_index(self):
+        """Test a record taking another row's phone fails without blocking the rest"""
+        Professional.objects.create(full_name="Owner", phone="+1234567890", source="direct")
+        data = [
+            {"full_name": "Missing Contact", "source": "direct"},
+            {"full_name": "Thief", "email": "thief@example.com", "phone": "+1234567890", "source": "partner"},
+            {"full_name": "Fine", "email": "fine@example.com", "source": "partner"},
+        ]
+        with self.assertLogs('professionals.upsert', 'WARNING'):
+            response = self.client.post('/api/professionals/bulk', data, format='json')
+        self.assertEqual(len(response.data['success']), 1)
+        self.assertEqual([f['index'] for f in response.data['failed']], [0, 1])
+        self.assertIn("phone", response.data['failed'][1]['reason'])
+        self.assertEqual(Professional.objects.count(), 2)
+
+    def test_bulk_upsert_updates_by_phone_keep_created_at(self):
+        """Test phone-keyed updates keep the row's original id and created_at"""
+        existing = Professional.objects.create(full_name="Old", phone="+1234567890", source="direct")
+        data = [{"full_name": "New", "phone": "+1234567890", "source": "internal"}]
+        response = self.client.post('/api/professionals/bulk', data, format='json')
+        self.assertEqual(response.data['success'][0]['id'], existing.id)
+        updated = Professional.objects.get()
+        self.assertEqual(updated.full_name, "New")
+        self.assertEqual(updated.created_at, existing.created_at)
+        self.assertGreater(updated.updated_at, existing.updated_at)
+
+
+class KeysetPaginationTest(APITestCase):
+    """Test cases for cursor pagination on the list endpoint"""
+
+    def setUp(self):
+        for n in range(5):
+            Professional.objects.create(
+                full_name=f"Person {n}",
+                email=f"person{n}@example.com",
+                source="direct" if n % 2 == 0 else "partner"
+            )
+
+    def test_pages_forward_and_back(self):
+        """Test next/prev cursors walk the list newest first without gaps"""
+        first = self.client.get('/api/professionals/?limit=2')
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual([p['full_name'] for p in first.data['results']], ["Person 4", "Person 3"])
+        self.assertIsNone(first.data['prev'])
+
+        second = self.client.get(f"/api/professionals/?limit=2&cursor={first.data['next']}")
+        self.assertEqual([p['full_name'] for p in second.data['results']], ["Person 2", "Person 1"])
+
+        last = self.client.get(f"/api/professionals/?limit=2&cursor={second.data['next']}")
+        self.assertEqual([p['full_name'] for p in last.data['results']], ["Person 0"])
+        self.assertIsNone(last.data['next'])
+
+        back = self.client.get(f"/api/professionals/?limit=2&cursor={second.data['prev']}")
+        self.assertEqual([p['full_name'] for p in back.data['results']], ["Person 4", "Person 3"])
+        self.assertIsNone(back.data['prev'])
+
+    def test_pagination_keeps_source_filter(self):
+        """Test cursor pages only contain the requested source"""
+        response = self.client.get('/api/professionals/?source=direct&limit=2')
+        self.assertEqual([p['full_name'] for p in response.data['results']], ["Person 4", "Person 2"])
+        response = self.client.get(f"/api/professionals/?source=direct&limit=2&cursor={response.data['next']}")
+        self.assertEqual([p['full_name'] for p in response.data['results']], ["Person 0"])
+
+    def test_invalid_cursor(self):
+        """Test malformed cursors and limits are rejected"""
+        response = self.client.get('/api/professionals/?cursor=not-a-cursor')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        response = self.client.get('/api/professionals/?limit=0')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ProfessionalExportTest(APITestCase):
+    """Test cases for the streaming export endpoint"""
+
+    def _create(self, count, start=0):
+        from .synthetic import professional_records
+        Professional.objects.bulk_create(
+            [Professional(**record) for record in professional_records(count, start=start)]
+        )
+
+    def _consume(self, response):
+        return b''.join(response.streaming_content).decode('utf-8')
+
+    def test_export_ndjson_matches_list_endpoint(self):
+        """Test NDJSON export rows match the list serializer output"""
+        self._create(3)
+        response = self.client.get('/api/professionals/export?format=ndjson')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        rows = [json.loads(line) for line in self._consume(response).splitlines()]
+        listed = sorted(self.client.get('/api/professionals/').json(), key=lambda p: p['id'])
+        self.assertEqual(rows, listed)
+
+    def test_export_csv_with_source_filter(self):
+        """Test CSV export writes a header and only the requested source"""
+        import csv
+        self._create(6)
+        response = self.client.get('/api/professionals/export?format=csv&source=partner')
+        self.assertEqual(response['Content-Type'], 'text/csv')
+        rows = list(csv.DictReader(io.StringIO(self._consume(response))))
+        self.assertEqual(len(rows), Professional.objects.filter(source='partner').count())
+        self.assertTrue(all(row['source'] == 'partner' for row in rows))
+
+    def test_export_invalid_format(self):
+        """Test unknown export formats are rejected"""
+        response = self.client.get('/api/professionals/export?format=xml')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_memory_does_not_grow_with_table_size(self):
+        """Test peak memory while streaming is flat as the table grows 10x"""
+        import tracemalloc
+        from .views import ProfessionalExportView
+
+        def peak_while_streaming():
+            tracemalloc.start()
+            response = self.client.get('/api/professionals/export?format=ndjson')
+            for _ in response.streaming_content:
+                pass
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            return peak
+
+        with mock.patch.object(ProfessionalExportView, 'chunk_size', 100):
+            self._create(500)
+            small = peak_while_streaming()
+            self._create(4500, start=500)
+            large = peak_while_streaming()
+
+        self.assertLess(large, small * 1.5)
+
+
+class NDJSONIngestTest(APITestCase):
+    """Test cases for streaming NDJSON ingest on the bulk endpoint"""
+
+    def _post(self, lines, chunk_size=2):
+        return self.client.post(
+            f'/api/professionals/bulk?chunk_size={chunk_size}',
+            data='\n'.join(lines) + '\n',
+            content_type='application/x-ndjson'
+        )
+
+    def test_ndjson_ingest_in_chunks(self):
+        """Test NDJSON records are upserted in chunks with a summary"""
+        from .synthetic import professional_records
+        lines = [json.dumps(record) for record in professional_records(5)]
+        response = self._post(lines)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['summary'], {"received": 5, "succeeded": 5, "failed": 0, "chunks": 3})
+        self.assertEqual(response.data['failed'], [])
+        self.assertEqual(Professional.objects.count(), 5)
+
+    def test_ndjson_ingest_reports_bad_lines(self):
+        """Test undecodable and invalid lines are reported by index"""
+        lines = [
+            '{"full_name": "John Doe", "email": "john@example.com", "source": "direct"}',
+            '{not json',
+            '',
+            '{"full_name": "No Contact", "source": "direct"}',
+            '{"full_name": "Jane Smith", "phone": "+1234567890", "source": "partner"}',
+        ]
+        with self.assertLogs('professionals.upsert', 'WARNING'):
+            response = self._post(lines)
+        self.assertEqual(response.data['summary']['received'], 4)
+        self.assertEqual(response.data['summary']['succeeded'], 2)
+        self.assertEqual([f['index'] for f in response.data['failed']], [1, 2])
+        self.assertIn("Invalid JSON", response.data['failed'][0]['reason'])
+        self.assertEqual(Professional.objects.count(), 2)
+
+    @override_settings(PROFESSIONALS={'INGEST_MAX_FAILURES': 2, 'INGEST_FAILED_RECORD_MAX_CHARS': 40})
+    def test_ndjson_ingest_caps_reported_failures(self):
+        """Test only the first failures are listed, truncated, while all are counted"""
+        lines = ['{"full_name": "%s", "source": "direct"}' % ("x" * 100)] * 4 + ['{not json' + "y" * 100]
+        with self.assertLogs('professionals.upsert', 'WARNING'):
+            response = self._post(lines)
+        self.assertEqual(response.data['summary']['failed'], 5)
+        self.assertEqual([f['index'] for f in response.data['failed']], [0, 1])
+        record = response.data['failed'][0]['record']
+        self.assertEqual(record, json.dumps({"full_name": "x" * 100, "source": "direct"})[:40] + '...')
+
+    @override_settings(PROFESSIONALS={'INGEST_MAX_FAILURES': 2})
+    def test_ndjson_ingest_keeps_lowest_failure_indexes(self):
+        """Test chunk failures reported at flush still beat later invalid lines"""
+        lines = ['{"full_name": "No Contact", "source": "direct"}'] * 2 + ['{not json'] * 2
+        with self.assertLogs('professionals.upsert', 'WARNING') as logs:
+            response = self._post(lines, chunk_size=10)
+        self.assertEqual(response.data['summary']['failed'], 4)
+        self.assertEqual([f['index'] for f in response.data['failed']], [0, 1])
+        self.assertIn("4 of 4 records failed", logs.output[0])
+
+    def test_ndjson_ingest_invalid_chunk_size(self):
+        """Test chunk_size outside the allowed range is rejected"""
+        response = self._post(['{}'], chunk_size=0)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+@override_settings(PROFESSIONALS={'PARSE_JOB_EAGER': True, 'PARSE_JOB_MAX_QUEUE': 2})
+@mock.patch.dict('os.environ', {'OPENAI_API_KEY': 'test'})
+class ParseJobQueueTest(APITestCase):
+    """Test cases for asynchronous resume parse jobs"""
+
+    parsed = {"full_name": "Jane Doe", "email": "jane@example.com"}
+
+    def setUp(self):
+        resume_cache.clear_cache()
+
+    def _upload(self):
+        resume = SimpleUploadedFile("resume.pdf", b"%PDF-1.4 fake", content_type="application/pdf")
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post('/api/professionals/parse-resume?async=1', {'resume': resume})
+
+    def test_async_parse_returns_job_and_result(self):
+        """Test async parse returns a job id whose status reports the result"""
+        with mock.patch('professionals.gpt_parser.parse_resume_with_gpt', return_value=self.parsed) as parse:
+            response = self._upload()
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(parse.call_args[0][0].read(), b"%PDF-1.4 fake")
+
+        job = self.client.get(response.data['status_url'])
+        self.assertEqual(job.status_code, status.HTTP_200_OK)
+        self.assertEqual(job.data['status'], ParseJob.SUCCEEDED)
+        self.assertEqual(job.data['result']['full_name'], self.parsed['full_name'])
+        self.assertEqual(job.data['result']['tier'], 'llm')
+        self.assertEqual(bytes(ParseJob.objects.get().pdf_data), b'')
+
+    def test_async_parse_failure_is_reported(self):
+        """Test a failing parse marks the job failed with the error"""
+        with mock.patch('professionals.gpt_parser.parse_resume_with_gpt', side_effect=Exception("boom")), \
+                self.assertLogs('professionals.jobs', 'ERROR') as logs:
+            response = self._upload()
+        self.assertIn("boom", logs.output[0])
+        job = self.client.get(response.data['status_url'])
+        self.assertEqual(job.data['status'], ParseJob.FAILED)
+        self.assertIn("boom", job.data['error'])
+
+    def test_async_parse_backpressure(self):
+        """Test new jobs are refused with 429 once the queue is full"""
+        ParseJob.objects.create(file_name="a.pdf", pdf_data=b"x", status=ParseJob.RUNNING)
+        ParseJob.objects.create(file_name="b.pdf", pdf_data=b"x", status=ParseJob.RUNNING)
+        response = self._upload()
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertIn('Retry-After', response)
+
+    def test_abandoned_running_jobs_free_the_queue(self):
+        """Test jobs left running by a dead worker are failed after PARSE_JOB_TIMEOUT and stop blocking uploads"""
+        from datetime import timedelta
+        from django.utils import timezone
+        started = timezone.now() - timedelta(hours=1)
+        stale = [
+            ParseJob.objects.create(file_name=name, pdf_data=b"x", status=ParseJob.RUNNING, started_at=started)
+            for name in ("a.pdf", "b.pdf")
+        ]
+        with mock.patch('professionals.gpt_parser.parse_resume_with_gpt', return_value=self.parsed):
+            response = self._upload()
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        for job in stale:
+            job.refresh_from_db()
+            self.assertEqual(job.status, ParseJob.FAILED)
+            self.assertIn("worker stopped", job.error)
+
+    def test_depth_check_and_insert_are_serialized(self):
+        """Test the queue is write-locked before the depth check, inside the insert's transaction"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from .jobs import enqueue_parse_job
+        resume = SimpleUploadedFile("resume.pdf", b"%PDF-1.4 fake", content_type="application/pdf")
+        with CaptureQueriesContext(connection) as queries:
+            enqueue_parse_job(resume)
+        statements = [query['sql'].split()[0] for query in queries.captured_queries]
+        self.assertEqual(statements, ['SAVEPOINT', 'UPDATE', 'SELECT', 'INSERT', 'RELEASE'])
+
+    def test_unknown_job(self):
+        """Test polling an unknown job id returns 404"""
+        response = self.client.get('/api/professionals/parse-jobs/00000000-0000-0000-0000-000000000000')
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+@mock.patch.dict('os.environ', {'OPENAI_API_KEY': 'test'})
+class ResumeParseCacheTest(APITestCase):
+    """Test cases for the content-hash resume parse cache"""
+
+    parsed = {"full_name": "Jane Doe", "email": "jane@example.com"}
+
+    def setUp(self):
+        resume_cache.clear_cache()
+
+    def _upload(self, content=b"%PDF-1.4 same"):
+        resume = SimpleUploadedFile("resume.pdf", content, content_type="application/pdf")
+        return self.client.post('/api/professionals/parse-resume', {'resume': resume})
+
+    @mock.patch('professionals.gpt_parser.parse_resume_with_gpt')
+    def test_repeat_upload_is_served_from_cache(self, parse):
+        """Test the same PDF is parsed once and then served from cache"""
+        parse.return_value = self.parsed
+        first = self._upload()
+        second = self._upload()
+        self.assertEqual(first.data['cache'], 'miss')
+        self.assertEqual(second.data['cache'], 'hit')
+        self.assertEqual(second.data['data']['email'], self.parsed['email'])
+        self.assertEqual(parse.call_count, 1)
+
+        stats = self.client.get('/api/professionals/parse-resume/cache').data
+        self.assertEqual((stats['hits'], stats['misses'], stats['hit_rate']), (1, 1, 0.5))
+
+    def test_changing_a_result_does_not_change_the_cache(self):
+        """Test callers get copies of memory-tier results"""
+        parse = mock.Mock(return_value={"full_name": "Jane Doe", "confidence": {"full_name": 90}})
+        result, _ = resume_cache.parse_resume_cached(io.BytesIO(b"%PDF-1.4 same"), parse=parse)
+        result['confidence']['full_name'] = 0
+        result['extra'] = True
+        hit, cache = resume_cache.parse_resume_cached(io.BytesIO(b"%PDF-1.4 same"), parse=parse)
+        hit['full_name'] = "Changed"
+        again, _ = resume_cache.parse_resume_cached(io.BytesIO(b"%PDF-1.4 same"), parse=parse)
+        self.assertEqual(cache, 'hit')
+        self.assertEqual(again, {"full_name": "Jane Doe", "confidence": {"full_name": 90}})
+
+    @override_settings(PROFESSIONALS={'RESUME_CACHE_MAX_ENTRIES': 2})
+    def test_database_tier_is_pruned_at_most_once_per_interval(self):
+        """Test the size limit is enforced on an interval, not counted on every miss"""
+        parse = mock.Mock(return_value=self.parsed)
+        with mock.patch.object(resume_cache, 'prune', wraps=resume_cache.prune) as prune:
+            for n in range(4):
+                resume_cache.parse_resume_cached(io.BytesIO(b"%PDF-1.4 " + bytes([n])), parse=parse)
+            self.assertEqual(prune.call_count, 1)
+        self.assertEqual(ParsedResume.objects.count(), 4)
+        resume_cache.prune()
+        self.assertEqual(ParsedResume.objects.count(), 2)
+
+    @mock.patch('professionals.gpt_parser.parse_resume_with_gpt')
+    def test_database_tier_survives_process_restart(self, parse):
+        """Test a parse stored in the database tier is reused after the LRU is cleared"""
+        parse.return_value = self.parsed
+        self._upload()
+        resume_cache.memory_cache.clear()
+        response = self._upload()
+        self.assertEqual(response.data['cache'], 'hit')
+        self.assertEqual(resume_cache.stats.snapshot()['hits_by_tier']['database'], 1)
+
+    @mock.patch('professionals.gpt_parser.parse_resume_with_gpt')
+    def test_cache_key_depends_on_content_and_prompt_version(self, parse):
+        """Test different PDFs or prompt versions are not served each other's results"""
+        parse.return_value = self.parsed
+        self._upload(b"%PDF-1.4 one")
+        self._upload(b"%PDF-1.4 two")
+        with mock.patch('professionals.gpt_parser.PROMPT_VERSION', 99):
+            self._upload(b"%PDF-1.4 one")
+        self.assertEqual(parse.call_count, 3)
+
+    @mock.patch('professionals.gpt_parser.parse_resume_with_gpt')
+    def test_cache_key_depends_on_tier_settings(self, parse):
+        """Test changing the required fields or confidence threshold is not served the old parse"""
+        parse.return_value = self.parsed
+        self._upload()
+        for override in ({'PARSE_REQUIRED_FIELDS': ['email']}, {'PARSE_LOCAL_MIN_CONFIDENCE': 50}):
+            with override_settings(PROFESSIONALS=override):
+                self.assertEqual(self._upload().data['cache'], 'miss')
+        self.assertEqual(self._upload().data['cache'], 'hit')
+
+    @mock.patch('professionals.gpt_parser.parse_resume_with_gpt')
+    def test_failed_store_is_logged_and_parse_still_succeeds(self, parse):
+        """Test a locked database while storing a parse is logged and the parse is still returned"""
+        from django.db import OperationalError
+        parse.return_value = self.parsed
+        with mock.patch.object(ParsedResume.objects, 'update_or_create', side_effect=OperationalError("database is locked")), \
+                self.assertLogs('professionals.resume_cache', 'WARNING') as logs:
+            response = self._upload()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("database is locked", logs.output[0])
+
+    @override_settings(PROFESSIONALS={'RESUME_CACHE_MAX_ENTRIES': 10})
+    @mock.patch.object(resume_cache, 'PRUNE_INTERVAL', 0)
+    @mock.patch('professionals.gpt_parser.parse_resume_with_gpt')
+    def test_database_tier_evicts_least_recently_used(self, parse):
+        """Test the database tier stays within its size limit"""
+        parse.return_value = self.parsed
+        for n in range(12):
+            self._upload(f"%PDF-1.4 {n}".encode())
+        self.assertLessEqual(ParsedResume.objects.count(), 10)
+        self.assertFalse(ParsedResume.objects.filter(key=resume_cache.cache_key(b"%PDF-1.4 0")).exists())
+
+    @mock.patch('professionals.gpt_parser.parse_resume_with_gpt', side_effect=Exception("boom"))
+    def test_failures_are_not_cached(self, parse):
+        """Test a failed parse is retried on the next upload"""
+        with self.assertLogs('professionals.views', 'ERROR'):
+            self._upload()
+            self._upload()
+        self.assertEqual(parse.call_count, 2)
+
+
+@mock.patch.dict('os.environ', {'OPENAI_API_KEY': 'test'})
+class LLMClientTest(TestCase):
+    """Test cases for the pooled OpenAI client against a local stand-in server"""
+
+    def setUp(self):
+        from .llm_standin import StandInLLMServer
+        self.server = StandInLLMServer().start()
+        self.settings_override = override_settings(PROFESSIONALS={
+            'OPENAI_BASE_URL': self.server.base_url,
+            'LLM_BACKOFF_BASE': 0.001,
+            'LLM_MAX_CONCURRENCY': 2,
+        })
+        self.settings_override.enable()
+
+    def tearDown(self):
+        from .llm_client import llm
+        self.settings_override.disable()
+        llm.reset()
+        self.server.stop()
+
+    def _parse(self):
+        from .gpt_parser import parse_resume_with_gpt
+        return parse_resume_with_gpt(io.BytesIO(b"%PDF-1.4 stand-in"))
+
+    def test_parse_reuses_one_client(self):
+        """Test consecutive parses share the process-wide client"""
+        from .llm_client import llm
+        result = self._parse()
+        client = llm.get_client()
+        self._parse()
+        self.assertIs(llm.get_client(), client)
+        self.assertIn("full_name", result)
+        self.assertEqual(self.server.requests, 2)
+
+    def test_transient_errors_are_retried(self):
+        """Test 5xx and 429 responses are retried with backoff"""
+        self.server.fail_next(1, status=503)
+        self.server.fail_next(1, status=429)
+        self.assertIn("email", self._parse())
+        self.assertEqual(self.server.requests, 3)
+
+    def test_client_errors_are_not_retried(self):
+        """Test 4xx responses other than 408/409/429 fail immediately"""
+        self.server.fail_next(1, status=400)
+        with self.assertRaises(Exception):
+            self._parse()
+        self.assertEqual(self.server.requests, 1)
+
+    def test_concurrency_is_capped(self):
+        """Test in-flight LLM calls never exceed LLM_MAX_CONCURRENCY"""
+        from concurrent.futures import ThreadPoolExecutor
+        self.server.latency = 0.05
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            results = list(executor.map(lambda _: self._parse(), range(6)))
+        self.assertEqual(len(results), 6)
+        self.assertEqual(self.server.max_in_flight, 2)
+
+    def test_rate_limit_retry_after_is_honoured(self):
+        """Test a 429 from the stand-in's rate limit is retried after its Retry-After delay"""
+        from .llm_client import llm
+        from .llm_standin import StandInLLMServer
+        with StandInLLMServer(rate_limit=4) as server, override_settings(PROFESSIONALS={
+            'OPENAI_BASE_URL': server.base_url, 'LLM_BACKOFF_BASE': 0.001,
+        }):
+            llm.reset()
+            results = [self._parse() for _ in range(5)]
+        self.assertTrue(all("email" in result for result in results))
+        self.assertEqual(server.rate_limited, 1)
+        self.assertEqual(server.requests, 6)
+
+
+class StandInLLMServerTest(TestCase):
+    """Test cases for the stand-in's latency distributions, injected errors and rate limit"""
+
+    def setUp(self):
+        import httpx
+        self.client = httpx.Client()
+
+    def tearDown(self):
+        self.client.close()
+
+    def _post(self, server, body=b'{"model": "m"}'):
+        return self.client.post(server.base_url + '/chat/completions', content=body)
+
+    def test_latency_specs(self):
+        """Test latency specs parse and sample within their distribution"""
+        import random
+        from .llm_standin import Latency
+        rng = random.Random(1)
+        self.assertEqual(Latency.parse('0.25').sample(rng), 0.25)
+        self.assertTrue(all(0.1 <= Latency.parse('uniform:0.1,0.2').sample(rng) <= 0.2 for _ in range(50)))
+        self.assertTrue(all(Latency.parse('normal:0,1').sample(rng) >= 0 for _ in range(50)))
+        samples = sorted(Latency.parse('lognormal:0.5,0.4').sample(rng) for _ in range(501))
+        self.assertAlmostEqual(samples[250], 0.5, delta=0.1)
+        for spec in ('gamma:1,2', 'uniform:0.1', 'fast'):
+            with self.assertRaises(ValueError):
+                Latency.parse(spec)
+
+    def test_responses_are_deterministic(self):
+        """Test the same body gets the same completion"""
+        from .llm_standin import StandInLLMServer
+        with StandInLLMServer() as server:
+            first, second = self._post(server), self._post(server)
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(first.json()['choices'], second.json()['choices'])
+
+    def test_error_rate_is_seeded(self):
+        """Test error_rate answers that share of calls with 500, identically for the same seed"""
+        from .llm_standin import StandInLLMServer
+        runs = []
+        for _ in range(2):
+            with StandInLLMServer(error_rate=0.3, seed=5) as server:
+                runs.append([self._post(server).status_code for _ in range(40)])
+        self.assertEqual(runs[0], runs[1])
+        self.assertEqual(set(runs[0]), {200, 500})
+        self.assertEqual(server.errors_injected, runs[0].count(500))
+
+    def test_rate_limit_answers_429_with_retry_after(self):
+        """Test calls beyond rate_limit get 429 with a Retry-After header"""
+        from .llm_standin import StandInLLMServer
+        with StandInLLMServer(rate_limit=2) as server:
+            responses = [self._post(server) for _ in range(3)]
+        self.assertEqual([response.status_code for response in responses], [200, 200, 429])
+        self.assertGreater(float(responses[2].headers['Retry-After']), 0)
+        self.assertEqual(responses[2].json()['error']['type'], 'rate_limit_exceeded')
+        self.assertEqual(server.rate_limited, 1)
+
+
+@mock.patch.dict('os.environ', {'OPENAI_API_KEY': 'test'})
+@override_settings(PROFESSIONALS={'PARSE_BATCH_CONCURRENCY': 1, 'PARSE_BATCH_MAX_FILES': 3})
+class BatchResumeParseTest(APITestCase):
+    """Test cases for batch resume parsing"""
+
+    url = '/api/professionals/parse-resume/batch'
+
+    def setUp(self):
+        resume_cache.clear_cache()
+
+    def _pdf(self, name, content=None):
+        return SimpleUploadedFile(name, content or f"%PDF-1.4 {name}".encode(), content_type="application/pdf")
+
+    def _zip(self, members):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w') as archive:
+            for name, content in members.items():
+                archive.writestr(name, content)
+        return SimpleUploadedFile("batch.zip", buffer.getvalue(), content_type="application/zip")
+
+    @mock.patch('professionals.gpt_parser.parse_resume_with_gpt')
+    def test_batch_returns_results_in_upload_order(self, parse):
+        """Test each file gets a result and one failure does not fail the batch"""
+        parse.side_effect = lambda f: {"raw": f.read().decode()} if b"b.pdf" not in f.getvalue() else 1 / 0
+        with self.assertLogs('professionals.batch_parse', 'WARNING') as logs:
+            response = self.client.post(self.url, {'resumes': [self._pdf("a.pdf"), self._pdf("b.pdf")]})
+        self.assertIn("b.pdf", logs.output[0])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['summary']['files'], 2)
+        self.assertEqual(response.data['summary']['failed'], 1)
+        first, second = response.data['results']
+        self.assertEqual((first['file_name'], first['success']), ("a.pdf", True))
+        self.assertEqual(first['data']['raw'], "%PDF-1.4 a.pdf")
+        self.assertFalse(second['success'])
+
+    @mock.patch('professionals.gpt_parser.parse_resume_with_gpt', return_value={"full_name": "Jane"})
+    def test_zip_archive_is_expanded(self, parse):
+        """Test PDFs inside a zip are parsed and metadata entries skipped"""
+        archive = self._zip({"x/one.pdf": b"%PDF-1 one", "two.pdf": b"%PDF-1 two", "__MACOSX/._one.pdf": b"junk"})
+        response = self.client.post(self.url, {'archive': archive})
+        names = [result['file_name'] for result in response.data['results']]
+        self.assertEqual(names, ["batch.zip/x/one.pdf", "batch.zip/two.pdf"])
+        self.assertEqual(parse.call_count, 2)
+
+    @mock.patch('professionals.gpt_parser.parse_resume_with_gpt')
+    def test_invalid_file_rejects_whole_batch(self, parse):
+        """Test validation runs before any parse and reports each bad file"""
+        response = self.client.post(self.url, {'resumes': [
+            self._pdf("a.pdf"), self._pdf("notes.txt"), self._pdf("fake.pdf", b"hello"),
+        ]})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual([f['file_name'] for f in response.data['files']], ["notes.txt", "fake.pdf"])
+        parse.assert_not_called()
+
+        response = self.client.post(self.url, {'resumes': [self._pdf(f"{n}.pdf") for n in range(4)]})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    @mock.patch('professionals.gpt_parser.parse_resume_with_gpt', return_value={"full_name": "Jane"})
+    def test_stream_emits_line_per_file_then_summary(self, parse):
+        """Test ?stream=1 returns NDJSON results followed by a summary"""
+        response = self.client.post(self.url + '?stream=1', {'resumes': [self._pdf("a.pdf"), self._pdf("b.pdf")]})
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+        lines = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(lines[-1]['summary']['succeeded'], 2)
+
+    @override_settings(PROFESSIONALS={'PARSE_BATCH_MAX_FILES': 10, 'PARSE_BATCH_MAX_BYTES': 250})
+    def test_batch_size_limit_stops_reading_early(self):
+        """Test a batch over PARSE_BATCH_MAX_BYTES is rejected before the rest is read or decompressed"""
+        from .batch_parse import BatchError, collect_batch_files
+        archive = self._zip({f"{n}.pdf": b"%PDF" + b"x" * 96 for n in range(5)})
+        opened = []
+        original_open = zipfile.ZipFile.open
+
+        def tracking_open(archive, member, *args, **kwargs):
+            opened.append(member)
+            return original_open(archive, member, *args, **kwargs)
+
+        with mock.patch.object(zipfile.ZipFile, 'open', tracking_open):
+            with self.assertRaisesRegex(BatchError, "too large"):
+                collect_batch_files([archive])
+        self.assertEqual(len(opened), 3)
+
+        uploads = [self._pdf(f"{n}.pdf", b"%PDF" + b"x" * 96) for n in range(5)]
+        for upload in uploads:
+            upload.file = mock.Mock(wraps=upload.file)
+        with self.assertRaisesRegex(BatchError, "too large"):
+            collect_batch_files(uploads)
+        self.assertEqual([upload.file.read.called for upload in uploads], [True, True, False, False, False])
+
+    @mock.patch('professionals.batch_parse.READ_CHUNK_SIZE', 16)
+    def test_oversized_zip_member_is_not_kept(self):
+        """Test a member decompressing past MAX_FILE_SIZE is reported as too large and its bytes released"""
+        from .batch_parse import _BatchFiles, _read_member
+        archive = zipfile.ZipFile(self._zip({"big.pdf": b"%PDF" + b"x" * 200}))
+        files = _BatchFiles()
+        with mock.patch('professionals.batch_parse.MAX_FILE_SIZE', 100):
+            self.assertIsNone(_read_member(archive, archive.getinfo("big.pdf"), files))
+        self.assertEqual(files.bytes, 0)
+
+    def test_fan_out_takes_about_the_slowest_parse(self):
+        """Test files are parsed concurrently rather than one after another"""
+        from .batch_parse import parse_batch
+
+        def slow_parse(pdf_file):
+            time.sleep(0.2)
+            return {"size": len(pdf_file.read())}, 'miss'
+
+        files = [(f"{n}.pdf", b"%PDF" * n) for n in range(1, 7)]
+        started = time.perf_counter()
+        results = list(parse_batch(files, concurrency=6, parse=slow_parse))
+        self.assertLess(time.perf_counter() - started, 0.6)
+        self.assertEqual(sorted(r['data']['size'] for r in results), [4, 8, 12, 16, 20, 24])
+
+
+@mock.patch.dict('os.environ', {'OPENAI_API_KEY': 'test'})
+class TieredResumeParseTest(TestCase):
+    """Test cases for the local-first tiered resume parser"""
+
+    lines = ["Ada Lovelace", "Senior Engineer at Acme Inc.", "ada@example.com | +1 (555) 010-2030", "Experience 2019-2023"]
+
+    def _parse(self, lines):
+        from .resume_parser import parse_resume
+        from .synthetic import resume_pdf
+        return parse_resume(io.BytesIO(resume_pdf(lines)))
+
+    @mock.patch('professionals.gpt_parser.parse_fields_from_text')
+    @mock.patch('professionals.gpt_parser.parse_resume_with_gpt')
+    def test_text_resume_is_answered_locally(self, parse_pdf, parse_text):
+        """Test a text PDF with every field found never calls the LLM"""
+        result = self._parse(self.lines)
+        self.assertEqual(result['tier'], 'local')
+        self.assertEqual(
+            [result[field] for field in ['full_name', 'email', 'phone', 'company_name', 'job_title']],
+            ["Ada Lovelace", "ada@example.com", "+1 (555) 010-2030", "Acme Inc.", "Senior Engineer"],
+        )
+        parse_pdf.assert_not_called()
+        parse_text.assert_not_called()
+
+    @mock.patch('professionals.gpt_parser.parse_fields_from_text')
+    def test_contact_fields_alone_skip_the_llm(self, parse_text):
+        """Test by default a resume without a title line is answered locally"""
+        result = self._parse(["Ada Lovelace", "ada@example.com", "+1 (555) 010-2030"])
+        self.assertEqual(result['tier'], 'local')
+        self.assertIsNone(result['company_name'])
+        parse_text.assert_not_called()
+
+    @override_settings(PROFESSIONALS={'PARSE_REQUIRED_FIELDS': ['full_name', 'email', 'phone', 'company_name', 'job_title']})
+    @mock.patch('professionals.gpt_parser.parse_resume_with_gpt')
+    @mock.patch('professionals.gpt_parser.parse_fields_from_text')
+    def test_only_missing_fields_are_sent_as_text(self, parse_text, parse_pdf):
+        """Test the LLM is asked only for weak fields, using extracted text"""
+        parse_text.return_value = {
+            "company_name": "Acme Inc.", "job_title": "CTO",
+            "confidence": {"company_name": 90, "job_title": 90},
+        }
+        result = self._parse(["Ada Lovelace", "ada@example.com", "+1 (555) 010-2030"])
+        text, fields = parse_text.call_args[0]
+        self.assertIn("ada@example.com", text)
+        self.assertEqual(fields, ['company_name', 'job_title'])
+        self.assertEqual(result['tier'], 'local+llm')
+        self.assertEqual(result['job_title'], "CTO")
+        self.assertEqual(result['sources']['job_title'], 'llm')
+        self.assertEqual(result['sources']['email'], 'local')
+        parse_pdf.assert_not_called()
+
+    @mock.patch('professionals.gpt_parser.parse_resume_with_gpt', return_value={"full_name": "Jane Doe"})
+    def test_scanned_pdf_goes_to_llm(self, parse_pdf):
+        """Test a PDF without a text layer is sent to the LLM whole"""
+        from .resume_parser import parse_resume
+        result = parse_resume(io.BytesIO(b"%PDF-1.4 scanned"))
+        self.assertEqual(result['tier'], 'llm')
+        self.assertEqual(parse_pdf.call_args[0][0].read(), b"%PDF-1.4 scanned")
+
+    @override_settings(PROFESSIONALS={'PARSE_MIN_TEXT_CHARS': 0})
+    @mock.patch('professionals.gpt_parser.parse_resume_with_gpt', return_value={"full_name": "Jane Doe"})
+    def test_unreadable_pdf_goes_to_llm_without_min_text(self, parse_pdf):
+        """Test a PDF PyPDF2 cannot read is sent whole even with PARSE_MIN_TEXT_CHARS 0"""
+        from .resume_parser import parse_resume
+        with mock.patch('professionals.resume_parser.extract_until_found', side_effect=ValueError("bad pdf")):
+            result = parse_resume(io.BytesIO(b"not a pdf"))
+        self.assertEqual(result['tier'], 'llm')
+
+    @mock.patch.dict('os.environ', {'OPENAI_API_KEY': ''})
+    def test_local_parse_needs_no_api_key(self):
+        """Test the endpoint answers a text resume locally without an OpenAI key"""
+        from .synthetic import resume_pdf
+        resume_cache.clear_cache()
+        resume = SimpleUploadedFile("resume.pdf", resume_pdf(self.lines), content_type="application/pdf")
+        response = self.client.post('/api/professionals/parse-resume', {'resume': resume})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['data']['tier'], 'local')
+
+        scanned = SimpleUploadedFile("scan.pdf", b"%PDF-1.4 scanned", content_type="application/pdf")
+        response = self.client.post('/api/professionals/parse-resume', {'resume': scanned})
+        self.assertEqual(response.status_code, 503)
+
+    def test_phone_score_prefers_full_numbers_over_dates(self):
+        """Test date ranges do not outrank a real phone number"""
+        from .pdf_utils import extract_professional_info_scored
+        result = extract_professional_info_scored("Jane Doe\n2019-2023 Globex\nPhone: 415.555.0134")
+        self.assertEqual(result['phone'], "415.555.0134")
+        self.assertEqual(result['confidence']['phone'], 90)
+
+
+class PDFPageStreamingTest(TestCase):
+    """Test cases for incremental PDF text extraction"""
+
+    def _pdf(self, pages):
+        from .synthetic import resume_pdf
+        first = ["Ada Lovelace", "Senior Engineer at Acme Inc.", "ada@example.com | +1 (555) 010-2030"]
+        return io.BytesIO(resume_pdf(first, [[f"Page {n}"] for n in range(2, pages + 1)]))
+
+    def test_max_pages_limits_extraction(self):
+        """Test only the first max_pages pages are read"""
+        from .pdf_utils import extract_text_from_pdf
+        text = extract_text_from_pdf(self._pdf(5), max_pages=2)
+        self.assertIn("Page 2", text)
+        self.assertNotIn("Page 3", text)
+
+    def test_early_exit_once_fields_are_found(self):
+        """Test extraction stops after the page holding the required fields"""
+        from .pdf_utils import PROFESSIONAL_FIELDS, extract_until_found
+        text, info = extract_until_found(self._pdf(20), PROFESSIONAL_FIELDS)
+        self.assertNotIn("Page 2", text)
+        self.assertEqual(info['email'], "ada@example.com")
+
+        text, info = extract_until_found(self._pdf(3), ['full_name'], max_pages=2)
+        self.assertNotIn("Page 2", text)
+
+    def test_process_pool_keeps_page_order(self):
+        """Test pages extracted in worker processes come back in order"""
+        from .pdf_utils import _extract_pages_parallel, extract_text_from_pdf
+        pages = _extract_pages_parallel(self._pdf(7), None, 3)
+        self.assertEqual([page.strip() for page in pages[1:]], [f"Page {n}" for n in range(2, 8)])
+        self.assertEqual("\n".join(pages).strip(), extract_text_from_pdf(self._pdf(7)))
+
+
+class ContactExtractionTest(TestCase):
+    """Test cases for the regex contact extractor"""
+
+    def test_dates_and_ids_before_phone_are_skipped(self):
+        """Test phone-like distractors earlier in the text are not returned"""
+        from .pdf_utils import extract_professional_info
+        text = "\n".join([
+            "Jane Doe", "2015-2019 Engineer, Globex", "Employee ID 4481920375", "SF, CA 94107-1234",
+            "Ref. 0503-951-2008", "jane@example.com | +1 (415) 555-0134",
+        ])
+        info = extract_professional_info(text)
+        self.assertEqual(info['phone'], "+1 (415) 555-0134")
+        self.assertEqual(info['email'], "jane@example.com")
+        self.assertEqual(info['full_name'], "Jane Doe")
+        self.assertIsNone(extract_professional_info("Jane Doe\nSince 2015, ID 4481920375")['phone'])
+
+    def test_unformatted_and_trunk_prefixed_numbers(self):
+        """Test bare 10/11-digit numbers and 1-800 style numbers are still found"""
+        from .pdf_utils import extract_professional_info
+        for phone in ["5551234567", "15551234567", "1-800-555-1234", "1 (800) 555-1234"]:
+            with self.subTest(phone=phone):
+                self.assertEqual(extract_professional_info(f"Jane Doe\nPhone: {phone}")['phone'], phone)
+        self.assertIsNone(extract_professional_info("Jane Doe\nOrder #5551234567")['phone'])
+        self.assertIsNone(extract_professional_info("Jane Doe\nBadge 555123456789")['phone'])
+
+    def test_short_and_ssn_shaped_numbers_are_not_phones(self):
+        """Test both extractors reject 7-digit and SSN-shaped numbers"""
+        from .pdf_utils import extract_professional_info, extract_professional_info_scored
+        for text in ["Jane Doe\nSSN 123-45-6789", "Jane Doe\nCall 555-1234", "Jane Doe\n+1 234 5678 9012 3456"]:
+            with self.subTest(text=text):
+                self.assertIsNone(extract_professional_info(text)['phone'])
+                scored = extract_professional_info_scored(text)
+                self.assertIsNone(scored['phone'])
+                self.assertEqual(scored['confidence']['phone'], 0)
+
+    def test_batch_matches_single_extraction(self):
+        """Test the batch API returns per-text results in order"""
+        from .pdf_utils import extract_professional_info, extract_professional_info_batch
+        from .synthetic import resume_texts
+        corpus = resume_texts(300)
+        results = extract_professional_info_batch(text for text, _ in corpus)
+        self.assertEqual(results, [extract_professional_info(text) for text, _ in corpus])
+        for result, (_, truth) in zip(results, corpus):
+            self.assertEqual((result['email'], result['phone']), (truth['email'], truth['phone']))
+
+
+class ProfessionalSearchTest(APITestCase):
+    """Test cases for full-text search"""
+
+    url = '/api/professionals/search'
+
+    def setUp(self):
+        Professional.objects.create(full_name="Grace Hopper", email="grace@navy.mil", company_name="US Navy",
+                                    job_title="Rear Admiral", source="direct")
+        Professional.objects.create(full_name="Alan Turing", email="alan.grace@example.com",
+                                    company_name="Bletchley Park", job_title="Cryptanalyst", source="partner")
+
+    def _names(self, **params):
+        response = self.client.get(self.url, params)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [result['full_name'] for result in response.data['results']]
+
+    def test_ranked_prefix_search(self):
+        """Test prefix terms match and a name match outranks an email match"""
+        self.assertEqual(self._names(q="grac"), ["Grace Hopper", "Alan Turing"])
+        self.assertEqual(self._names(q="bletch crypt"), ["Alan Turing"])
+        self.assertEqual(self._names(q="grace", source="partner"), ["Alan Turing"])
+
+    def test_index_follows_every_upsert_path(self):
+        """Test single, bulk and delete writes keep the index in sync"""
+        self.client.post('/api/professionals/', {
+            'full_name': 'Ada Lovelace', 'email': 'ada@example.com', 'source': 'direct'
+        }, format='json')
+        self.client.post('/api/professionals/bulk', [
+            {'full_name': 'Grace Hopper', 'email': 'grace@navy.mil', 'company_name': 'Remington Rand', 'source': 'direct'},
+            {'full_name': 'Edsger Dijkstra', 'phone': '+31 20 555 0100', 'source': 'internal'},
+        ], format='json')
+        self.assertEqual(self._names(q="ada"), ["Ada Lovelace"])
+        self.assertEqual(self._names(q="edsger"), ["Edsger Dijkstra"])
+        self.assertEqual(self._names(q="remington"), ["Grace Hopper"])
+        self.assertEqual(self._names(q="navy us"), [])
+
+        Professional.objects.filter(full_name="Ada Lovelace").delete()
+        self.assertEqual(self._names(q="ada"), [])
+
+    def test_query_syntax_is_not_interpreted(self):
+        """Test FTS5 operators in user input are treated as plain terms"""
+        self.assertEqual(self._names(q='"hopper* grace:'), ["Grace Hopper"])
+        self.assertEqual(self._names(q='grace OR turing'), [])
+        self.assertEqual(self._names(q='"(*'), [])
+
+    def test_missing_query_and_bad_limit(self):
+        """Test q is required and limit is bounded"""
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.get(self.url, {'q': 'grace', 'limit': 0}).status_code,
+                         status.HTTP_400_BAD_REQUEST)
+
+    def test_rebuild_command(self):
+        """Test the rebuild command re-indexes every professional"""
+        from django.core.management import call_command
+        out = io.StringIO()
+        call_command('rebuild_search_index', stdout=out)
+        self.assertIn("Indexed 2 professionals", out.getvalue())
+        self.assertEqual(self._names(q="turing"), ["Alan Turing"])
+
+
+class NormalizedKeyTest(APITestCase):
+    """Test cases for canonical email/phone dedup keys"""
+
+    def test_normalizers(self):
+        """Test emails are case-folded and phones reduced to E.164"""
+        from .normalize import normalize_email, normalize_phone
+        self.assertEqual(normalize_email("  Jane@X.com "), "jane@x.com")
+        self.assertIsNone(normalize_email(""))
+        for phone in ["+1 (555) 123-4567", "555-123-4567", "1.555.123.4567", "(555) 123 4567 ext. 89"]:
+            self.assertEqual(normalize_phone(phone), "+15551234567")
+        self.assertEqual(normalize_phone("0044 20 7946 0000"), "+442079460000")
+        self.assertEqual(normalize_phone("020 7946 0000", country_code="44"), "+442079460000")
+        self.assertIsNone(normalize_phone("n/a"))
+
+    def test_save_fills_keys(self):
+        """Test every save recomputes the keys, including update_fields saves"""
+        professional = Professional.objects.create(full_name="Jane", email="Jane@X.com",
+                                                   phone="555-123-4567", source="direct")
+        self.assertEqual((professional.email_normalized, professional.phone_e164), ("jane@x.com", "+15551234567"))
+        professional.email = "JANE@Y.com"
+        professional.save(update_fields=['email'])
+        professional.refresh_from_db()
+        self.assertEqual(professional.email_normalized, "jane@y.com")
+
+    def test_single_post_matches_normalized_keys(self):
+        """Test POST updates the row whose email differs only in case"""
+        Professional.objects.create(full_name="Jane", email="jane@x.com", source="direct")
+        response = self.client.post('/api/professionals/', {
+            'full_name': 'Jane Smith', 'email': 'Jane@X.com', 'source': 'partner'
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Professional.objects.get().full_name, "Jane Smith")
+
+    def test_bulk_matches_normalized_keys(self):
+        """Test differently formatted keys merge with existing rows and each other"""
+        existing = Professional.objects.create(full_name="Jane", phone="+1 (555) 123-4567", source="direct")
+        response = self.client.post('/api/professionals/bulk', [
+            {'full_name': 'Jane Smith', 'phone': '555-123-4567', 'source': 'partner'},
+            {'full_name': 'Ada', 'email': 'ada@example.com', 'source': 'direct'},
+            {'full_name': 'Ada Lovelace', 'email': 'ADA@example.com', 'source': 'direct'},
+        ], format='json')
+        self.assertEqual(len(response.data['failed']), 0)
+        self.assertEqual(Professional.objects.count(), 2)
+        existing.refresh_from_db()
+        self.assertEqual((existing.full_name, existing.phone), ("Jane Smith", "555-123-4567"))
+        self.assertEqual(Professional.objects.get(email_normalized="ada@example.com").full_name, "Ada Lovelace")
+
+    def test_backfill_keeps_key_on_oldest_duplicate(self):
+        """Test the data migration fills keys and leaves later duplicates NULL"""
+        import importlib
+        from django.apps import apps
+        from django.db import connection
+        migration = importlib.import_module('professionals.migrations.0007_professional_normalized_keys')
+
+        first = Professional.objects.create(full_name="Jane", email="Jane@X.com", source="direct")
+        Professional.objects.update(email_normalized=None, phone_e164=None)
+        second = Professional.objects.create(full_name="Jane Dup", email="jane@x.com",
+                                             phone="555-123-4567", source="partner")
+        Professional.objects.update(email_normalized=None, phone_e164=None)
+
+        with self.assertLogs(migration.__name__, 'WARNING') as logs:
+            migration.backfill_normalized_keys(apps, mock.Mock(connection=connection))
+        self.assertIn("1 duplicate professionals", logs.output[0])
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual(first.email_normalized, "jane@x.com")
+        self.assertIsNone(second.email_normalized)
+        self.assertEqual(second.phone_e164, "+15551234567")
+
+    def test_legacy_duplicate_save_is_a_validation_error(self):
+        """Test rows the backfill left unkeyed are rejected on save, not with a 500"""
+        Professional.objects.create(full_name="Jane", email="jane@x.com", source="direct")
+        legacy = Professional.objects.create(full_name="Jane Dup", email="other@x.com",
+                                             phone="555-123-4567", source="partner")
+        Professional.objects.filter(pk=legacy.pk).update(email="Jane@X.com", email_normalized=None)
+        legacy.refresh_from_db()
+
+        with self.assertRaises(ValidationError) as raised:
+            legacy.full_clean()
+        self.assertIn('email', raised.exception.message_dict)
+        response = self.client.post('/api/professionals/', {
+            'full_name': "Jane Dup", 'phone': "(555) 123-4567", 'source': "partner",
+        }, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, {'email': ["Professional with this email already exists."]})
+        legacy.refresh_from_db()
+        self.assertIsNone(legacy.email_normalized)
+
+        with self.assertLogs('professionals.upsert', 'WARNING'):
+            response = self.client.post('/api/professionals/bulk', [
+                {'full_name': "Jane Dup", 'phone': "555-123-4567", 'source': "partner"},
+            ], format='json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['failed'][0]['reason'], "Professional with this email already exists.")
+
+
+class DuplicateDetectionTest(APITestCase):
+    """Test cases for blocking-based duplicate detection"""
+
+    url = '/api/professionals/duplicates'
+
+    def setUp(self):
+        self.jane = Professional.objects.create(full_name="Jane Smith", email="jane.smith@acme.com",
+                                                company_name="Acme Inc.", source="direct")
+        self.jane_partner = Professional.objects.create(full_name="Smith, Jane Q.", phone="+44 20 7946 0000",
+                                                        company_name="ACME", source="partner")
+        self.other_jane = Professional.objects.create(full_name="Jane Smith", email="js@globex.com",
+                                                      company_name="Globex", source="internal")
+
+    def _pairs(self):
+        return set(DuplicateCandidate.objects.values_list('professional_a', 'professional_b'))
+
+    def test_similarity(self):
+        """Test name normalization and Jaro-Winkler similarity"""
+        from .dedup import normalize_name, normalize_company, similarity
+        self.assertEqual(normalize_name("Smith, Dr. Jane Q."), "jane smith")
+        self.assertEqual(normalize_company("The ACME Corp."), "acme")
+        self.assertEqual(similarity("martha", "marhta"), similarity("marhta", "martha"))
+        self.assertAlmostEqual(similarity("martha", "marhta"), 0.961, places=3)
+        self.assertEqual(similarity("", "jane"), 0.0)
+
+    def test_full_run_scores_blocked_pairs(self):
+        """Test a variant of the same person is found but a namesake elsewhere is not"""
+        from .dedup import find_duplicates
+        run = find_duplicates()
+        self.assertTrue(run.full)
+        self.assertEqual(self._pairs(), {(self.jane.id, self.jane_partner.id)})
+        candidate = DuplicateCandidate.objects.get()
+        self.assertEqual(candidate.score, 80)
+        self.assertIn('company', candidate.reasons)
+
+    def test_incremental_run_compares_only_changed_rows(self):
+        """Test later runs only compare new rows and keep dismissed pairs"""
+        from .dedup import find_duplicates
+        find_duplicates()
+        DuplicateCandidate.objects.update(status=DuplicateCandidate.DISMISSED)
+
+        run = find_duplicates()
+        self.assertFalse(run.full)
+        self.assertEqual((run.rows_changed, run.pairs_compared), (0, 0))
+
+        newcomer = Professional.objects.create(full_name="Jane Smyth", email="jane.smith+cv@gmail.com",
+                                               source="internal")
+        run = find_duplicates()
+        self.assertEqual(run.rows_changed, 1)
+        self.assertEqual(run.pairs_compared, 1)
+        self.assertIn((self.jane.id, newcomer.id), self._pairs())
+        self.assertEqual(DuplicateCandidate.objects.get(professional_b=self.jane_partner).status,
+                         DuplicateCandidate.DISMISSED)
+
+    def test_oversized_blocks_are_skipped(self):
+        """Test blocks over the size cap are not compared"""
+        from .dedup import find_duplicates
+        run = find_duplicates(max_block_size=1)
+        self.assertEqual(run.pairs_compared, 0)
+        self.assertGreater(run.blocks_skipped, 0)
+
+    def test_one_run_at_a_time(self):
+        """Test a run in progress blocks others with 409 until it finishes or goes stale"""
+        from datetime import timedelta
+        from django.utils import timezone
+        from .models import DedupRun
+        running = DedupRun.objects.create(started_at=timezone.now())
+
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertIsNone(self.client.get(self.url).data['last_run'])
+
+        DedupRun.objects.filter(pk=running.pk).update(started_at=timezone.now() - timedelta(hours=2))
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(DedupRun.objects.filter(pk=running.pk).exists())
+        self.assertEqual(DedupRun.objects.filter(finished_at__isnull=True).count(), 0)
+
+    def test_failed_run_is_not_left_in_progress(self):
+        """Test a run that raises does not block the next one"""
+        from .dedup import find_duplicates
+        from .models import DedupRun
+        with mock.patch('professionals.dedup._compare', side_effect=RuntimeError("boom")):
+            with self.assertRaises(RuntimeError):
+                find_duplicates()
+        self.assertFalse(DedupRun.objects.exists())
+        self.assertEqual(find_duplicates().candidates, 1)
+
+    def test_api_runs_and_lists_candidates(self):
+        """Test POST runs detection and GET lists pairs with both professionals"""
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['candidates'], 1)
+
+        response = self.client.get(self.url, {'min_score': 50})
+        self.assertEqual(response.data['count'], 1)
+        pair = response.data['results'][0]
+        self.assertEqual({pair['professional_a']['source'], pair['professional_b']['source']}, {'direct', 'partner'})
+        self.assertTrue(response.data['last_run']['full'])
+        self.assertEqual(self.client.get(self.url, {'min_score': 90}).data['count'], 0)
+        self.assertEqual(self.client.get(self.url, {'limit': 0}).status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_invalid_params_name_the_bad_param(self):
+        """Test a bad min_score is reported as such, not as a bad limit"""
+        response = self.client.get(self.url, {'min_score': 'abc'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['error'], "Invalid min_score")
+
+        response = self.client.get(self.url, {'limit': 'abc', 'min_score': 50})
+        self.assertEqual(response.data['error'], "Invalid limit")
+
+
+class ConditionalListTest(APITestCase):
+    """Test cases for ETag/Last-Modified on the professionals list"""
+
+    url = '/api/professionals/'
+
+    def setUp(self):
+        self.ada = Professional.objects.create(full_name="Ada Lovelace", email="ada@example.com", source="direct")
+        Professional.objects.create(full_name="Grace Hopper", email="grace@example.com", source="partner")
+
+    @override_settings(PROFESSIONALS={'LIST_CACHE_ENABLED': False})
+    def test_matching_etag_gets_304_without_serializing(self):
+        """Test a repeat poll is answered from the validator queries alone"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['ETag'].startswith('W/"'))
+        self.assertIn('Last-Modified', response)
+        self.assertEqual(response['Cache-Control'], 'private, no-cache')
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b'')
+        self.assertEqual(len(queries), 2)
+
+    def test_writes_and_deletes_change_the_etag(self):
+        """Test inserts, updates and deletes each invalidate the validator"""
+        etags = [self.client.get(self.url)['ETag']]
+
+        self.client.post('/api/professionals/bulk', [
+            {'full_name': 'Alan Turing', 'email': 'alan@example.com', 'source': 'internal'},
+        ], format='json')
+        etags.append(self.client.get(self.url)['ETag'])
+        self.ada.delete()
+        etags.append(self.client.get(self.url)['ETag'])
+        self.assertEqual(len(set(etags)), 3)
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etags[0])
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 2)
+
+    def test_filters_and_pages_have_their_own_validators(self):
+        """Test the validator depends on the query string"""
+        etag = self.client.get(self.url, {'source': 'direct'})['ETag']
+        self.assertNotEqual(etag, self.client.get(self.url)['ETag'])
+        self.assertNotEqual(etag, self.client.get(self.url, {'source': 'direct', 'limit': 1})['ETag'])
+        response = self.client.get(self.url, {'source': 'direct'}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_if_modified_since(self):
+        """Test If-Modified-Since alone is honoured"""
+        last_modified = self.client.get(self.url)['Last-Modified']
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE='Mon, 01 Jan 2001 00:00:00 GMT')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class ListResponseCacheTest(APITestCase):
+    """Test cases for the server-side professionals list cache"""
+
+    url = '/api/professionals/'
+
+    def setUp(self):
+        list_cache.clear()
+        self.ada = Professional.objects.create(full_name="Ada Lovelace", email="ada@example.com", source="direct")
+        Professional.objects.create(full_name="Grace Hopper", email="grace@example.com", source="partner")
+
+    def test_repeat_request_is_served_without_queries(self):
+        """Test a cold client gets the cached page, and a 304 when it revalidates"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        first = self.client.get(self.url)
+        self.assertEqual(first['X-Cache'], 'miss')
+
+        with CaptureQueriesContext(connection) as queries:
+            second = self.client.get(self.url)
+            revalidated = self.client.get(self.url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(len(queries), 0)
+        self.assertEqual(second['X-Cache'], 'hit')
+        self.assertEqual(second.json(), first.json())
+        self.assertEqual(second['ETag'], first['ETag'])
+        self.assertEqual(revalidated.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_keyed_by_filter_and_page(self):
+        """Test each filter and page is cached separately"""
+        self.assertEqual(len(self.client.get(self.url).data), 2)
+        self.assertEqual(len(self.client.get(self.url, {'source': 'direct'}).data), 1)
+        page = self.client.get(self.url, {'limit': 1})
+        self.assertEqual(page['X-Cache'], 'miss')
+        self.assertEqual(len(page.data['results']), 1)
+        self.assertEqual(self.client.get(self.url, {'limit': 1})['X-Cache'], 'hit')
+
+    def test_writes_invalidate_only_affected_sources(self):
+        """Test single, bulk and admin-style saves invalidate the pages they touch"""
+        for params in ({}, {'source': 'direct'}, {'source': 'partner'}):
+            self.client.get(self.url, params)
+
+        self.client.post('/api/professionals/bulk', [
+            {'full_name': 'Alan Turing', 'email': 'alan@example.com', 'source': 'partner'},
+        ], format='json')
+        self.assertEqual(self.client.get(self.url, {'source': 'direct'})['X-Cache'], 'hit')
+        response = self.client.get(self.url, {'source': 'partner'})
+        self.assertEqual((response['X-Cache'], len(response.data)), ('miss', 2))
+        self.assertEqual(len(self.client.get(self.url).data), 3)
+
+        self.client.post(self.url, {'full_name': 'Ada King', 'email': 'ada@example.com', 'source': 'direct'}, format='json')
+        self.assertEqual(self.client.get(self.url, {'source': 'direct'}).data[0]['full_name'], 'Ada King')
+
+        # Moving a row invalidates its old source as well as the new one.
+        self.client.get(self.url, {'source': 'direct'})
+        ada = Professional.objects.get(pk=self.ada.pk)
+        ada.source = 'internal'
+        ada.save()
+        self.assertEqual(len(self.client.get(self.url, {'source': 'direct'}).data), 0)
+
+        Professional.objects.filter(source='partner').delete()
+        self.assertEqual(len(self.client.get(self.url, {'source': 'partner'}).data), 0)
+
+    def test_stats_endpoint_counts_hits_and_misses(self):
+        """Test hits and misses are counted"""
+        self.client.get(self.url)
+        self.client.get(self.url)
+        self.client.get(self.url)
+        response = self.client.get('/api/professionals/cache')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual((response.data['hits'], response.data['misses']), (2, 1))
+        self.assertTrue(response.data['enabled'])
+
+    @override_settings(PROFESSIONALS={'LIST_CACHE_ENABLED': False})
+    def test_disabled(self):
+        """Test the cache can be switched off"""
+        self.client.get(self.url)
+        self.assertNotIn('X-Cache', self.client.get(self.url))
+
+
+class ReadPathTest(APITestCase):
+    """Test cases for the values_list() read path used by list and export"""
+
+    url = '/api/professionals/'
+
+    def setUp(self):
+        list_cache.clear()
+        Professional.objects.create(
+            full_name="Ada Lovelace", email="ada@example.com", phone="+1 555 0100",
+            company_name="Analytical Engines", job_title="Programmer", source="direct",
+            resume="resumes/ada lovelace.pdf",
+        )
+        Professional.objects.create(full_name="Grace Hopper", email=None, phone="555-0101", source="partner")
+
+    def test_reader_matches_model_serializer(self):
+        """Test rows are identical to ProfessionalSerializer output, resume URL included"""
+        from .readers import ProfessionalReader
+
+        queryset = Professional.objects.all()
+        expected = ProfessionalSerializer(queryset, many=True).data
+        self.assertEqual(ProfessionalReader().rows(queryset), expected)
+        self.assertEqual(
+            json.dumps(ProfessionalReader().rows(queryset)), json.dumps(expected)
+        )
+        self.assertEqual(self.client.get(self.url).content, JSONRenderer().render(expected))
+
+    def test_sparse_fieldsets(self):
+        """Test fields= limits the columns of plain and paginated lists"""
+        response = self.client.get(self.url, {'fields': 'full_name,id'})
+        self.assertEqual(response.json()[0], {'full_name': 'Grace Hopper', 'id': response.json()[0]['id']})
+
+        first = self.client.get(self.url, {'fields': 'full_name', 'limit': 1})
+        self.assertEqual(first.json()['results'], [{'full_name': 'Grace Hopper'}])
+        second = self.client.get(self.url, {'fields': 'full_name', 'limit': 1, 'cursor': first.json()['next']})
+        self.assertEqual(second.json()['results'], [{'full_name': 'Ada Lovelace'}])
+
+        response = self.client.get('/api/professionals/export', {'format': 'csv', 'fields': 'email,source'})
+        lines = b''.join(response.streaming_content).decode('utf-8').splitlines()
+        self.assertEqual(lines, ['email,source', 'ada@example.com,direct', ',partner'])
+
+    def test_unknown_field_is_rejected(self):
+        """Test fields= with an unknown column is a 400 on both paths"""
+        response = self.client.get(self.url, {'fields': 'full_name,password'})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('password', response.data['error'])
+        response = self.client.get('/api/professionals/export', {'fields': ','})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class RendererTest(APITestCase):
+    """Test cases for the orjson, MessagePack and columnar renderers"""
+
+    url = '/api/professionals/'
+
+    def setUp(self):
+        list_cache.clear()
+        Professional.objects.create(full_name="Ada Lovelace", email="ada@example.com", source="direct")
+        Professional.objects.create(full_name="Grace Hopper", phone="555-0101", source="partner")
+
+    def test_default_json_matches_stdlib_renderer(self):
+        """Test the orjson renderer produces the same document as DRF's JSONRenderer"""
+        response = self.client.get(self.url)
+        self.assertEqual(response['Content-Type'], 'application/json')
+        self.assertEqual(response.content, JSONRenderer().render(response.data))
+
+    def test_columnar_by_format_and_accept(self):
+        """Test lists and paginated results become one array per field"""
+        response = self.client.get(self.url, {'format': 'columnar', 'fields': 'full_name,source'})
+        self.assertEqual(response['Content-Type'], 'application/vnd.newtonx.columnar+json')
+        self.assertEqual(json.loads(response.content), {
+            'count': 2,
+            'columns': {'full_name': ['Grace Hopper', 'Ada Lovelace'], 'source': ['partner', 'direct']},
+        })
+
+        response = self.client.get(
+            self.url, {'limit': 1, 'fields': 'full_name'}, HTTP_ACCEPT='application/vnd.newtonx.columnar+json'
+        )
+        body = json.loads(response.content)
+        self.assertEqual(body['results'], {'count': 1, 'columns': {'full_name': ['Grace Hopper']}})
+        self.assertIsNotNone(body['next'])
+
+    def test_each_format_has_its_own_etag(self):
+        """Test a JSON validator does not revalidate the columnar representation"""
+        etag = self.client.get(self.url)['ETag']
+        response = self.client.get(self.url, {'format': 'columnar'})
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertIn('Accept', response['Vary'])
+
+    def test_messagepack(self):
+        """Test MessagePack round-trips the list, and is refused without msgpack"""
+        from . import renderers
+        if renderers.msgpack is None:
+            self.skipTest('msgpack is not installed')
+
+        response = self.client.get(self.url, HTTP_ACCEPT='application/msgpack')
+        self.assertEqual(response['Content-Type'], 'application/msgpack')
+        self.assertEqual(renderers.msgpack.unpackb(response.content), json.loads(self.client.get(self.url).content))
+
+        with mock.patch.object(renderers.MessagePackRenderer, 'available', False):
+            response = self.client.get(self.url, HTTP_ACCEPT='application/msgpack')
+            self.assertEqual(response.status_code, status.HTTP_406_NOT_ACCEPTABLE)
+            self.assertEqual(self.client.get(self.url, {'format': 'msgpack'}).status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_json_without_orjson(self):
+        """Test the JSON renderer falls back to the stdlib encoder"""
+        from . import renderers
+
+        expected = self.client.get(self.url).content
+        list_cache.clear()
+        with mock.patch.object(renderers, 'orjson', None):
+            self.assertEqual(self.client.get(self.url).content, expected)
+
+
+@override_settings(PROFESSIONALS={'LIST_CACHE_ENABLED': False})
+class QueryBudgetTest(APITestCase):
+    """
+    Query-count budgets per endpoint, measured at two table or payload sizes.
+
+    Each endpoint must issue the same number of queries at both sizes (no
+    N+1) and no more than its budget. Set ``QUERY_REPORT=<path>`` to write
+    the measured query counts and payload sizes as JSON.
+    """
+
+    sizes = (10, 40)
+    report = []
+
+    # Endpoint name -> most queries allowed, whatever the size.
+    budgets = {
+        'list': 3,
+        'list_source': 3,
+        'list_page': 3,
+        'list_sparse': 3,
+        'export': 1,
+        'search': 3,
+        'duplicates': 2,
+        'single_upsert': 6,
+        'bulk_upsert': 7,
+        'ndjson_ingest': 7,
+    }
+
+    @classmethod
+    def tearDownClass(cls):
+        import os
+        path = os.environ.get('QUERY_REPORT')
+        if path:
+            with open(path, 'w') as handle:
+                json.dump(cls.report, handle, indent=2)
+        super().tearDownClass()
+
+    def _seed(self, count):
+        from .synthetic import professional_records
+        existing = Professional.objects.count()
+        Professional.objects.bulk_create(
+            [Professional(**record) for record in professional_records(count - existing, start=existing)]
+        )
+
+    def _measure(self, name, size, call):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        with CaptureQueriesContext(connection) as queries:
+            response = call(size)
+            content = b''.join(response.streaming_content) if response.streaming else response.content
+        self.assertLess(response.status_code, 300, content[:200])
+        self.report.append({'endpoint': name, 'size': size, 'queries': len(queries), 'bytes': len(content)})
+        return [query['sql'] for query in queries]
+
+    def _assert_budget(self, name, call, seed=None):
+        counts = []
+        for size in self.sizes:
+            (seed or self._seed)(size)
+            counts.append(self._measure(name, size, call))
+        first, last = counts
+        self.assertEqual(len(first), len(last), f"{name}: query count grows with size\n" + '\n'.join(last))
+        self.assertLessEqual(len(last), self.budgets[name], f"{name}: over budget\n" + '\n'.join(last))
+
+    def test_list_endpoints(self):
+        """Test list, filter, page and sparse reads cost a fixed number of queries"""
+        calls = {
+            'list': lambda size: self.client.get('/api/professionals/'),
+            'list_source': lambda size: self.client.get('/api/professionals/', {'source': 'direct'}),
+            'list_page': lambda size: self.client.get('/api/professionals/', {'limit': 5}),
+            'list_sparse': lambda size: self.client.get('/api/professionals/', {'fields': 'id,full_name'}),
+            'export': lambda size: self.client.get('/api/professionals/export', {'format': 'csv'}),
+            'search': lambda size: self.client.get('/api/professionals/search', {'q': 'a'}),
+        }
+        from django.db import transaction
+
+        for name, call in calls.items():
+            # Each endpoint starts from an empty table.
+            with self.subTest(endpoint=name), transaction.atomic():
+                self._assert_budget(name, call)
+                transaction.set_rollback(True)
+
+    def test_duplicates_endpoint(self):
+        """Test listing candidates loads both professionals without a query per pair"""
+        from .dedup import find_duplicates
+
+        def seed(size):
+            for n in range(size // 10):
+                Professional.objects.create(
+                    full_name=f"Twin {size} {n}", email=f"twin.{size}.{n}@example.com", source="direct"
+                )
+                Professional.objects.create(
+                    full_name=f"Twin {size} {n}", email=f"twin.{size}.{n}@example.org", source="partner"
+                )
+            find_duplicates()
+
+        self._assert_budget('duplicates', lambda size: self.client.get('/api/professionals/duplicates'), seed=seed)
+
+    def test_write_endpoints(self):
+        """Test single and bulk upserts do not issue a query per record"""
+        from .synthetic import professional_records
+        no_seed = lambda size: None
+
+        self._assert_budget('single_upsert', lambda size: self.client.post(
+            '/api/professionals/', professional_records(1, start=size)[0], format='json'
+        ))
+        self._assert_budget('bulk_upsert', lambda size: self.client.post(
+            '/api/professionals/bulk', professional_records(size, seed=size), format='json'
+        ), seed=no_seed)
+
+        def ndjson(size):
+            body = '\n'.join(json.dumps(record) for record in professional_records(size, seed=size + 1))
+            return self.client.post('/api/professionals/bulk', body, content_type='application/x-ndjson')
+
+        self._assert_budget('ndjson_ingest', ndjson, seed=no_seed)
+
+
+class QueryPlanTest(APITestCase):
+    """
+    EXPLAIN QUERY PLAN checks: the list, filter, dedup lookup and search
+    queries must use an index rather than scan the professionals table.
+    """
+
+    table = Professional._meta.db_table
+
+    def setUp(self):
+        from .synthetic import professional_records
+        list_cache.clear()
+        Professional.objects.bulk_create([Professional(**record) for record in professional_records(50)])
+        from django.db import connection
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+    def _plans(self, call):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        with CaptureQueriesContext(connection) as queries:
+            call()
+        plans = []
+        with connection.cursor() as cursor:
+            for query in queries:
+                sql = query['sql']
+                if not sql.startswith('SELECT') or self.table not in sql:
+                    continue
+                cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+                plans.append((sql, [row[-1] for row in cursor.fetchall()]))
+        self.assertTrue(plans)
+        return plans
+
+    def assertNoTableScan(self, call):
+        for sql, plan in self._plans(call):
+            scans = [step for step in plan if step.split()[:2] == ['SCAN', self.table] and 'USING' not in step]
+            self.assertFalse(scans, f"Full table scan in:\n{sql}\n" + '\n'.join(plan))
+
+    def test_list_and_filter_queries_use_indexes(self):
+        """Test list, source filter, pages and validators read through indexes"""
+        for params in ({}, {'source': 'partner'}, {'limit': 10}, {'source': 'internal', 'limit': 10}):
+            with self.subTest(params=params):
+                self.assertNoTableScan(lambda: self.client.get('/api/professionals/', params))
+
+    def test_dedup_lookups_use_indexes(self):
+        """Test upserts find existing rows by their normalized keys through indexes"""
+        from .synthetic import professional_records
+
+        records = professional_records(5)
+        self.assertNoTableScan(lambda: self.client.post('/api/professionals/bulk', records, format='json'))
+        self.assertNoTableScan(lambda: self.client.post('/api/professionals/', records[0], format='json'))
+
+    def test_search_uses_fts_index(self):
+        """Test search reads the FTS index and joins rows by primary key"""
+        self.assertNoTableScan(lambda: self.client.get('/api/professionals/search', {'q': 'a'}))
+        self.assertNoTableScan(lambda: self.client.get('/api/professionals/search', {'q': 'a', 'source': 'direct'}))
+
+
+class MetricsTest(APITestCase):
+    """Test cases for the request metrics middleware and /api/metrics"""
+
+    def _sample(self, name, **labels):
+        from prometheus_client import REGISTRY
+        return REGISTRY.get_sample_value(name, labels) or 0
+
+    def test_request_counters_by_route(self):
+        """Test count, latency, DB queries and bytes are recorded under the URL name"""
+        labels = {'route': 'professional-list-create', 'method': 'GET', 'status': '200'}
+        before = {name: self._sample(name, **labels) for name in (
+            'http_requests_total', 'http_request_duration_seconds_count',
+            'http_request_db_queries_total', 'http_response_bytes_total',
+        )}
+        Professional.objects.create(full_name="Ada Lovelace", email="ada@example.com", source="direct")
+        list_cache.clear()
+
+        response = self.client.get('/api/professionals/')
+        self.assertEqual(self._sample('http_requests_total', **labels) - before['http_requests_total'], 1)
+        self.assertEqual(
+            self._sample('http_request_duration_seconds_count', **labels)
+            - before['http_request_duration_seconds_count'], 1
+        )
+        self.assertEqual(self._sample('http_request_db_queries_total', **labels)
+                         - before['http_request_db_queries_total'], 3)
+        self.assertEqual(self._sample('http_response_bytes_total', **labels)
+                         - before['http_response_bytes_total'], len(response.content))
+
+    def test_streaming_response_is_recorded_when_consumed(self):
+        """Test export bytes and queries are counted once the stream is read"""
+        labels = {'route': 'professional-export', 'method': 'GET', 'status': '200'}
+        before = self._sample('http_response_bytes_total', **labels)
+        queries_before = self._sample('http_request_db_queries_total', **labels)
+        Professional.objects.create(full_name="Ada Lovelace", email="ada@example.com", source="direct")
+
+        response = self.client.get('/api/professionals/export')
+        content = b''.join(response.streaming_content)
+        self.assertEqual(self._sample('http_response_bytes_total', **labels) - before, len(content))
+        self.assertEqual(self._sample('http_request_db_queries_total', **labels) - queries_before, 1)
+
+    def test_metrics_endpoint(self):
+        """Test /api/metrics serves the Prometheus text format"""
+        self.client.get('/api/professionals/nope')
+        response = self.client.get('/api/metrics')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+        body = response.content.decode()
+        self.assertIn('# TYPE http_request_duration_seconds histogram', body)
+        self.assertIn('http_requests_total{method="GET",route="unmatched",status="404"}', body)
+
+
+class SeedProfessionalsTest(TestCase):
+    """Test cases for the seed_professionals command"""
+
+    def _seed(self, *args):
+        from django.core.management import call_command
+        call_command('seed_professionals', *args, stdout=io.StringIO())
+        return list(Professional.objects.order_by('id').values_list('full_name', 'email', 'phone', 'source'))
+
+    def test_deterministic_with_cross_source_duplicates(self):
+        """Test the same seed gives the same rows, with duplicates planted"""
+        from .synthetic import people_records
+
+        first = self._seed('--count', '300', '--duplicate-rate', '0.2', '--seed', '3')
+        self.assertEqual(self._seed('--count', '300', '--duplicate-rate', '0.2', '--seed', '3', '--clear'), first)
+        records, pairs = people_records(300, 0.2, seed=3)
+        self.assertGreater(len(pairs), 30)
+        for original, duplicate in pairs:
+            self.assertNotEqual(records[original]['source'], records[duplicate]['source'])
+
+    def test_repeated_runs_append(self):
+        """Test a second run continues numbering instead of colliding on keys"""
+        self._seed('--count', '50')
+        rows = self._seed('--count', '50')
+        self.assertEqual(len(rows), 100)
+        self.assertEqual(len({row[2] for row in rows}), 100)
+
+
+class SQLiteProfileTest(TestCase):
+    """Test cases for the SQLite storage profile applied to new connections"""
+
+    def _pragmas(self, **settings_dict):
+        from django.db import connections
+        from .db_profile import current_pragmas
+        default = connections['default']
+        new = default.__class__({**default.settings_dict, **settings_dict}, alias='profile')
+        try:
+            new.ensure_connection()
+            return current_pragmas(new)
+        finally:
+            new.close()
+
+    def test_production_profile_is_applied(self):
+        """Test new connections get WAL, busy_timeout, synchronous=NORMAL, mmap, cache and temp_store"""
+        import tempfile
+        with tempfile.TemporaryDirectory() as directory:
+            pragmas = self._pragmas(NAME=f'{directory}/profile.sqlite3')
+        self.assertEqual(pragmas, {
+            'journal_mode': 'wal', 'busy_timeout': 5000, 'synchronous': 1,
+            'mmap_size': 256 * 1024 * 1024, 'cache_size': -64 * 1024, 'temp_store': 2,
+        })
+
+    @override_settings(PROFESSIONALS={'SQLITE_PROFILE': 'default', 'SQLITE_PRAGMAS': {'busy_timeout': 250}})
+    def test_default_profile_and_overrides(self):
+        """Test the default profile restores the rollback journal and SQLITE_PRAGMAS overrides single pragmas"""
+        import tempfile
+        with tempfile.TemporaryDirectory() as directory:
+            pragmas = self._pragmas(NAME=f'{directory}/profile.sqlite3')
+        self.assertEqual(pragmas['journal_mode'], 'delete')
+        self.assertEqual(pragmas['busy_timeout'], 250)
+
+    @override_settings(PROFESSIONALS={'SQLITE_PROFILE': 'fast'})
+    def test_unknown_profile_is_rejected(self):
+        """Test an unknown SQLITE_PROFILE fails loudly instead of running unconfigured"""
+        from .db_profile import profile_pragmas
+        with self.assertRaises(ValueError):
+            profile_pragmas()
+
+    def test_connections_are_persistent_with_health_checks(self):
+        """Test the default database keeps connections between requests and checks them before reuse"""
+        from django.conf import settings
+        self.assertGreater(settings.DATABASES['default']['CONN_MAX_AGE'], 0)
+        self.assertTrue(settings.DATABASES['default']['CONN_HEALTH_CHECKS'])
+
+
+@mock.patch.dict('os.environ', {'OPENAI_API_KEY': 'test'})
+class AsyncViewTest(APITestCase):
+    """Test cases for the async list and parse-resume views"""
+
+    def setUp(self):
+        from .llm_standin import StandInLLMServer
+        list_cache.clear()
+        resume_cache.clear_cache()
+        self.server = StandInLLMServer().start()
+        self.settings_override = override_settings(PROFESSIONALS={'OPENAI_BASE_URL': self.server.base_url})
+        self.settings_override.enable()
+        for n in range(3):
+            Professional.objects.create(full_name=f"Person {n}", email=f"p{n}@example.com", source="direct")
+
+    def tearDown(self):
+        from .llm_client import llm
+        self.settings_override.disable()
+        llm.reset()
+        self.server.stop()
+
+    def _resume(self, content=b"%PDF-1.4 scanned"):
+        return SimpleUploadedFile("resume.pdf", content, content_type="application/pdf")
+
+    def test_list_matches_sync_view(self):
+        """Test the async list returns the sync list's body and ETag for the same query"""
+        for query in ('', '?limit=2', '?source=direct&fields=id,full_name', '?format=columnar'):
+            with self.subTest(query=query):
+                expected = self.client.get(f'/api/professionals/{query}')
+                response = self.client.get(f'/api/professionals/async{query}')
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response.content, expected.content)
+                self.assertEqual(response['Content-Type'], expected['Content-Type'])
+                self.assertEqual(response['ETag'], expected['ETag'])
+
+    def test_list_validators_and_errors(self):
+        """Test If-None-Match gets a 304 and bad parameters get the sync view's errors"""
+        with override_settings(PROFESSIONALS={'LIST_CACHE_ENABLED': False}):
+            etag = self.client.get('/api/professionals/async')['ETag']
+            self.assertEqual(self.client.get('/api/professionals/async', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+        self.assertEqual(self.client.get('/api/professionals/async?fields=nope').status_code, 400)
+        self.assertEqual(self.client.get('/api/professionals/async?cursor=nope').status_code, 400)
+        self.assertEqual(self.client.get('/api/professionals/async', HTTP_ACCEPT='text/csv').status_code, 406)
+
+        expected = self.client.get('/api/professionals/?format=bogus')
+        response = self.client.get('/api/professionals/async?format=bogus')
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.json(), expected.json())
+
+    async def test_list_cache_io_stays_off_the_event_loop(self):
+        """Test the async list reads and stores cache entries from worker threads, not the event loop"""
+        import asyncio
+        from django.core.cache import caches
+        cache = caches['default']
+        on_loop = []
+
+        def off_loop(method):
+            def call(*args, **kwargs):
+                try:
+                    asyncio.get_running_loop()
+                    on_loop.append(method.__name__)
+                except RuntimeError:
+                    pass
+                return method(*args, **kwargs)
+            return call
+
+        with mock.patch.object(cache, 'get', off_loop(cache.get)), mock.patch.object(cache, 'set', off_loop(cache.set)):
+            first = await self.async_client.get('/api/professionals/async')
+            second = await self.async_client.get('/api/professionals/async')
+        self.assertEqual(on_loop, [])
+        self.assertEqual((first['X-Cache'], second['X-Cache']), ('miss', 'hit'))
+
+    async def test_upload_is_read_off_the_event_loop(self):
+        """Test the async parse view parses the multipart body in a worker thread"""
+        import asyncio
+        from . import views
+        threads = []
+        resume_upload = views._resume_upload
+
+        def record_loop(request):
+            try:
+                asyncio.get_running_loop()
+                threads.append('loop')
+            except RuntimeError:
+                threads.append('worker')
+            return resume_upload(request)
+
+        with mock.patch.object(views, '_resume_upload', record_loop):
+            response = await self.async_client.post('/api/professionals/async/parse-resume', {})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(threads, ['worker'])
+
+    def test_parse_resume(self):
+        """Test the async parse calls the LLM once and serves the repeat upload from the cache"""
+        first = self.client.post('/api/professionals/async/parse-resume', {'resume': self._resume()}, format='multipart')
+        second = self.client.post('/api/professionals/async/parse-resume', {'resume': self._resume()}, format='multipart')
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual((first.json()['cache'], second.json()['cache']), ('miss', 'hit'))
+        self.assertEqual(first.json()['data']['tier'], 'llm')
+        self.assertEqual(first.json()['data'], second.json()['data'])
+        self.assertEqual(self.server.requests, 1)
+
+    def test_parse_resume_errors_match_sync_view(self):
+        """Test validation and LLM failures give the sync view's status and body"""
+        for data in ({}, {'resume': SimpleUploadedFile("resume.txt", b"text")}):
+            with self.subTest(data=data):
+                expected = self.client.post('/api/professionals/parse-resume', data, format='multipart')
+                response = self.client.post('/api/professionals/async/parse-resume', data, format='multipart')
+                self.assertEqual(response.status_code, expected.status_code)
+                self.assertEqual(response.json(), expected.json())
+
+        self.server.fail_next(10, status=400)
+        with self.assertLogs('professionals.views', 'ERROR'):
+            response = self.client.post('/api/professionals/async/parse-resume', {'resume': self._resume()}, format='multipart')
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    async def test_parses_do_not_share_a_thread(self):
+        """Test concurrent async parses keep their LLM calls in flight together"""
+        import asyncio
+        self.server.latency = 0.2
+        responses = await asyncio.gather(*(
+            self.async_client.post('/api/professionals/async/parse-resume', {
+                'resume': self._resume(f"%PDF-1.4 scanned {n}".encode()),
+            }) for n in range(6)
+        ))
+        self.assertEqual([response.status_code for response in responses], [200] * 6)
+        self.assertEqual(self.server.max_in_flight, 6)
+
+    def test_queries_are_counted_in_metrics(self):
+        """Test queries run through sync_to_async count towards the async route's metrics"""
+        from prometheus_client import REGISTRY
+        labels = {'route': 'professional-list-async', 'method': 'GET', 'status': '200'}
+        before = REGISTRY.get_sample_value('http_request_db_queries_total', labels) or 0
+        self.client.get('/api/professionals/async')
+        self.assertEqual(REGISTRY.get_sample_value('http_request_db_queries_total', labels) - before, 3)
+
+
+class ResumeStorageTest(APITestCase):
+    """Test cases for the content-addressed, reference-counted resume storage"""
+
+    def setUp(self):
+        import tempfile
+        list_cache.clear()
+        self.media_root = tempfile.TemporaryDirectory()
+        self.settings_override = override_settings(MEDIA_ROOT=self.media_root.name)
+        self.settings_override.enable()
+
+    def tearDown(self):
+        self.settings_override.disable()
+        self.media_root.cleanup()
+
+    def _resume(self, content=b"%PDF-1.4 resume", name="resume.pdf"):
+        return SimpleUploadedFile(name, content, content_type="application/pdf")
+
+    def _files(self):
+        import os
+        return sorted(
+            os.path.relpath(os.path.join(directory, file_name), self.media_root.name)
+            for directory, _, file_names in os.walk(self.media_root.name) for file_name in file_names
+        )
+
+    def _refs(self, professional):
+        from .models import ResumeFile
+        professional.refresh_from_db()
+        return ResumeFile.objects.get(name=professional.resume.name).ref_count
+
+    def test_same_content_is_stored_once(self):
+        """Test uploads with the same bytes share one file named by its SHA-256"""
+        import hashlib
+        for n, name in enumerate(["alice.pdf", "cv-final.pdf"]):
+            response = self.client.post('/api/professionals/', {
+                'full_name': f"Person {n}", 'email': f"p{n}@example.com", 'source': 'direct',
+                'resume': self._resume(name=name),
+            }, format='multipart')
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+        digest = hashlib.sha256(b"%PDF-1.4 resume").hexdigest()
+        self.assertEqual(self._files(), [f"resumes/{digest[:2]}/{digest}.pdf"])
+        first, second = Professional.objects.order_by('id')
+        self.assertEqual(first.resume.name, second.resume.name)
+        self.assertEqual(self._refs(first), 2)
+        with first.resume.open('rb') as f:
+            self.assertEqual(f.read(), b"%PDF-1.4 resume")
+
+    def test_existing_content_is_not_written_again(self):
+        """Test storing content that is already on disk leaves the stored file and no temporary file"""
+        import os
+        Professional.objects.create(full_name="A", email="a@example.com", source="direct", resume=self._resume())
+        with mock.patch('professionals.storage.os.replace', wraps=os.replace) as replace:
+            Professional.objects.create(full_name="B", email="b@example.com", source="direct", resume=self._resume())
+        replace.assert_not_called()
+        self.assertEqual(len(self._files()), 1)
+
+    def test_upload_is_read_once_and_published_atomically(self):
+        """Test a new file is hashed while it is written, then renamed into place from the resume directory"""
+        import os
+        resume = self._resume()
+        with mock.patch.object(resume, 'chunks', wraps=resume.chunks) as chunks, \
+                mock.patch('professionals.storage.os.replace', wraps=os.replace) as replace:
+            Professional.objects.create(full_name="A", email="a@example.com", source="direct", resume=resume)
+        self.assertEqual(chunks.call_count, 1)
+        source, target = replace.call_args[0]
+        self.assertEqual(os.path.dirname(source), os.path.join(self.media_root.name, 'resumes'))
+        self.assertTrue(target.startswith(os.path.join(self.media_root.name, 'resumes', '')))
+        self.assertEqual(len(self._files()), 1)
+
+    def test_references_follow_updates_and_deletes(self):
+        """Test replacing, deleting and bulk deleting professionals moves the reference counts"""
+        from .models import ResumeFile
+        a = Professional.objects.create(full_name="A", email="a@example.com", source="direct", resume=self._resume(b"%PDF one"))
+        b = Professional.objects.create(full_name="B", email="b@example.com", source="direct", resume=self._resume(b"%PDF one"))
+        one = a.resume.name
+
+        a = Professional.objects.get(pk=a.pk)
+        a.resume = self._resume(b"%PDF two")
+        a.save()
+        self.assertEqual(ResumeFile.objects.get(name=one).ref_count, 1)
+        self.assertEqual(self._refs(a), 1)
+
+        # Saving without touching the resume, including with it deferred, keeps the counts.
+        Professional.objects.get(pk=a.pk).save()
+        Professional.objects.only('full_name').get(pk=a.pk).save()
+        self.assertEqual(self._refs(a), 1)
+
+        a.delete()
+        Professional.objects.filter(pk=b.pk).delete()
+        self.assertEqual(list(ResumeFile.objects.values_list('ref_count', flat=True)), [0, 0])
+        # Files stay until garbage collection.
+        self.assertEqual(len(self._files()), 2)
+
+    def test_garbage_collection(self):
+        """Test unreferenced files are deleted after the grace period and referenced ones are kept"""
+        import os
+        from .storage import collect_garbage
+        kept = Professional.objects.create(full_name="A", email="a@example.com", source="direct", resume=self._resume(b"%PDF kept"))
+        Professional.objects.create(full_name="B", email="b@example.com", source="direct", resume=self._resume(b"%PDF gone")).delete()
+        # A file from before this storage that a row still points to, and a stray one.
+        for name in ('legacy.pdf', 'stray.pdf'):
+            with open(os.path.join(self.media_root.name, 'resumes', name), 'wb') as f:
+                f.write(b"%PDF old")
+            os.utime(f.name, (time.time() - 60, time.time() - 60))
+        Professional.objects.create(full_name="C", email="c@example.com", source="direct", resume='resumes/legacy.pdf')
+
+        self.assertEqual(collect_garbage(grace=3600)['files'], 0)
+        self.assertEqual(collect_garbage(grace=0, dry_run=True)['files'], 2)
+        self.assertEqual(len(self._files()), 4)
+
+        self.assertEqual(collect_garbage(grace=0), {'files': 2, 'bytes': len(b"%PDF gone") + len(b"%PDF old"), 'recounted': 0})
+        self.assertEqual(self._files(), sorted([kept.resume.name, 'resumes/legacy.pdf']))
+
+    def test_drifted_count_never_deletes_a_file_in_use(self):
+        """Test garbage collection corrects a zero count that rows still reference instead of deleting the file"""
+        from django.core.management import call_command
+        from .models import ResumeFile
+        from .storage import collect_garbage
+        a = Professional.objects.create(full_name="A", email="a@example.com", source="direct", resume=self._resume())
+        ResumeFile.objects.update(ref_count=0)
+
+        self.assertEqual(collect_garbage(grace=0), {'files': 0, 'bytes': 0, 'recounted': 1})
+        self.assertEqual(self._refs(a), 1)
+
+        ResumeFile.objects.update(ref_count=5)
+        out = io.StringIO()
+        call_command('collect_resume_files', '--recount', '--grace', '0', stdout=out)
+        self.assertIn("Corrected 1 reference counts", out.getvalue())
+        self.assertEqual(self._refs(a), 1)
+        self.assertEqual(len(self._files()), 1)
@@ -0,0 +1,352 @@
+"""
+Upsert helpers shared by the single and bulk professional endpoints.
+
+Professionals are keyed by email when one is provided, otherwise by phone,
+compared in canonical form (``email_normalized`` and ``phone_e164``, see
+``normalize.py``) so differently formatted copies of a key match one row.
+``upsert_professional`` handles one record with ``update_or_create``;
+``bulk_upsert_professionals`` handles a whole batch with a few set-based
+queries instead of a SELECT plus INSERT/UPDATE per row.
+"""
+
+import copy
+import heapq
+import json
+import logging
+
+from django.core.exceptions import ValidationError as ModelValidationError
+from django.db import IntegrityError, connection, transaction
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from .conf import get_setting
+from .models import Professional
+from .normalize import normalized_keys
+from .parsers import InvalidLine
+from .serializers import BulkProfessionalSerializer
+
+logger = logging.getLogger(__name__)
+
+# Keep IN (...) lists and bulk statements under SQLite's 999 bound-parameter limit.
+LOOKUP_BATCH_SIZE = 900
+WRITE_BATCH_SIZE = 500
+
+UPSERT_FIELDS = ['full_name', 'email', 'company_name', 'job_title', 'phone', 'source']
+# Canonical key columns and the field each is derived from.
+UNIQUE_KEYS = {'email_normalized': 'email', 'phone_e164': 'phone'}
+
+
+def upsert_professional(validated_data):
+    """
+    Upsert a professional using email as primary key, phone as fallback.
+
+    Args:
+        validated_data: Validated serializer data for a single professional
+
+    Returns:
+        tuple: (professional, created)
+
+    Raises:
+        ValueError: If neither email nor phone is provided
+        django.core.exceptions.ValidationError: If the email or phone belongs
+            to another professional (a duplicate the 0007 backfill left
+            without a key, matched here by its other key)
+    """
+    keys = normalized_keys(validated_data)
+
+    for key in UNIQUE_KEYS:
+        if keys[key]:
+            try:
+                return Professional.objects.update_or_create(**{key: keys[key]}, defaults=validated_data)
+            except IntegrityError as e:
+                for conflict, field in UNIQUE_KEYS.items():
+                    if conflict in str(e):
+                        raise ModelValidationError({field: _conflict_message(field)}) from e
+                raise
+    raise ValueError("Either email or phone must be provided.")
+
+
+def bulk_upsert_professionals(records):
+    """
+    Validate and upsert a batch of raw professional records.
+
+    See ``bulk_upsert_indexed`` for details; failures are reported against
+    each record's position in ``records``. Failures are logged as one
+    warning for the batch.
+    """
+    records = list(records)
+    success, failed = bulk_upsert_indexed(enumerate(records))
+    if failed:
+        logger.warning(
+            "Bulk upsert: %d of %d records failed; first at index %d: %s",
+            len(failed), len(records), failed[0]['index'], failed[0]['reason'],
+        )
+    return success, failed
+
+
+def bulk_upsert_indexed(indexed_records):
+    """
+    Validate and upsert a batch of ``(index, record)`` pairs.
+
+    Existing rows are fetched with batched ``IN`` lookups on the normalized
+    email and phone, records are applied in order in memory (so repeated keys
+    inside the batch merge exactly as sequential upserts would) and the result
+    is written with ``bulk_create`` (``ON CONFLICT`` updates where the backend
+    supports them, ``bulk_update`` otherwise). Must be called inside a
+    transaction.
+
+    Args:
+        indexed_records: Iterable of (index, raw record dict) pairs; the index
+            is what failures are reported against
+
+    Returns:
+        tuple: (success, failed) where ``success`` holds one Professional per
+        upserted record in input order, as it looked after that record was
+        applied, and ``failed`` holds ``{"index", "record", "reason"}`` dicts
+        sorted by index.
+    """
+    invalid = []
+    valid = []
+    # One serializer validates every record, as ListSerializer does, so the
+    # field set is built once per batch instead of once per row.
+    serializer = BulkProfessionalSerializer()
+
+    for index, record in indexed_records:
+        try:
+            valid.append((index, record, serializer.run_validation(record)))
+        except ValidationError as e:
+            invalid.append(_failure(index, record, e.detail))
+
+    try:
+        with transaction.atomic():
+            success, failed = _upsert_set_based(valid)
+    except IntegrityError:
+        # Rows swapping keys inside one batch can trip a unique constraint
+        # mid-statement even though the sequential outcome is valid.
+        success, failed = _upsert_sequential(valid)
+
+    failed = sorted(invalid + failed, key=lambda failure: failure['index'])
+    return success, failed
+
+
+def ingest_records(records, chunk_size):
+    """
+    Upsert a stream of records in chunks, committing each chunk on its own.
+
+    Only one chunk is held in memory at a time and the write lock is released
+    between chunks, so long imports don't block readers. Records that could
+    not be decoded are passed as ``InvalidLine`` objects and reported as
+    failures without reaching the database.
+
+    Args:
+        records: Iterable of raw record dicts or ``InvalidLine`` objects
+        chunk_size: Number of records upserted per transaction
+
+    Returns:
+        dict: ``{"summary": {...}, "failed": [...]}`` with counts of records
+        received, succeeded and failed and the number of chunks committed.
+        ``failed`` lists only the ``INGEST_MAX_FAILURES`` failures with the
+        lowest indexes, each record cut to ``INGEST_FAILED_RECORD_MAX_CHARS``
+        characters of JSON; ``summary["failed"]`` counts them all.
+    """
+    max_failures = get_setting('INGEST_MAX_FAILURES')
+    max_chars = get_setting('INGEST_FAILED_RECORD_MAX_CHARS')
+    summary = {"received": 0, "succeeded": 0, "failed": 0, "chunks": 0}
+    # Max-heap on index (negated): invalid lines are reported as they are
+    # read but chunk failures only at flush, so arrival order is not index
+    # order.
+    kept = []
+    chunk = []
+
+    def report(failures):
+        summary["failed"] += len(failures)
+        for failure in failures:
+            if len(kept) < max_failures:
+                heapq.heappush(kept, (-failure['index'], _kept(failure, max_chars)))
+            elif kept and failure['index'] < -kept[0][0]:
+                heapq.heapreplace(kept, (-failure['index'], _kept(failure, max_chars)))
+
+    def flush():
+        with transaction.atomic():
+            success, chunk_failed = bulk_upsert_indexed(chunk)
+        summary["succeeded"] += len(success)
+        summary["chunks"] += 1
+        report(chunk_failed)
+        chunk.clear()
+
+    for index, record in enumerate(records):
+        summary["received"] += 1
+        if isinstance(record, InvalidLine):
+            report([_failure(index, record.text, f"Invalid JSON: {record.error}")])
+            continue
+        chunk.append((index, record))
+        if len(chunk) >= chunk_size:
+            flush()
+
+    if chunk:
+        flush()
+
+    if summary["failed"]:
+        logger.warning("NDJSON ingest: %d of %d records failed", summary["failed"], summary["received"])
+    failed = [failure for _, failure in sorted(kept, reverse=True)]
+    return {"summary": summary, "failed": failed}
+
+
+def _upsert_set_based(valid):
+    keyed = [(index, record, data, normalized_keys(data)) for index, record, data in valid]
+    by_key = {key: {} for key in UNIQUE_KEYS}
+    for professional in _fetch_existing(keyed):
+        _index(professional, by_key)
+
+    created = []
+    updated = {}
+    applied = []
+    failed = []
+
+    for index, record, data, keys in keyed:
+        key = 'email_normalized' if keys['email_normalized'] else 'phone_e164'
+        professional = by_key[key].get(keys[key])
+
+        conflict = _find_conflict(professional, keys, by_key)
+        if conflict:
+            failed.append(_failure(index, record, conflict))
+            continue
+
+        if professional is None:
+            professional = Professional(**data)
+            created.append(professional)
+        else:
+            _unindex(professional, by_key)
+            for field, value in data.items():
+                setattr(professional, field, value)
+            if professional.pk is not None:
+                updated[professional.pk] = professional
+        # Refresh the keys now so later records in the batch can match them.
+        professional.normalize_keys()
+        _index(professional, by_key)
+        applied.append((professional, copy.copy(professional)))
+
+    # Updates go first so new rows can take keys released by existing ones.
+    _write_updates(list(updated.values()))
+    Professional.objects.bulk_create(created, batch_size=WRITE_BATCH_SIZE)
+
+    success = []
+    for professional, snapshot in applied:
+        if snapshot.pk is None:
+            snapshot.pk = professional.pk
+            snapshot.created_at = professional.created_at
+            snapshot._state.adding = False
+        snapshot.updated_at = professional.updated_at
+        success.append(snapshot)
+
+    return success, failed
+
+
+def _write_updates(professionals):
+    """
+    Write changed rows back, as an ``INSERT ... ON CONFLICT (id) DO UPDATE``
+    where the backend supports it (much cheaper to build than the CASE
+    expressions of ``bulk_update``).
+    """
+    if not professionals:
+        return
+
+    if connection.features.supports_update_conflicts_with_target:
+        Professional.objects.bulk_create(
+            professionals,
+            batch_size=WRITE_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=['id'],
+            update_fields=UPSERT_FIELDS + ['updated_at'],
+        )
+    else:
+        now = timezone.now()
+        for professional in professionals:
+            professional.updated_at = now
+        Professional.objects.bulk_update(
+            professionals, UPSERT_FIELDS + ['updated_at'], batch_size=WRITE_BATCH_SIZE
+        )
+
+
+def _upsert_sequential(valid):
+    success = []
+    failed = []
+
+    for index, record, data in valid:
+        try:
+            professional, _ = upsert_professional(data)
+        except ModelValidationError as e:
+            failed.append(_failure(index, record, ' '.join(e.messages)))
+            continue
+        except Exception as e:
+            failed.append(_failure(index, record, str(e)))
+            continue
+        success.append(professional)
+
+    return success, failed
+
+
+def _fetch_existing(keyed):
+    """
+    Load every existing row that shares a normalized email or phone with the batch.
+    """
+    found = {}
+
+    for key in UNIQUE_KEYS:
+        values = list({keys[key] for _, _, _, keys in keyed if keys[key]})
+        for start in range(0, len(values), LOOKUP_BATCH_SIZE):
+            chunk = values[start:start + LOOKUP_BATCH_SIZE]
+            for professional in Professional.objects.filter(**{f'{key}__in': chunk}):
+                found.setdefault(professional.pk, professional)
+
+    return found.values()
+
+
+def _find_conflict(professional, keys, by_key):
+    for key, field in UNIQUE_KEYS.items():
+        value = keys[key]
+        owner = by_key[key].get(value) if value else None
+        if owner is not None and owner is not professional:
+            return _conflict_message(field)
+    return None
+
+
+def _conflict_message(field):
+    return f"Professional with this {field} already exists."
+
+
+def _index(professional, by_key):
+    for key in UNIQUE_KEYS:
+        value = getattr(professional, key)
+        if value:
+            by_key[key][value] = professional
+
+
+def _unindex(professional, by_key):
+    for key in UNIQUE_KEYS:
+        value = getattr(professional, key)
+        if value and by_key[key].get(value) is professional:
+            del by_key[key][value]
+
+
+def _failure(index, record, reason):
+    return {
+        "index": index,
+        "record": record,
+        "reason": reason
+    }
+
+
+def _kept(failure, max_chars):
+    return {**failure, "record": _truncated(failure["record"], max_chars)}
+
+
+def _truncated(record, max_chars):
+    """
+    Return ``record`` as is, or its first ``max_chars`` characters of JSON
+    (of the raw line for undecodable ones) when it is longer.
+    """
+    text = record if isinstance(record, str) else json.dumps(record, default=str)
+    if len(text) <= max_chars:
+        return record
+    return text[:max_chars] + '...'
@@ -1,12 +1,32 @@
 from django.urls import path
 from .views import (
+    AsyncParseResumeView,
+    AsyncProfessionalListView,
     ProfessionalListCreateView,
     ProfessionalBulkUpsertView,
-    ParseResumeWithGPTView
+    ProfessionalExportView,
+    ProfessionalListCacheStatsView,
+    MetricsView,
+    ProfessionalSearchView,
+    DuplicateCandidateView,
+    ParseResumeWithGPTView,
+    ParseResumeBatchView,
+    ParseResumeCacheStatsView,
+    ParseJobDetailView,
 )
 
 urlpatterns = [
     path('professionals/', ProfessionalListCreateView.as_view(), name='professional-list-create'),
     path('professionals/bulk', ProfessionalBulkUpsertView.as_view(), name='professional-bulk-upsert'),
+    path('professionals/search', ProfessionalSearchView.as_view(), name='professional-search'),
+    path('professionals/duplicates', DuplicateCandidateView.as_view(), name='professional-duplicates'),
+    path('professionals/cache', ProfessionalListCacheStatsView.as_view(), name='professional-list-cache'),
+    path('professionals/async', AsyncProfessionalListView.as_view(), name='professional-list-async'),
+    path('professionals/async/parse-resume', AsyncParseResumeView.as_view(), name='parse-resume-gpt-async'),
+    path('professionals/export', ProfessionalExportView.as_view(), name='professional-export'),
     path('professionals/parse-resume', ParseResumeWithGPTView.as_view(), name='parse-resume-gpt'),
+    path('professionals/parse-resume/batch', ParseResumeBatchView.as_view(), name='parse-resume-batch'),
+    path('professionals/parse-resume/cache', ParseResumeCacheStatsView.as_view(), name='parse-resume-cache'),
+    path('professionals/parse-jobs/<uuid:job_id>', ParseJobDetailView.as_view(), name='parse-job-detail'),
+    path('metrics', MetricsView.as_view(), name='metrics'),
 ]
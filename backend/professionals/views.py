@@ -1,17 +1,55 @@
+import csv
+import json
+import logging
+import time
+from types import GeneratorType
+from asgiref.sync import sync_to_async
 from rest_framework import generics, status
+from rest_framework.exceptions import APIException, NotFound
 from rest_framework.views import APIView
+from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.parsers import MultiPartParser, FormParser, JSONParser
+from rest_framework.settings import api_settings
+from django.core.exceptions import ValidationError as ModelValidationError
 from django.db import transaction
-from django.db.models import Q
-from .models import Professional
-from .serializers import ProfessionalSerializer, BulkProfessionalSerializer
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.urls import reverse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from .batch_parse import BatchError, collect_batch_files, parse_batch, summarize
+from .jobs import QueueFull, enqueue_parse_job
+from .metrics import CONTENT_TYPE_LATEST, render_metrics
+from . import list_cache, resume_cache
+from .conditional import alist_validators, list_validators, not_modified, set_validators
+from .conf import get_setting
+from .dedup import DedupInProgress, find_duplicates
+from .models import Professional, ParseJob, ParsedResume, DuplicateCandidate, DedupRun
+from .pagination import KeysetPagination, PaginationError
+from .parsers import NDJSONParser
+from .readers import FieldSelectionError, ProfessionalReader, parse_fields
+from .resume_cache import aparse_resume_cached, parse_resume_cached
+from .search import search_professionals
+from .serializers import (
+    ProfessionalSerializer, ParseJobSerializer, DuplicateCandidateSerializer, DedupRunSerializer
+)
+from .upsert import upsert_professional, bulk_upsert_professionals, ingest_records
+
+logger = logging.getLogger(__name__)
 
 
 class ProfessionalListCreateView(APIView):
     """
     GET /api/professionals/ - List all professionals (with optional source filter)
     POST /api/professionals/ - Upsert a professional using email or phone as unique key
+
+    GET is paginated by cursor when ``limit`` or ``cursor`` is passed. Every
+    GET carries ``ETag`` and ``Last-Modified`` and answers a matching
+    ``If-None-Match`` or ``If-Modified-Since`` with 304 before serializing.
+    Rows are serialized by ``ProfessionalReader`` and ``fields`` picks the
+    columns returned. Serialized pages are served from the list cache (``list_cache.py``) until a
+    write invalidates them; ``X-Cache`` says which.
     """
     parser_classes = [JSONParser, MultiPartParser, FormParser]
 
@@ -25,8 +63,47 @@ class ProfessionalListCreateView(APIView):
         if source:
             queryset = queryset.filter(source=source)
 
-        serializer = ProfessionalSerializer(queryset, many=True)
-        return Response(serializer.data)
+        try:
+            reader = ProfessionalReader(parse_fields(request.query_params.get('fields')))
+        except FieldSelectionError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        key = list_cache.entry_key(request, source) if list_cache.enabled() else None
+        entry = list_cache.get(key) if key else None
+        if entry is not None:
+            data, etag, last_modified = entry
+            response = not_modified(request, etag, last_modified) or set_validators(
+                Response(data), etag, last_modified
+            )
+            response['X-Cache'] = list_cache.HIT
+            return response
+
+        etag, last_modified = list_validators(queryset, request)
+        unchanged = not_modified(request, etag, last_modified)
+        if unchanged is not None:
+            return unchanged
+
+        if not KeysetPagination.is_requested(request):
+            return self._cacheable(reader.rows(queryset), key, etag, last_modified)
+
+        paginator = KeysetPagination()
+        try:
+            page = paginator.paginate_queryset(reader.values(queryset), request, cursor_key=reader.cursor_key)
+        except PaginationError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        results = [reader.to_representation(row) for row in page]
+        return self._cacheable(paginator.get_response_data(results), key, etag, last_modified)
+
+    def _cacheable(self, data, key, etag, last_modified):
+        """
+        Store serialized list data in the list cache and wrap it in a response.
+        """
+        response = set_validators(Response(data), etag, last_modified)
+        if key:
+            list_cache.store(key, data, etag, last_modified)
+            response['X-Cache'] = list_cache.MISS
+        return response
 
     def post(self, request):
         """
@@ -37,27 +114,8 @@ class ProfessionalListCreateView(APIView):
         if not serializer.is_valid():
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-        validated_data = serializer.validated_data
-        email = validated_data.get('email')
-        phone = validated_data.get('phone')
-
         try:
-            # Upsert logic: use email as primary unique key, fallback to phone
-            if email:
-                professional, created = Professional.objects.update_or_create(
-                    email=email,
-                    defaults=validated_data
-                )
-            elif phone:
-                professional, created = Professional.objects.update_or_create(
-                    phone=phone,
-                    defaults=validated_data
-                )
-            else:
-                return Response(
-                    {"error": "Either email or phone must be provided."},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
+            professional, created = upsert_professional(serializer.validated_data)
 
             response_serializer = ProfessionalSerializer(professional)
             return Response(
@@ -65,6 +123,8 @@ class ProfessionalListCreateView(APIView):
                 status=status.HTTP_201_CREATED if created else status.HTTP_200_OK
             )
 
+        except ModelValidationError as e:
+            return Response(e.message_dict, status=status.HTTP_400_BAD_REQUEST)
         except Exception as e:
             return Response(
                 {"error": str(e)},
@@ -78,75 +138,229 @@ class ProfessionalBulkUpsertView(APIView):
 
     Accepts a list of professional records.
     Upserts using email as unique key (if provided), otherwise phone.
+    Existing rows are matched with batched lookups and written with bulk
+    queries, so the query count does not grow per record.
     Returns success and failed records.
+
+    With ``Content-Type: application/x-ndjson`` (one record per line) the
+    body is parsed incrementally and upserted in chunks of ``?chunk_size=``
+    records (default 1000), each in its own transaction. The response is a
+    summary plus the failed records instead of every upserted row.
     """
+    parser_classes = [JSONParser, NDJSONParser, MultiPartParser, FormParser]
+    default_chunk_size = 1000
+    max_chunk_size = 10000
 
     def post(self, request):
+        if request.content_type.startswith(NDJSONParser.media_type):
+            return self._ingest_ndjson(request)
+
         if not isinstance(request.data, list):
             return Response(
                 {"error": "Expected a list of professional records."},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        success = []
-        failed = []
-
         with transaction.atomic():
-            for index, record in enumerate(request.data):
-                serializer = BulkProfessionalSerializer(data=record)
-
-                if not serializer.is_valid():
-                    error_msg = {
-                        "index": index,
-                        "record": record,
-                        "reason": serializer.errors
-                    }
-                    failed.append(error_msg)
-                    print(f"[BULK UPLOAD] Failed row {index}: {error_msg}")
-                    continue
-
-                validated_data = serializer.validated_data
-                email = validated_data.get('email')
-                phone = validated_data.get('phone')
-
-                try:
-                    # Upsert logic: use email as primary unique key, fallback to phone
-                    if email:
-                        professional, created = Professional.objects.update_or_create(
-                            email=email,
-                            defaults=validated_data
-                        )
-                    elif phone:
-                        professional, created = Professional.objects.update_or_create(
-                            phone=phone,
-                            defaults=validated_data
-                        )
-                    else:
-                        error_msg = {
-                            "index": index,
-                            "record": record,
-                            "reason": "Either email or phone must be provided."
-                        }
-                        failed.append(error_msg)
-                        print(f"[BULK UPLOAD] Failed row {index}: {error_msg}")
-                        continue
-
-                    success.append(ProfessionalSerializer(professional).data)
-
-                except Exception as e:
-                    error_msg = {
-                        "index": index,
-                        "record": record,
-                        "reason": str(e)
-                    }
-                    failed.append(error_msg)
-                    print(f"[BULK UPLOAD] Failed row {index}: {error_msg}")
+            professionals, failed = bulk_upsert_professionals(request.data)
+
+        success = [ProfessionalSerializer(professional).data for professional in professionals]
 
         return Response({
             "success": success,
             "failed": failed
         }, status=status.HTTP_200_OK)
 
+    def _ingest_ndjson(self, request):
+        try:
+            chunk_size = int(request.query_params.get('chunk_size', self.default_chunk_size))
+        except ValueError:
+            chunk_size = 0
+        if not 1 <= chunk_size <= self.max_chunk_size:
+            return Response(
+                {"error": f"chunk_size must be between 1 and {self.max_chunk_size}."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        records = request.data if isinstance(request.data, GeneratorType) else []
+        return Response(ingest_records(records, chunk_size), status=status.HTTP_200_OK)
+
+
+class ProfessionalSearchView(APIView):
+    """
+    GET /api/professionals/search?q= - Full-text search by name, company, title or email
+
+    Every term is matched as a prefix and results are ranked by relevance.
+    Optional ``source`` filter and ``limit`` (default 20, max 100).
+    """
+    default_limit = 20
+    max_limit = 100
+
+    def get(self, request):
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            return Response({
+                "error": "Missing query",
+                "message": "Please pass search terms with the 'q' parameter"
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            limit = int(request.query_params.get('limit', self.default_limit))
+        except ValueError:
+            limit = 0
+        if not 1 <= limit <= self.max_limit:
+            return Response({
+                "error": "Invalid limit",
+                "message": f"limit must be between 1 and {self.max_limit}"
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        results = search_professionals(query, source=request.query_params.get('source'), limit=limit)
+        return Response({
+            "query": query,
+            "count": len(results),
+            "results": ProfessionalSerializer(results, many=True).data
+        })
+
+
+class DuplicateCandidateView(APIView):
+    """
+    GET /api/professionals/duplicates - Likely duplicate pairs, highest score first
+    POST /api/professionals/duplicates - Run duplicate detection now
+
+    GET takes optional ``status`` (default pending), ``min_score`` and
+    ``limit`` (default 50, max 500). POST compares only rows changed since
+    the last run unless ``?full=1``; the nightly ``find_duplicates`` command
+    does the same. Only one run goes at a time: POST returns 409 while one
+    is in progress. Full runs over large tables belong in the command,
+    which does not tie up a web worker.
+    """
+    default_limit = 50
+    max_limit = 500
+
+    def get(self, request):
+        try:
+            limit = int(request.query_params.get('limit', self.default_limit))
+        except ValueError:
+            limit = 0
+        if not 1 <= limit <= self.max_limit:
+            return Response({
+                "error": "Invalid limit",
+                "message": f"limit must be between 1 and {self.max_limit}"
+            }, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            min_score = int(request.query_params.get('min_score', 0))
+        except ValueError:
+            return Response({
+                "error": "Invalid min_score",
+                "message": "min_score must be a whole number"
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+        candidates = (
+            DuplicateCandidate.objects
+            .filter(status=request.query_params.get('status', DuplicateCandidate.PENDING), score__gte=min_score)
+            .select_related('professional_a', 'professional_b')
+            .order_by('-score', 'id')[:limit]
+        )
+        last_run = DedupRun.objects.filter(finished_at__isnull=False).order_by('-started_at').first()
+        results = DuplicateCandidateSerializer(candidates, many=True).data
+        return Response({
+            "count": len(results),
+            "results": results,
+            "last_run": DedupRunSerializer(last_run).data if last_run else None
+        })
+
+    def post(self, request):
+        full = request.query_params.get('full') in ('1', 'true')
+        try:
+            run = find_duplicates(full=full)
+        except DedupInProgress as e:
+            return Response({
+                "error": "Duplicate detection in progress",
+                "message": f"{str(e)} Retry once it has finished."
+            }, status=status.HTTP_409_CONFLICT)
+        return Response(DedupRunSerializer(run).data, status=status.HTTP_200_OK)
+
+
+class ProfessionalExportView(View):
+    """
+    GET /api/professionals/export - Stream every professional as NDJSON or CSV
+
+    Query params: ``format=ndjson|csv`` (default ndjson), optional ``source``
+    and ``fields``. Rows are read by ``ProfessionalReader.iter_rows()`` and
+    written as they arrive, so memory stays flat regardless of table size.
+    This is a plain Django view because DRF reserves the ``format`` query
+    parameter for renderer selection.
+    """
+    chunk_size = 2000
+    buffer_size = 64 * 1024
+    content_types = {
+        'ndjson': 'application/x-ndjson',
+        'csv': 'text/csv',
+    }
+
+    def get(self, request):
+        export_format = request.GET.get('format', 'ndjson')
+        if export_format not in self.content_types:
+            return JsonResponse({
+                "error": "Invalid format",
+                "message": "format must be one of: ndjson, csv"
+            }, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            reader = ProfessionalReader(parse_fields(request.GET.get('fields')))
+        except FieldSelectionError as e:
+            return JsonResponse({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        queryset = Professional.objects.order_by('id')
+        source = request.GET.get('source')
+        if source:
+            queryset = queryset.filter(source=source)
+
+        rows = reader.iter_rows(queryset, chunk_size=self.chunk_size)
+        lines = self._csv_lines(rows, reader.fields) if export_format == 'csv' else self._ndjson_lines(rows)
+
+        response = StreamingHttpResponse(
+            self._buffered(lines), content_type=self.content_types[export_format]
+        )
+        response['Content-Disposition'] = f'attachment; filename="professionals.{export_format}"'
+        return response
+
+    def _ndjson_lines(self, records):
+        for record in records:
+            yield json.dumps(record) + '\n'
+
+    def _csv_lines(self, records, fields):
+        line = _LineBuffer()
+        writer = csv.writer(line)
+        yield writer.writerow(fields)
+        for record in records:
+            yield writer.writerow(record.values())
+
+    def _buffered(self, lines):
+        """
+        Group lines into ~64KB writes instead of one write per row.
+        """
+        buffer = []
+        size = 0
+        for line in lines:
+            buffer.append(line)
+            size += len(line)
+            if size >= self.buffer_size:
+                yield ''.join(buffer)
+                buffer = []
+                size = 0
+        if buffer:
+            yield ''.join(buffer)
+
+
+class _LineBuffer:
+    """
+    File-like object whose ``write`` returns the line, so ``csv.writer``
+    output can be streamed without an intermediate buffer.
+    """
+
+    def write(self, value):
+        return value
+
 
 class ParseResumeWithGPTView(APIView):
     """
@@ -154,6 +368,9 @@ class ParseResumeWithGPTView(APIView):
 
     Accepts a PDF file upload and returns extracted professional information.
     Requires OPENAI_API_KEY environment variable to be set.
+
+    With ``?async=1`` the parse is queued for the local worker pool and the
+    response is a job id to poll at ``parse-jobs/<job_id>``.
     """
     parser_classes = [MultiPartParser, FormParser]
 
@@ -161,60 +378,353 @@ class ParseResumeWithGPTView(APIView):
         """
         Parse resume using GPT-4 and return extracted fields with confidence scores.
         """
-        from .gpt_parser import parse_resume_with_gpt, is_gpt_parsing_available
+        resume_file, error = _resume_upload(request)
+        if error:
+            return Response(*error)
 
-        # Check if GPT parsing is available
-        if not is_gpt_parsing_available():
-            return Response({
-                "error": "GPT-based resume parsing is not available",
-                "message": "OpenAI API key is not configured. Please set the OPENAI_API_KEY environment variable to enable this feature.",
-                "available": False
-            }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
-
-        # Check if resume file was provided
-        resume_file = request.FILES.get('resume')
-        if not resume_file:
-            return Response({
-                "error": "No resume file provided",
-                "message": "Please upload a PDF file with the field name 'resume'"
-            }, status=status.HTTP_400_BAD_REQUEST)
+        if request.query_params.get('async') in ('1', 'true'):
+            payload, status_code, headers = _enqueue(resume_file)
+            return _with_headers(Response(payload, status=status_code), headers)
 
-        # Validate file type
-        if not resume_file.name.lower().endswith('.pdf'):
+        try:
+            # Parse the resume with GPT, reusing the result for a PDF seen before
+            result, cache = parse_resume_cached(resume_file)
+        except Exception as e:
+            return Response(*_parse_failure(e))
+        return Response(*_parse_success(result, cache))
+
+
+def _resume_upload(request):
+    """
+    Validate a parse request: a PDF under 10MB in ``resume``.
+
+    The OpenAI key is not checked here: local extraction answers many
+    resumes without the LLM, and the parser reports a missing key only when
+    it needs it.
+
+    Returns:
+        tuple: (resume file, None), or (None, (error payload, status))
+    """
+    # Check if resume file was provided
+    resume_file = request.FILES.get('resume')
+    if not resume_file:
+        return None, ({
+            "error": "No resume file provided",
+            "message": "Please upload a PDF file with the field name 'resume'"
+        }, status.HTTP_400_BAD_REQUEST)
+
+    # Validate file type
+    if not resume_file.name.lower().endswith('.pdf'):
+        return None, ({
+            "error": "Invalid file type",
+            "message": "Only PDF files are supported"
+        }, status.HTTP_400_BAD_REQUEST)
+
+    # Validate file size (10MB limit)
+    if resume_file.size > 10 * 1024 * 1024:
+        return None, ({
+            "error": "File too large",
+            "message": "Resume file must be under 10MB"
+        }, status.HTTP_400_BAD_REQUEST)
+
+    return resume_file, None
+
+
+def _parse_success(result, cache):
+    return {
+        "success": True,
+        "data": result,
+        "cache": cache,
+        "message": "Resume parsed successfully"
+    }, status.HTTP_200_OK
+
+
+def _parse_failure(error):
+    if isinstance(error, ValueError):
+        # API key not configured or parsing error
+        return {
+            "error": "Configuration error",
+            "message": str(error),
+            "available": False
+        }, status.HTTP_503_SERVICE_UNAVAILABLE
+
+    # Other errors (API errors, network issues, etc.)
+    logger.error("Resume parse failed: %s", error, exc_info=error)
+    return {
+        "error": "Parsing failed",
+        "message": f"Failed to parse resume: {str(error)}"
+    }, status.HTTP_500_INTERNAL_SERVER_ERROR
+
+
+def _enqueue(resume_file):
+    """
+    Queue the resume for the local worker pool.
+
+    Returns:
+        tuple: (payload, status, headers) with the job id, or a 429 when the queue is full
+    """
+    try:
+        job = enqueue_parse_job(resume_file)
+    except QueueFull as e:
+        return {
+            "error": "Parse queue is full",
+            "message": f"{str(e)} Please retry shortly."
+        }, status.HTTP_429_TOO_MANY_REQUESTS, {'Retry-After': '5'}
+
+    return {
+        "success": True,
+        "job_id": str(job.pk),
+        "status": job.status,
+        "status_url": reverse('parse-job-detail', kwargs={'job_id': job.pk}),
+        "message": "Resume queued for parsing"
+    }, status.HTTP_202_ACCEPTED, {}
+
+
+def _with_headers(response, headers):
+    for name, value in headers.items():
+        response[name] = value
+    return response
+
+
+class ParseResumeBatchView(APIView):
+    """
+    POST /api/professionals/parse-resume/batch - Parse many resume PDFs at once
+
+    Accepts any number of PDF uploads and/or zip archives of PDFs. The whole
+    batch is validated before parsing starts; files are then parsed
+    concurrently (``?concurrency=`` lowers the configured limit). Returns
+    per-file results in upload order, or with ``?stream=1`` streams one NDJSON
+    line per file as it finishes followed by a summary line.
+    """
+    parser_classes = [MultiPartParser, FormParser]
+
+    def post(self, request):
+        uploads = [upload for field in request.FILES for upload in request.FILES.getlist(field)]
+        try:
+            files = collect_batch_files(uploads)
+        except BatchError as e:
             return Response({
-                "error": "Invalid file type",
-                "message": "Only PDF files are supported"
+                "error": "Invalid batch",
+                "message": str(e),
+                "files": e.errors
             }, status=status.HTTP_400_BAD_REQUEST)
 
-        # Validate file size (10MB limit)
-        if resume_file.size > 10 * 1024 * 1024:
+        concurrency = get_setting('PARSE_BATCH_CONCURRENCY')
+        if 'concurrency' in request.query_params:
+            try:
+                concurrency = min(concurrency, max(1, int(request.query_params['concurrency'])))
+            except ValueError:
+                return Response({
+                    "error": "Invalid concurrency",
+                    "message": "concurrency must be a positive integer"
+                }, status=status.HTTP_400_BAD_REQUEST)
+
+        started = time.perf_counter()
+        results = parse_batch(files, concurrency=concurrency)
+
+        if request.query_params.get('stream') in ('1', 'true'):
+            return StreamingHttpResponse(
+                self._stream(results, started), content_type='application/x-ndjson'
+            )
+
+        results = sorted(results, key=lambda result: result['index'])
+        return Response({
+            "success": True,
+            "summary": summarize(results, started),
+            "results": results
+        }, status=status.HTTP_200_OK)
+
+    def _stream(self, results, started):
+        finished = []
+        for result in results:
+            finished.append(result)
+            yield json.dumps(result) + '\n'
+        yield json.dumps({"summary": summarize(finished, started)}) + '\n'
+
+
+class ParseResumeCacheStatsView(APIView):
+    """
+    GET /api/professionals/parse-resume/cache - Resume parse cache hit rate
+
+    Counters are per process; ``entries`` counts the shared database tier.
+    """
+
+    def get(self, request):
+        return Response({
+            **resume_cache.stats.snapshot(),
+            "entries": ParsedResume.objects.count(),
+        })
+
+
+class MetricsView(View):
+    """
+    GET /api/metrics - Request, latency and database metrics in Prometheus text format
+
+    A plain Django view so DRF content negotiation does not get in the way
+    of the Prometheus content type.
+    """
+
+    def get(self, request):
+        return HttpResponse(render_metrics(), content_type=CONTENT_TYPE_LATEST)
+
+
+class ProfessionalListCacheStatsView(APIView):
+    """
+    GET /api/professionals/cache - List response cache hit rate
+
+    Counters are per process.
+    """
+
+    def get(self, request):
+        return Response({
+            **list_cache.stats.snapshot(),
+            "enabled": list_cache.enabled(),
+        })
+
+
+class ParseJobDetailView(APIView):
+    """
+    GET /api/professionals/parse-jobs/<job_id> - Status and result of an async parse
+    """
+
+    def get(self, request, job_id):
+        try:
+            job = ParseJob.objects.get(pk=job_id)
+        except ParseJob.DoesNotExist:
             return Response({
-                "error": "File too large",
-                "message": "Resume file must be under 10MB"
-            }, status=status.HTTP_400_BAD_REQUEST)
+                "error": "Job not found",
+                "message": f"No parse job with id {job_id}"
+            }, status=status.HTTP_404_NOT_FOUND)
+
+        return Response(ParseJobSerializer(job).data)
+
+
+class AsyncProfessionalListView(View):
+    """
+    GET /api/professionals/async - ``GET /api/professionals/`` as a native async view
+
+    Same ``source`` filter, ``fields``, cursor pagination, renderers,
+    validators and list cache as the sync view, with queries on the async
+    ORM. Served by an ASGI server, a page being read does not hold a worker
+    thread.
+    """
 
+    async def get(self, request):
         try:
-            # Parse the resume with GPT
-            result = parse_resume_with_gpt(resume_file)
+            request = _negotiated(request)
+        except APIException as e:
+            return _rendered(_negotiated_default(request), {"detail": e.detail}, e.status_code)
 
-            return Response({
-                "success": True,
-                "data": result,
-                "message": "Resume parsed successfully"
-            }, status=status.HTTP_200_OK)
+        queryset = Professional.objects.all()
+        source = request.query_params.get('source', None)
+        if source:
+            queryset = queryset.filter(source=source)
 
-        except ValueError as e:
-            # API key not configured or parsing error
-            return Response({
-                "error": "Configuration error",
-                "message": str(e),
-                "available": False
-            }, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+        try:
+            reader = ProfessionalReader(parse_fields(request.query_params.get('fields')))
+        except FieldSelectionError as e:
+            return _rendered(request, {"error": str(e)}, status.HTTP_400_BAD_REQUEST)
+
+        key = await list_cache.aentry_key(request, source) if list_cache.enabled() else None
+        entry = await list_cache.aget(key) if key else None
+        if entry is not None:
+            data, etag, last_modified = entry
+            response = not_modified(request, etag, last_modified) or set_validators(
+                _rendered(request, data), etag, last_modified
+            )
+            response['X-Cache'] = list_cache.HIT
+            return response
+
+        etag, last_modified = await alist_validators(queryset, request)
+        unchanged = not_modified(request, etag, last_modified)
+        if unchanged is not None:
+            return unchanged
+
+        if not KeysetPagination.is_requested(request):
+            data = await reader.arows(queryset)
+        else:
+            paginator = KeysetPagination()
+            try:
+                page = await paginator.apaginate_queryset(reader.values(queryset), request, cursor_key=reader.cursor_key)
+            except PaginationError as e:
+                return _rendered(request, {"error": str(e)}, status.HTTP_400_BAD_REQUEST)
+            data = paginator.get_response_data([reader.to_representation(row) for row in page])
+
+        response = set_validators(_rendered(request, data), etag, last_modified)
+        if key:
+            await list_cache.astore(key, data, etag, last_modified)
+            response['X-Cache'] = list_cache.MISS
+        return response
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class AsyncParseResumeView(View):
+    """
+    POST /api/professionals/async/parse-resume - ``parse-resume`` as a native async view
+
+    Same validation, ``?async=1`` queueing, cache and responses as
+    ``ParseResumeWithGPTView``, but LLM calls go through the async OpenAI
+    client and cache lookups through the async ORM. Under ASGI a parse
+    waiting on the LLM holds no thread, so one worker can keep hundreds in
+    flight (up to ``LLM_ASYNC_MAX_CONCURRENCY`` LLM calls) while serving
+    other requests.
+    """
+
+    async def post(self, request):
+        # Uploads are read by Django's own multipart parser; DRF only renders.
+        # Parsing the body reads (and may spool to disk) the whole upload, so
+        # it runs in a worker thread.
+        rendering = _negotiated_default(request)
+        resume_file, error = await sync_to_async(_resume_upload, thread_sensitive=False)(request)
+        if error:
+            return _rendered(rendering, *error)
 
+        if request.GET.get('async') in ('1', 'true'):
+            payload, status_code, headers = await sync_to_async(_enqueue)(resume_file)
+            return _with_headers(_rendered(rendering, payload, status_code), headers)
+
+        try:
+            result, cache = await aparse_resume_cached(resume_file)
         except Exception as e:
-            # Other errors (API errors, network issues, etc.)
-            print(f"[GPT PARSING ERROR] {str(e)}")
-            return Response({
-                "error": "Parsing failed",
-                "message": f"Failed to parse resume: {str(e)}"
-            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+            return _rendered(rendering, *_parse_failure(e))
+        return _rendered(rendering, *_parse_success(result, cache))
+
+
+def _negotiated(request):
+    """
+    Wrap a plain Django request in a DRF ``Request`` with the renderer picked
+    from ``Accept``/``?format=``, so async views render like the DRF ones.
+
+    Raises:
+        APIException: NotAcceptable or NotFound (unknown ``?format=``)
+    """
+    drf_request = Request(request)
+    renderers = [renderer() for renderer in api_settings.DEFAULT_RENDERER_CLASSES]
+    negotiator = api_settings.DEFAULT_CONTENT_NEGOTIATION_CLASS()
+    try:
+        drf_request.accepted_renderer, drf_request.accepted_media_type = negotiator.select_renderer(
+            drf_request, renderers
+        )
+    except Http404:
+        # As DRF's exception handler turns it into a JSON 404 for the sync views.
+        raise NotFound()
+    return drf_request
+
+
+def _negotiated_default(request):
+    """
+    Wrap a request for the default renderer, as DRF does for errors and uploads.
+    """
+    drf_request = Request(request)
+    drf_request.accepted_renderer = api_settings.DEFAULT_RENDERER_CLASSES[0]()
+    drf_request.accepted_media_type = drf_request.accepted_renderer.media_type
+    return drf_request
+
+
+def _rendered(request, data, status_code=status.HTTP_200_OK):
+    renderer = request.accepted_renderer
+    content = renderer.render(data, request.accepted_media_type, {'request': request})
+    content_type = request.accepted_media_type
+    if renderer.charset:
+        content_type = f'{content_type}; charset={renderer.charset}'
+    return HttpResponse(content, status=status_code, content_type=content_type)
@@ -11,6 +11,13 @@ export interface Professional {
   created_at?: string;
 }
 
+export interface ProfessionalPage {
+  results: Professional[];
+  next: string | null;
+  prev: string | null;
+  limit: number;
+}
+
 export interface BulkUpsertResult {
   success: Professional[];
   failed: { index: number; reason: string }[];
@@ -18,8 +25,30 @@ export interface BulkUpsertResult {
 
 const API_BASE = "http://localhost:8000/api";
 
+interface Validated {
+  etag: string | null;
+  lastModified: string | null;
+  body: unknown;
+}
+
+// Last response per GET URL with its validators, so a poll that finds
+// nothing changed gets a body-less 304 and reuses the previous body.
+const MAX_VALIDATED = 50;
+const validated = new Map<string, Validated>();
+
 async function request<T>(path: string, init?: RequestInit): Promise<T> {
-  const res = await fetch(`${API_BASE}${path}`, init);
+  const url = `${API_BASE}${path}`;
+  const isGet = (init?.method ?? "GET").toUpperCase() === "GET";
+  const cached = isGet ? validated.get(url) : undefined;
+
+  const headers = new Headers(init?.headers);
+  if (cached?.etag) headers.set("If-None-Match", cached.etag);
+  if (cached?.lastModified) headers.set("If-Modified-Since", cached.lastModified);
+
+  const res = await fetch(url, { ...init, headers });
+  if (res.status === 304 && cached) {
+    return cached.body as T;
+  }
   if (!res.ok) {
     let message = `Request failed with ${res.status}`;
     try {
@@ -28,14 +57,54 @@ async function request<T>(path: string, init?: RequestInit): Promise<T> {
     } catch {}
     throw new Error(message);
   }
-  return (await res.json()) as T;
+
+  const body = (await res.json()) as T;
+  if (isGet) {
+    const etag = res.headers.get("ETag");
+    const lastModified = res.headers.get("Last-Modified");
+    validated.delete(url);
+    if (etag || lastModified) {
+      validated.set(url, { etag, lastModified, body });
+      if (validated.size > MAX_VALIDATED) {
+        validated.delete(validated.keys().next().value as string);
+      }
+    }
+  }
+  return body;
 }
 
+// Columns the professionals table shows; the list endpoint skips the rest.
+export const TABLE_FIELDS: (keyof Professional)[] = [
+  "id",
+  "full_name",
+  "email",
+  "phone",
+  "company_name",
+  "job_title",
+  "source",
+  "created_at",
+];
+
 export const ProfessionalsAPI = {
-  list: (source?: SignupSource) => {
-    const q = source ? `?source=${encodeURIComponent(source)}` : "";
+  list: (source?: SignupSource, fields?: (keyof Professional)[]) => {
+    const params = new URLSearchParams();
+    if (source) params.set("source", source);
+    if (fields) params.set("fields", fields.join(","));
+    const q = params.toString() ? `?${params}` : "";
     return request<Professional[]>(`/professionals/${q}`);
   },
+  page: (
+    source?: SignupSource,
+    cursor?: string | null,
+    limit = 50,
+    fields: (keyof Professional)[] = TABLE_FIELDS,
+  ) => {
+    const params = new URLSearchParams({ limit: String(limit) });
+    params.set("fields", fields.join(","));
+    if (source) params.set("source", source);
+    if (cursor) params.set("cursor", cursor);
+    return request<ProfessionalPage>(`/professionals/?${params}`);
+  },
   create: (data: Professional, file?: File) => {
     if (file) {
       const form = new FormData();
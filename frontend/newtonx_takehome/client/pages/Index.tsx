@@ -10,7 +10,7 @@ export default function Index() {
     let mounted = true;
     async function load() {
       try {
-        const list = await ProfessionalsAPI.list();
+        const list = await ProfessionalsAPI.list(undefined, ["id"]);
         if (mounted) {
           setCount(Array.isArray(list) ? list.length : null);
           setPing("ok");
@@ -1,4 +1,4 @@
-import { useQuery } from "@tanstack/react-query";
+import { useInfiniteQuery } from "@tanstack/react-query";
 import {
   Table,
   TableBody,
@@ -25,10 +25,21 @@ import { Link } from "react-router-dom";
 
 export default function ProfessionalsPage() {
   const [source, setSource] = useState<SignupSource | undefined>(undefined);
-  const { data, isLoading, error, refetch } = useQuery({
+  const {
+    data: pages,
+    isLoading,
+    error,
+    refetch,
+    fetchNextPage,
+    hasNextPage,
+    isFetchingNextPage,
+  } = useInfiniteQuery({
     queryKey: ["professionals", source],
-    queryFn: () => ProfessionalsAPI.list(source),
+    queryFn: ({ pageParam }) => ProfessionalsAPI.page(source, pageParam),
+    initialPageParam: null as string | null,
+    getNextPageParam: (lastPage) => lastPage.next,
   });
+  const data = pages?.pages.flatMap((page) => page.results);
 
   return (
     <main className="container py-10">
@@ -116,6 +127,17 @@ export default function ProfessionalsPage() {
               )}
             </TableBody>
           </Table>
+          {hasNextPage && (
+            <div className="flex justify-center border-t p-4">
+              <Button
+                variant="outline"
+                onClick={() => fetchNextPage()}
+                disabled={isFetchingNextPage}
+              >
+                {isFetchingNextPage ? "Loading…" : "Load more"}
+              </Button>
+            </div>
+          )}
         </div>
       )}
     </main>